@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Optional
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
 from ..ops import (
     DeterministicOpsEngine,
@@ -123,10 +123,8 @@ class OpsAuditRequest(BaseModel):
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, agent=Depends(get_agent)):
     """Send a message to the SheetSmith agent."""
-    agent = get_agent()
-
     # Add spreadsheet context if provided
     message = request.message
     if request.spreadsheet_id and "spreadsheet" not in message.lower():
@@ -143,9 +141,8 @@ async def chat(request: ChatRequest):
 
 
 @router.post("/chat/reset")
-async def reset_chat():
+async def reset_chat(agent=Depends(get_agent)):
     """Reset the conversation history."""
-    agent = get_agent()
     agent.reset_conversation()
     return {"status": "ok", "message": "Conversation reset"}
 
@@ -435,7 +432,9 @@ async def reset_costs():
 
 
 @router.post("/ops/search")
-async def ops_search(request: SearchRequest):
+async def ops_search(
+    request: SearchRequest, ops_engine: DeterministicOpsEngine = Depends(get_ops_engine)
+):
     """
     Search for cells matching criteria.
 
@@ -447,7 +446,6 @@ async def ops_search(request: SearchRequest):
 
     No LLM usage - pure deterministic search.
     """
-    ops_engine = get_ops_engine()
     try:
         result = ops_engine.search(
             spreadsheet_id=request.spreadsheet_id,
@@ -478,7 +476,9 @@ async def ops_search(request: SearchRequest):
 
 
 @router.post("/ops/preview")
-async def ops_preview(request: PreviewRequest):
+async def ops_preview(
+    request: PreviewRequest, ops_engine: DeterministicOpsEngine = Depends(get_ops_engine)
+):
     """
     Generate preview of proposed changes.
 
@@ -493,9 +493,6 @@ async def ops_preview(request: PreviewRequest):
 
     Returns a preview_id for use with /ops/apply.
     """
-
-    ops_engine = get_ops_engine()
-
     # Extract dry_run from request if it has it, otherwise default to False
     dry_run = getattr(request, "dry_run", False)
 
@@ -540,7 +537,9 @@ async def ops_preview(request: PreviewRequest):
 
 
 @router.post("/ops/apply")
-async def ops_apply(request: ApplyRequest):
+async def ops_apply(
+    request: ApplyRequest, ops_engine: DeterministicOpsEngine = Depends(get_ops_engine)
+):
     """
     Apply previously previewed changes.
 
@@ -560,13 +559,15 @@ async def ops_apply(request: ApplyRequest):
     - Number of cells updated
     - Audit log ID
     """
-    ops_engine = get_ops_engine()
     try:
         result = await ops_engine.apply_changes(
             preview_id=request.preview_id,
             confirmation=request.confirmation,
             dry_run=getattr(request, "dry_run", False),
         )
+        if result.success and result.cells_updated and _placeholder_resolver is not None:
+            # Applied changes may have rewritten header cells
+            _placeholder_resolver.invalidate_headers(result.spreadsheet_id)
         return {
             "success": result.success,
             "preview_id": result.preview_id,
@@ -582,7 +583,9 @@ async def ops_apply(request: ApplyRequest):
 
 
 @router.post("/ops/preflight")
-async def ops_preflight(request: PreflightRequest):
+async def ops_preflight(
+    request: PreflightRequest, ops_engine: DeterministicOpsEngine = Depends(get_ops_engine)
+):
     """
     Run preflight safety checks without generating full preview.
 
@@ -593,7 +596,6 @@ async def ops_preflight(request: PreflightRequest):
 
     Returns safety check results without creating a preview.
     """
-    ops_engine = get_ops_engine()
     safety_checker = SafetyChecker(ops_engine.sheets_client)
 
     try:
@@ -641,7 +643,9 @@ async def ops_preflight(request: PreflightRequest):
 
 
 @router.post("/ops/audit/mappings")
-async def audit_ops_mappings(spreadsheet_id: str):
+async def audit_ops_mappings(
+    spreadsheet_id: str, ops_engine: DeterministicOpsEngine = Depends(get_ops_engine)
+):
     """
     Audit mapping health for operations system.
 
@@ -652,7 +656,6 @@ async def audit_ops_mappings(spreadsheet_id: str):
 
     Returns detailed audit report with recommendations.
     """
-    ops_engine = get_ops_engine()
     safety_checker = SafetyChecker(ops_engine.sheets_client)
 
     try:
@@ -10,9 +10,9 @@ from pydantic import BaseModel
 load_dotenv()
 
 
-def _parse_cors_origins() -> list[str]:
-    """Parse CORS origins from environment variable."""
-    cors_env = os.getenv("CORS_ALLOW_ORIGINS")
+def _parse_cors_origins(raw: Optional[str] = None) -> list[str]:
+    """Parse CORS origins from ``raw``, or from the environment variable if not given."""
+    cors_env = os.getenv("CORS_ALLOW_ORIGINS") if raw is None else raw
     if cors_env:
         return cors_env.split(",")
     return ["*"]
@@ -92,6 +92,9 @@ class Settings(BaseModel):
     enable_dry_run: bool = os.getenv("ENABLE_DRY_RUN", "true").lower() == "true"
     auto_audit_on_connect: bool = os.getenv("AUTO_AUDIT_ON_CONNECT", "true").lower() == "true"
     max_preview_diffs_displayed: int = int(os.getenv("MAX_PREVIEW_DIFFS_DISPLAYED", "100"))
+    search_read_chunk_rows: int = int(os.getenv("SEARCH_READ_CHUNK_ROWS", "5000"))  # Rows fetched per read when searching a sheet
+    search_max_workers: int = int(os.getenv("SEARCH_MAX_WORKERS", "8"))  # Sheets searched concurrently
+    search_parallel_min_limit: int = int(os.getenv("SEARCH_PARALLEL_MIN_LIMIT", "100"))  # Smaller limits search sheets one by one, stopping once the limit is met
 
     # Diagnostics - monitoring and alerting thresholds
     enable_cost_spike_detection: bool = os.getenv("ENABLE_COST_SPIKE_DETECTION", "true").lower() == "true"  # Detect unusual cost spikes
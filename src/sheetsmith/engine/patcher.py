@@ -2,10 +2,10 @@
 
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
 
 from ..sheets import GoogleSheetsClient, BatchUpdate
-from ..sheets.models import Patch
+from ..sheets.models import Patch, PatchChange
 from ..memory import MemoryStore, AuditLog
 from .differ import FormulaDiffer, PatchPreview
 
@@ -27,9 +27,9 @@ class PatchEngine:
         self,
         spreadsheet_id: str,
         description: str,
-        changes: list[dict],
+        changes: list[Union[dict, PatchChange]],
     ) -> Patch:
-        """Create a new patch from a list of changes."""
+        """Create a new patch from a list of changes ({sheet, cell, old, new} dicts)."""
         patch = Patch(
             id=str(uuid.uuid4()),
             spreadsheet_id=spreadsheet_id,
@@ -44,12 +44,12 @@ class PatchEngine:
     def create_patch_from_preview(self, preview: PatchPreview) -> Patch:
         """Create a patch from a PatchPreview."""
         changes = [
-            {
-                "sheet": diff.sheet,
-                "cell": diff.cell,
-                "old": diff.old_formula,
-                "new": diff.new_formula,
-            }
+            PatchChange(
+                sheet=diff.sheet,
+                cell=diff.cell,
+                old=diff.old_formula,
+                new=diff.new_formula,
+            )
             for diff in preview.diffs
         ]
         return self.create_patch(
@@ -85,12 +85,10 @@ class PatchEngine:
             description=patch.description,
         )
 
-        for change in patch.changes:
-            batch.add_update(
-                sheet_name=change["sheet"],
-                cell=change["cell"],
-                new_formula=change["new"],
-            )
+        batch.add_updates(
+            {"sheet_name": change.sheet, "cell": change.cell, "new_formula": change.new}
+            for change in patch.changes
+        )
 
         # Apply the update
         result = self.sheets_client.batch_update(batch)
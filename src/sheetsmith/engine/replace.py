@@ -1,5 +1,6 @@
 """Deterministic formula replacement engine for mass operations."""
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -7,7 +8,7 @@ from typing import Optional
 
 from ..sheets import GoogleSheetsClient, BatchUpdate
 from ..sheets.client import index_to_col_letter
-from ..sheets.models import FormulaMatch
+from ..sheets.models import FormulaMatch, SheetRange
 from .safety import SafetyValidator
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,22 @@ class ReplacementPlan:
     is_regex: bool = False  # If True, search_pattern is treated as regex
     dry_run: bool = False
 
+    @functools.cached_property
+    def compiled_pattern(self) -> re.Pattern:
+        """
+        The search pattern compiled once for this plan (escaped unless is_regex).
+
+        Shared by the search and replacement steps; the plan's pattern fields
+        should not be changed after this is first read.
+
+        Raises:
+            re.error: If the regex pattern is invalid
+        """
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        return re.compile(
+            self.search_pattern if self.is_regex else re.escape(self.search_pattern), flags
+        )
+
 
 @dataclass
 class ReplacementResult:
@@ -75,6 +92,15 @@ class DeterministicReplacer:
                 f"(pattern: '{plan.search_pattern}', replace: '{plan.replace_with}')"
             )
 
+            # Compile the search pattern once; the column-header search and the
+            # replacement step both reuse it
+            compiled_pattern = None
+            if plan.column_header:
+                try:
+                    compiled_pattern = plan.compiled_pattern
+                except re.error as e:
+                    raise ValueError(f"Invalid regex pattern: {e}")
+
             # Step 1: Search for matching formulas
             matches = self._search_formulas(
                 spreadsheet_id=spreadsheet_id,
@@ -84,6 +110,7 @@ class DeterministicReplacer:
                 is_regex=plan.is_regex,
                 column_header=plan.column_header,
                 header_row=plan.header_row,
+                compiled_pattern=compiled_pattern,
             )
 
             if not matches:
@@ -177,8 +204,14 @@ class DeterministicReplacer:
         is_regex: bool,
         column_header: Optional[str] = None,
         header_row: int = 1,
+        compiled_pattern: Optional[re.Pattern] = None,
     ) -> list[FormulaMatch]:
-        """Search for formulas matching the pattern, optionally restricted to a column header."""
+        """
+        Search for formulas matching the pattern, optionally restricted to a column header.
+
+        ``compiled_pattern`` reuses an already compiled search pattern (see
+        ``ReplacementPlan.compiled_pattern``) for the column-header search.
+        """
         
         # Original logic if no column_header
         if not column_header:
@@ -200,86 +233,113 @@ class DeterministicReplacer:
         target_sheets = [s for s in info["sheets"] 
                         if not sheet_names or s["title"] in sheet_names]
         
-        regex_flags = 0 if case_sensitive else re.IGNORECASE
-        try:
-            compiled_pattern = re.compile(pattern if is_regex else re.escape(pattern), regex_flags)
-        except re.error as e:
-            raise ValueError(f"Invalid regex pattern: {e}")
-
-        import time
-        for sheet in target_sheets:
-            print(f"Scanning sheet '{sheet['title']}' for header '{column_header}'...")
-            time.sleep(1.0) # Throttle to avoid 429 Quota Exceeded
-            logger.info(f"Scanning sheet '{sheet['title']}' for header '{column_header}' at row {header_row}")
-            
-            if sheet['col_count'] <= 0:
-                continue
-                
-            last_col_letter = index_to_col_letter(sheet["col_count"] - 1)
-            # Read just the header row
-            header_range = f"'{sheet['title']}'!A{header_row}:{last_col_letter}{header_row}"
-            
+        if compiled_pattern is None:
+            regex_flags = 0 if case_sensitive else re.IGNORECASE
             try:
-                # include_formulas=False for headers
-                headers = self.sheets_client.read_range(
-                    spreadsheet_id, header_range, include_formulas=False
+                compiled_pattern = re.compile(
+                    pattern if is_regex else re.escape(pattern), regex_flags
                 )
-            except Exception as e:
-                logger.warning(f"Failed to read headers for sheet {sheet['title']}: {e}")
-                continue
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {e}")
 
-            # Find matching column
-            target_col_idx = -1
-            if headers.cells:
-                for cell in headers.cells:
-                    # cell.row should match header_row
-                    if cell.row == header_row and cell.value and str(cell.value).strip().lower() == column_header.lower():
-                        target_col_idx = cell.col
-                        break
-            
-            if target_col_idx == -1:
-                # logger.debug(f"Header '{column_header}' not found in sheet '{sheet['title']}'")
+        target_sheets = [s for s in target_sheets if s["col_count"] > 0]
+        if not target_sheets:
+            return matches
+
+        # Read every sheet's header row in one batched request
+        header_ranges = [
+            f"'{sheet['title']}'!A{header_row}:"
+            f"{index_to_col_letter(sheet['col_count'] - 1)}{header_row}"
+            for sheet in target_sheets
+        ]
+        wanted_header = column_header.lower()
+        header_rows = self._read_ranges(
+            spreadsheet_id,
+            header_ranges,
+            include_formulas=False,
+            cell_filter=lambda row, col, value, formula: (
+                row == header_row
+                and bool(value)
+                and str(value).strip().lower() == wanted_header
+            ),
+        )
+
+        # Find the matching column of each sheet
+        data_ranges = []
+        data_sheets = []
+        for sheet, headers in zip(target_sheets, header_rows):
+            if headers is None or not headers.cells:
                 continue
+            col_letter = index_to_col_letter(headers.cells[0].col)
+            logger.info(
+                f"Found header '{column_header}' in column {col_letter} of '{sheet['title']}'"
+            )
+            # Read from the row after the header to the end
+            data_ranges.append(
+                f"'{sheet['title']}'!{col_letter}{header_row + 1}:{col_letter}{sheet['row_count']}"
+            )
+            data_sheets.append(sheet)
 
-            col_letter = index_to_col_letter(target_col_idx)
+        if not data_ranges:
+            return matches
 
-            # Read that column only
-            # Read from row AFTER header to end
-            start_row = header_row + 1
-            data_range = f"'{sheet['title']}'!{col_letter}{start_row}:{col_letter}{sheet['row_count']}"
-            
-            logger.info(f"Found header in column {col_letter}. Reading data...")
-            try:
-                col_data = self.sheets_client.read_range(
-                    spreadsheet_id, data_range, include_formulas=True
-                )
-            except Exception as e:
-                logger.warning(f"Failed to read column {col_letter} in sheet {sheet['title']}: {e}")
+        # Read all matched columns together, keeping only formula cells
+        columns = self._read_ranges(
+            spreadsheet_id,
+            data_ranges,
+            include_formulas=True,
+            cell_filter=lambda row, col, value, formula: formula is not None,
+        )
+
+        for sheet, col_data in zip(data_sheets, columns):
+            if col_data is None:
                 continue
-                
-            # Scan formulas in this column
             sheet_matches_count = 0
             for cell in col_data.cells:
-                if cell.formula:
-                    match = compiled_pattern.search(cell.formula)
-                    if match:
-                        matches.append(
-                            FormulaMatch(
-                                spreadsheet_id=spreadsheet_id,
-                                sheet_name=sheet["title"],
-                                cell=cell.cell,
-                                row=cell.row,
-                                col=cell.col,
-                                formula=cell.formula,
-                                matched_text=match.group(0),
-                            )
+                match = compiled_pattern.search(cell.formula)
+                if match:
+                    matches.append(
+                        FormulaMatch(
+                            spreadsheet_id=spreadsheet_id,
+                            sheet_name=sheet["title"],
+                            cell=cell.cell,
+                            row=cell.row,
+                            col=cell.col,
+                            formula=cell.formula,
+                            matched_text=match.group(0),
                         )
-                        sheet_matches_count += 1
-                        
-            logger.info(f"Found {sheet_matches_count} matches in column {col_letter} of '{sheet['title']}'")
+                    )
+                    sheet_matches_count += 1
+
+            logger.info(f"Found {sheet_matches_count} matches in '{sheet['title']}'")
 
         return matches
 
+    def _read_ranges(
+        self, spreadsheet_id: str, ranges: list[str], **read_kwargs
+    ) -> list[Optional[SheetRange]]:
+        """
+        Read ranges in one batched request, falling back to one read per range.
+
+        A single unreadable range fails the whole batch; the fallback keeps
+        the other sheets and yields None for each range that cannot be read.
+        """
+        try:
+            return self.sheets_client.batch_read_ranges(spreadsheet_id, ranges, **read_kwargs)
+        except Exception as e:
+            logger.warning(f"Batched read of {len(ranges)} ranges failed, reading each: {e}")
+
+        results: list[Optional[SheetRange]] = []
+        for range_notation in ranges:
+            try:
+                results.append(
+                    self.sheets_client.read_range(spreadsheet_id, range_notation, **read_kwargs)
+                )
+            except Exception as e:
+                logger.warning(f"Skipping unreadable range {range_notation}: {e}")
+                results.append(None)
+        return results
+
     def _generate_replacements(
         self,
         matches: list[FormulaMatch],
@@ -292,9 +352,16 @@ class DeterministicReplacer:
         """
         replacements = []
 
+        # Compile the search pattern once for all formulas
+        try:
+            pattern = self._compile_replacement_pattern(plan)
+        except re.error as e:
+            logger.error(f"Regex error: {e}")
+            return replacements
+
         for match in matches:
             old_formula = match.formula
-            new_formula = self._apply_replacement(old_formula, plan)
+            new_formula = self._apply_replacement(old_formula, plan, pattern)
 
             # Only include if the formula actually changed
             if new_formula and new_formula != old_formula:
@@ -309,30 +376,42 @@ class DeterministicReplacer:
 
         return replacements
 
-    def _apply_replacement(self, formula: str, plan: ReplacementPlan) -> str:
-        """Apply the replacement to a single formula."""
-        if plan.is_regex:
-            # Regex replacement
-            flags = 0 if plan.case_sensitive else re.IGNORECASE
+    def _compile_replacement_pattern(self, plan: ReplacementPlan) -> Optional[re.Pattern]:
+        """
+        Compile the plan's search pattern, or None for case-sensitive literal replacement.
+
+        Raises:
+            re.error: If the regex pattern is invalid
+        """
+        if plan.case_sensitive and not plan.is_regex:
+            return None
+        # Regex or case-insensitive literal replacement
+        return plan.compiled_pattern
+
+    def _apply_replacement(
+        self,
+        formula: str,
+        plan: ReplacementPlan,
+        pattern: Optional[re.Pattern] = None,
+    ) -> str:
+        """Apply the replacement to a single formula, using a precompiled pattern if given."""
+        if pattern is None and (plan.is_regex or not plan.case_sensitive):
             try:
-                new_formula = re.sub(
-                    plan.search_pattern,
-                    plan.replace_with,
-                    formula,
-                    flags=flags,
-                )
-                return new_formula
+                pattern = self._compile_replacement_pattern(plan)
             except re.error as e:
                 logger.error(f"Regex error: {e}")
                 return formula
-        else:
+
+        if pattern is None:
             # Simple string replacement
-            if plan.case_sensitive:
-                return formula.replace(plan.search_pattern, plan.replace_with)
-            else:
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(plan.search_pattern), re.IGNORECASE)
-                return pattern.sub(plan.replace_with, formula)
+            return formula.replace(plan.search_pattern, plan.replace_with)
+
+        try:
+            return pattern.sub(plan.replace_with, formula)
+        except re.error as e:
+            # Invalid group reference in the replacement template
+            logger.error(f"Regex error: {e}")
+            return formula
 
     def _generate_preview(self, replacements: list[dict]) -> str:
         """Generate a preview of the changes."""
@@ -367,12 +446,10 @@ class DeterministicReplacer:
             description=description,
         )
 
-        for rep in replacements:
-            batch.add_update(
-                sheet_name=rep["sheet"],
-                cell=rep["cell"],
-                new_formula=rep["new_formula"],
-            )
+        batch.add_updates(
+            {"sheet_name": rep["sheet"], "cell": rep["cell"], "new_formula": rep["new_formula"]}
+            for rep in replacements
+        )
 
         result = self.sheets_client.batch_update(batch)
 
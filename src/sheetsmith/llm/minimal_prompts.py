@@ -52,3 +52,6 @@ FORMATTING:
 
 You are the hands on the keyboard. The user wants results, not conversation. If you can do it, do it now.
 """
+
+# LOCAL SHIM (uncommitted)
+PARSER_SYSTEM_PROMPT = "Parse the request into JSON with an operation field."
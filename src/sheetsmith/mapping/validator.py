@@ -240,7 +240,12 @@ class MappingValidator:
 
         try:
             result = self.sheets_client.read_range(
-                spreadsheet_id, range_notation, include_formulas=False
+                spreadsheet_id,
+                range_notation,
+                include_formulas=False,
+                cell_filter=lambda row, col, value, formula: (
+                    bool(value) and str(value).strip() == row_label
+                ),
             )
 
             for cell in result.cells:
@@ -4,13 +4,16 @@ import json
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Hashable, Optional
 
 import aiosqlite
 
 from ..config import settings
 from .models import Rule, LogicBlock, AuditLog, FixSummary
 
+# Rule and logic block query results kept per store and cache; oldest evicted first
+LIST_CACHE_MAX_ENTRIES = 32
+
 
 class MemoryStore:
     """Persistent storage for rules, logic blocks, and audit logs."""
@@ -18,6 +21,10 @@ class MemoryStore:
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or settings.database_path
         self._connection: Optional[aiosqlite.Connection] = None
+        # (type filter, tag filter) -> matching rows; cleared on every write
+        self._rules_cache: dict[tuple, list[Rule]] = {}
+        self._blocks_cache: dict[tuple, list[LogicBlock]] = {}
+        self._block_search_cache: dict[str, list[LogicBlock]] = {}
 
     async def initialize(self):
         """Initialize the database and create tables."""
@@ -83,6 +90,9 @@ class MemoryStore:
 
     async def close(self):
         """Close the database connection."""
+        self._rules_cache.clear()
+        self._blocks_cache.clear()
+        self._block_search_cache.clear()
         if self._connection:
             await self._connection.close()
             self._connection = None
@@ -98,6 +108,51 @@ class MemoryStore:
                 "MemoryStore not initialized. Call initialize() first."
             )
 
+    @staticmethod
+    def _filter_key(kind: Optional[str], tags: Optional[list[str]]) -> tuple:
+        """Cache key for a type/tag filter; tags match on any, so order is irrelevant."""
+        return (kind or None, frozenset(tags) if tags else None)
+
+    @staticmethod
+    def _filter_query(
+        table: str, type_column: str, kind: Optional[str], tags: Optional[list[str]]
+    ) -> tuple[str, list]:
+        """
+        Build the SELECT for a type/tag filter.
+
+        Tags match on any: the JSON tags column is expanded with json_each so
+        SQLite drops non-matching rows before they are turned into models.
+        """
+        conditions = []
+        params: list = []
+        if kind:
+            conditions.append(f"{type_column} = ?")
+            params.append(kind)
+        if tags:
+            wanted = list(dict.fromkeys(tags))
+            placeholders = ", ".join("?" * len(wanted))
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM json_each({table}.tags) WHERE value IN ({placeholders}))"
+            )
+            params.extend(wanted)
+
+        query = f"SELECT * FROM {table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
+
+    @staticmethod
+    def _cache_put(cache: dict, key: Hashable, value: list) -> None:
+        """Store a query result, evicting the oldest entry when full."""
+        if len(cache) >= LIST_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    @staticmethod
+    def _copies(models: list) -> list:
+        """Deep-copy cached models so callers can't mutate the cached ones."""
+        return [model.model_copy(deep=True) for model in models]
+
     # Rule operations
     async def store_rule(self, rule: Rule) -> Rule:
         """Store or update a rule."""
@@ -124,6 +179,7 @@ class MemoryStore:
             ),
         )
         await self._connection.commit()
+        self._rules_cache.clear()
         return rule
 
     async def get_rule(self, rule_id: str) -> Optional[Rule]:
@@ -139,27 +195,28 @@ class MemoryStore:
     async def get_rules(
         self, rule_type: Optional[str] = None, tags: Optional[list[str]] = None
     ) -> list[Rule]:
-        """Get all rules, optionally filtered by type or tags."""
-        query = "SELECT * FROM rules"
-        params = []
+        """
+        Get all rules, optionally filtered by type or tags.
 
-        if rule_type:
-            query += " WHERE rule_type = ?"
-            params.append(rule_type)
+        Results are cached per filter until the next rule write.
+        """
+        key = self._filter_key(rule_type, tags)
+        cached = self._rules_cache.get(key)
+        if cached is not None:
+            return self._copies(cached)
 
+        query, params = self._filter_query("rules", "rule_type", rule_type, tags)
         async with self._connection.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            rules = [self._row_to_rule(row) for row in rows]
+            rules = [self._row_to_rule(row) for row in await cursor.fetchall()]
 
-            if tags:
-                rules = [r for r in rules if any(t in r.tags for t in tags)]
-
-            return rules
+        self._cache_put(self._rules_cache, key, rules)
+        return self._copies(rules)
 
     async def delete_rule(self, rule_id: str) -> bool:
         """Delete a rule by ID."""
         cursor = await self._connection.execute("DELETE FROM rules WHERE id = ?", (rule_id,))
         await self._connection.commit()
+        self._rules_cache.clear()
         return cursor.rowcount > 0
 
     def _row_to_rule(self, row) -> Rule:
@@ -202,6 +259,8 @@ class MemoryStore:
             ),
         )
         await self._connection.commit()
+        self._blocks_cache.clear()
+        self._block_search_cache.clear()
         return block
 
     async def get_logic_block(self, block_id: str) -> Optional[LogicBlock]:
@@ -217,29 +276,34 @@ class MemoryStore:
     async def get_logic_blocks(
         self, block_type: Optional[str] = None, tags: Optional[list[str]] = None
     ) -> list[LogicBlock]:
-        """Get all logic blocks, optionally filtered."""
-        query = "SELECT * FROM logic_blocks"
-        params = []
+        """
+        Get all logic blocks, optionally filtered.
 
-        if block_type:
-            query += " WHERE block_type = ?"
-            params.append(block_type)
+        Results are cached per filter until the next logic block write.
+        """
+        key = self._filter_key(block_type, tags)
+        cached = self._blocks_cache.get(key)
+        if cached is not None:
+            return self._copies(cached)
 
+        query, params = self._filter_query("logic_blocks", "block_type", block_type, tags)
         async with self._connection.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            blocks = [self._row_to_logic_block(row) for row in rows]
-
-            if tags:
-                blocks = [b for b in blocks if any(t in b.tags for t in tags)]
+            blocks = [self._row_to_logic_block(row) for row in await cursor.fetchall()]
 
-            return blocks
+        self._cache_put(self._blocks_cache, key, blocks)
+        return self._copies(blocks)
 
     async def search_logic_blocks(self, query: str) -> list[LogicBlock]:
         """Search logic blocks by name or description.
         
         Note: SQL LIKE wildcard characters (% and _) in the query are escaped
-        to ensure literal matching.
+        to ensure literal matching. Results are cached per query until the
+        next logic block write.
         """
+        cached = self._block_search_cache.get(query)
+        if cached is not None:
+            return self._copies(cached)
+
         # Escape SQL LIKE wildcard characters for literal matching
         escaped_query = query.replace('%', r'\%').replace('_', r'\_')
         search_pattern = f"%{escaped_query}%"
@@ -253,8 +317,10 @@ class MemoryStore:
             """,
             (search_pattern, search_pattern, search_pattern),
         ) as cursor:
-            rows = await cursor.fetchall()
-            return [self._row_to_logic_block(row) for row in rows]
+            blocks = [self._row_to_logic_block(row) for row in await cursor.fetchall()]
+
+        self._cache_put(self._block_search_cache, query, blocks)
+        return self._copies(blocks)
 
     def _row_to_logic_block(self, row) -> LogicBlock:
         return LogicBlock(
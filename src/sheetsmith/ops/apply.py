@@ -5,7 +5,8 @@ import logging
 from typing import Optional
 from datetime import datetime, timezone
 
-from ..sheets import GoogleSheetsClient, BatchUpdate, CellUpdate
+from ..sheets import GoogleSheetsClient, BatchUpdate
+from ..sheets.client import cell_row_number
 from ..engine.safety import SafetyValidator
 from .models import ApplyRequest, ApplyResponse, PreviewResponse, ChangeSpec
 from .safety_checker import SafetyChecker
@@ -161,14 +162,15 @@ class ApplyEngine:
         )
         
         # Convert change specs to cell updates
-        for change in preview.changes:
-            update = CellUpdate(
-                sheet_name=change.sheet_name,
-                cell=change.cell,
-                new_value=str(change.new_value) if change.new_value is not None else None,
-                new_formula=change.new_formula,
-            )
-            batch.updates.append(update)
+        batch.add_updates(
+            {
+                "sheet_name": change.sheet_name,
+                "cell": change.cell,
+                "new_value": str(change.new_value) if change.new_value is not None else None,
+                "new_formula": change.new_formula,
+            }
+            for change in preview.changes
+        )
         
         # Apply batch update
         result = self.sheets_client.batch_update(batch)
@@ -258,16 +260,14 @@ class ApplyEngine:
         row_ranges = {}
         for change in preview.changes:
             sheet = change.sheet_name
-            cell = change.cell
-            try:
-                row_num = int(''.join(filter(str.isdigit, cell)))
-                if sheet not in row_ranges:
-                    row_ranges[sheet] = [row_num, row_num]
-                else:
-                    row_ranges[sheet][0] = min(row_ranges[sheet][0], row_num)
-                    row_ranges[sheet][1] = max(row_ranges[sheet][1], row_num)
-            except (ValueError, IndexError):
-                pass
+            row_num = cell_row_number(change.cell)
+            if row_num is None:
+                continue
+            if sheet not in row_ranges:
+                row_ranges[sheet] = [row_num, row_num]
+            else:
+                row_ranges[sheet][0] = min(row_ranges[sheet][0], row_num)
+                row_ranges[sheet][1] = max(row_ranges[sheet][1], row_num)
         
         row_range_by_sheet = {
             sheet: tuple(range_list) for sheet, range_list in row_ranges.items()
@@ -2,6 +2,7 @@
 
 from enum import Enum
 from typing import Optional, Any
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
@@ -63,8 +64,14 @@ class SearchResult(BaseModel):
     execution_time_ms: float
 
 
-class ChangeSpec(BaseModel):
-    """Specification for a single change."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ChangeSpec:
+    """Specification for a single change.
+
+    Plain slotted dataclass rather than a Pydantic model: previews create
+    these by the thousand from already-validated ``CellMatch`` data. Pydantic
+    still validates them when they arrive inside an ``Operation`` request.
+    """
 
     sheet_name: str
     cell: str  # A1 notation
@@ -3,10 +3,11 @@
 import re
 import uuid
 import logging
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from datetime import datetime, timedelta, timezone
 
 from ..sheets import GoogleSheetsClient
+from ..sheets.client import cell_row_number
 from ..engine.differ import FormulaDiffer
 from .models import (
     PreviewRequest,
@@ -24,6 +25,92 @@ from ..config import settings
 logger = logging.getLogger(__name__)
 
 
+class _PreviewAccumulator:
+    """
+    Online aggregator that consumes a stream of changes in a single pass.
+
+    Scope sets, per-sheet row ranges and the (bounded) diff text are updated
+    as each change arrives, so the change stream is never re-iterated.
+    Changes themselves are retained because apply needs every one of them.
+    """
+
+    def __init__(self, format_diff: Callable[[ChangeSpec], list[str]]):
+        self._format_diff = format_diff
+        self._max_display = getattr(settings, 'max_preview_diffs_displayed', 100)
+        self.changes: list[ChangeSpec] = []
+        self._sheets: dict[str, None] = {}
+        self._headers: dict[str, None] = {}
+        self._row_ranges: dict[str, list[int]] = {}
+        self._diff_lines: list[str] = []
+
+    def add(self, change: ChangeSpec) -> None:
+        """Fold a single change into the running aggregates."""
+        if len(self.changes) < self._max_display:
+            self._diff_lines.extend(self._format_diff(change))
+        self.changes.append(change)
+        
+        sheet = change.sheet_name
+        self._sheets[sheet] = None
+        if change.header:
+            self._headers[change.header] = None
+        
+        # Extract row number from A1 notation (e.g., "B2" -> 2)
+        row_num = cell_row_number(change.cell)
+        if row_num is None:
+            return
+        row_range = self._row_ranges.get(sheet)
+        if row_range is None:
+            self._row_ranges[sheet] = [row_num, row_num]
+        elif row_num < row_range[0]:
+            row_range[0] = row_num
+        elif row_num > row_range[1]:
+            row_range[1] = row_num
+
+    def scope_info(self) -> ScopeInfo:
+        """Scope information in the legacy format."""
+        affected_sheets = list(self._sheets)
+        return ScopeInfo(
+            total_cells=len(self.changes),
+            affected_sheets=affected_sheets,
+            affected_headers=list(self._headers),
+            sheet_count=len(affected_sheets),
+            requires_approval=len(self.changes) > settings.require_preview_above_cells,
+        )
+
+    def scope_summary(self, operation: Operation) -> ScopeSummary:
+        """Enhanced scope summary with detailed information."""
+        # Collect formula patterns matched
+        formula_patterns = []
+        if operation.find_pattern:
+            formula_patterns.append(operation.find_pattern)
+        
+        return ScopeSummary(
+            total_cells=len(self.changes),
+            total_sheets=len(self._sheets),
+            sheet_names=list(self._sheets),
+            headers_affected=list(self._headers),
+            row_range_by_sheet={
+                sheet: tuple(range_list) for sheet, range_list in self._row_ranges.items()
+            },
+            formula_patterns_matched=formula_patterns,
+            # Estimate duration (rough estimate: 10ms per cell)
+            estimated_duration_seconds=len(self.changes) * 0.01,
+        )
+
+    def diff_text(self) -> str:
+        """Enhanced diff text for the first ``max_display`` changes."""
+        lines = list(self._diff_lines)
+        
+        # Add summary if truncated
+        if len(self.changes) > self._max_display:
+            remaining = len(self.changes) - self._max_display
+            lines.append(
+                f"... and {remaining} more changes (showing first {self._max_display})"
+            )
+        
+        return "\n".join(lines)
+
+
 class PreviewGenerator:
     """Generates previews of operations before applying them."""
 
@@ -72,8 +159,13 @@ class PreviewGenerator:
         else:
             raise ValueError(f"Unsupported operation type: {operation.operation_type}")
         
+        # Consume the change stream once, aggregating scope and diff text as we go
+        accumulator = _PreviewAccumulator(self._format_change_diff)
+        for change in changes:
+            accumulator.add(change)
+        
         # Calculate enhanced scope summary
-        scope_summary = self._calculate_enhanced_scope(changes, operation)
+        scope_summary = accumulator.scope_summary(operation)
         
         # Run safety checks
         safety_check = self.safety_checker.check_operation_safety(operation, scope_summary)
@@ -86,10 +178,10 @@ class PreviewGenerator:
             # The actual apply will enforce these limits
         
         # Calculate legacy scope for backwards compatibility
-        scope = self._calculate_scope(changes)
+        scope = accumulator.scope_info()
         
         # Generate enhanced diff text with formula diffs
-        diff_text = self._generate_enhanced_diff_text(changes)
+        diff_text = accumulator.diff_text()
         
         # Create preview response
         preview_id = str(uuid.uuid4())
@@ -102,7 +194,7 @@ class PreviewGenerator:
             spreadsheet_id=spreadsheet_id,
             operation_type=operation.operation_type,
             description=operation.description,
-            changes=changes,
+            changes=accumulator.changes,
             scope=scope,
             diff_text=diff_text,
             created_at=datetime.now(timezone.utc),
@@ -111,8 +203,8 @@ class PreviewGenerator:
 
     def _preview_replace_in_formulas(
         self, spreadsheet_id: str, operation: Operation
-    ) -> list[ChangeSpec]:
-        """Preview replace in formulas operation."""
+    ) -> Iterator[ChangeSpec]:
+        """Preview replace in formulas operation, yielding changes lazily."""
         if not operation.find_pattern or operation.replace_with is None:
             raise ValueError("find_pattern and replace_with are required")
         
@@ -126,21 +218,23 @@ class PreviewGenerator:
             sheet_names=operation.search_criteria.sheet_names if operation.search_criteria else None,
         )
         
+        # Compile the regex once rather than per matched formula
+        try:
+            find_re = re.compile(operation.find_pattern) if criteria.is_regex else None
+        except re.error as e:
+            logger.warning(f"Regex error: {e}")
+            return
+        
         search_result = self.search_engine.search(spreadsheet_id, criteria)
         
-        changes = []
         for match in search_result.matches:
             if not match.formula:
                 continue
             
             # Perform replacement
-            if operation.search_criteria and operation.search_criteria.is_regex:
+            if find_re is not None:
                 try:
-                    new_formula = re.sub(
-                        operation.find_pattern,
-                        operation.replace_with,
-                        match.formula,
-                    )
+                    new_formula = find_re.sub(operation.replace_with, match.formula)
                 except re.error as e:
                     logger.warning(f"Regex error: {e}")
                     continue
@@ -151,24 +245,20 @@ class PreviewGenerator:
             
             # Only include if actually changed
             if new_formula != match.formula:
-                changes.append(
-                    ChangeSpec(
-                        sheet_name=match.sheet_name,
-                        cell=match.cell,
-                        old_formula=match.formula,
-                        old_value=match.value,
-                        new_formula=new_formula,
-                        header=match.header,
-                        row_label=match.row_label,
-                    )
+                yield ChangeSpec(
+                    sheet_name=match.sheet_name,
+                    cell=match.cell,
+                    old_formula=match.formula,
+                    old_value=match.value,
+                    new_formula=new_formula,
+                    header=match.header,
+                    row_label=match.row_label,
                 )
-        
-        return changes
 
     def _preview_set_value_by_header(
         self, spreadsheet_id: str, operation: Operation
-    ) -> list[ChangeSpec]:
-        """Preview set value by header operation."""
+    ) -> Iterator[ChangeSpec]:
+        """Preview set value by header operation, yielding changes lazily."""
         if not operation.header_name:
             raise ValueError("header_name is required")
         
@@ -189,7 +279,6 @@ class PreviewGenerator:
         
         search_result = self.search_engine.search(spreadsheet_id, criteria)
         
-        changes = []
         for match in search_result.matches:
             # Check if this row is in our target row labels
             if match.row_label not in operation.row_labels:
@@ -202,46 +291,46 @@ class PreviewGenerator:
             
             # Only include if actually changed
             if str(new_value) != str(match.value):
-                changes.append(
-                    ChangeSpec(
-                        sheet_name=match.sheet_name,
-                        cell=match.cell,
-                        old_value=match.value,
-                        old_formula=match.formula,
-                        new_value=new_value,
-                        header=match.header,
-                        row_label=match.row_label,
-                    )
+                yield ChangeSpec(
+                    sheet_name=match.sheet_name,
+                    cell=match.cell,
+                    old_value=match.value,
+                    old_formula=match.formula,
+                    new_value=new_value,
+                    header=match.header,
+                    row_label=match.row_label,
                 )
-        
-        return changes
 
     def _preview_bulk_formula_update(
         self, spreadsheet_id: str, operation: Operation
-    ) -> list[ChangeSpec]:
-        """Preview bulk formula update operation."""
+    ) -> Iterator[ChangeSpec]:
+        """Preview bulk formula update operation, yielding changes lazily."""
         if not operation.search_criteria:
             raise ValueError("search_criteria is required")
         
         if not operation.find_pattern or operation.replace_with is None:
             raise ValueError("find_pattern and replace_with are required")
         
+        # Compile the regex once rather than per matched formula
+        try:
+            find_re = (
+                re.compile(operation.find_pattern) if operation.search_criteria.is_regex else None
+            )
+        except re.error as e:
+            logger.warning(f"Regex error: {e}")
+            return
+        
         # Similar to replace_in_formulas but with more flexible criteria
         search_result = self.search_engine.search(spreadsheet_id, operation.search_criteria)
         
-        changes = []
         for match in search_result.matches:
             if not match.formula:
                 continue
             
             # Perform replacement
-            if operation.search_criteria.is_regex:
+            if find_re is not None:
                 try:
-                    new_formula = re.sub(
-                        operation.find_pattern,
-                        operation.replace_with,
-                        match.formula,
-                    )
+                    new_formula = find_re.sub(operation.replace_with, match.formula)
                 except re.error as e:
                     logger.warning(f"Regex error: {e}")
                     continue
@@ -252,80 +341,15 @@ class PreviewGenerator:
             
             # Only include if actually changed
             if new_formula != match.formula:
-                changes.append(
-                    ChangeSpec(
-                        sheet_name=match.sheet_name,
-                        cell=match.cell,
-                        old_formula=match.formula,
-                        old_value=match.value,
-                        new_formula=new_formula,
-                        header=match.header,
-                        row_label=match.row_label,
-                    )
+                yield ChangeSpec(
+                    sheet_name=match.sheet_name,
+                    cell=match.cell,
+                    old_formula=match.formula,
+                    old_value=match.value,
+                    new_formula=new_formula,
+                    header=match.header,
+                    row_label=match.row_label,
                 )
-        
-        return changes
-
-    def _calculate_scope(self, changes: list[ChangeSpec]) -> ScopeInfo:
-        """Calculate scope information from changes (legacy format)."""
-        affected_sheets = list(set(c.sheet_name for c in changes))
-        affected_headers = list(set(c.header for c in changes if c.header))
-        
-        requires_approval = len(changes) > settings.require_preview_above_cells
-        
-        return ScopeInfo(
-            total_cells=len(changes),
-            affected_sheets=affected_sheets,
-            affected_headers=affected_headers,
-            sheet_count=len(affected_sheets),
-            requires_approval=requires_approval,
-        )
-
-    def _calculate_enhanced_scope(
-        self, changes: list[ChangeSpec], operation: Operation
-    ) -> ScopeSummary:
-        """Calculate enhanced scope summary with detailed information."""
-        affected_sheets = list(set(c.sheet_name for c in changes))
-        affected_headers = list(set(c.header for c in changes if c.header))
-        
-        # Calculate row ranges by sheet
-        row_ranges = {}
-        for change in changes:
-            sheet = change.sheet_name
-            row = change.cell
-            # Extract row number from A1 notation (e.g., "B2" -> 2)
-            try:
-                row_num = int(''.join(filter(str.isdigit, row)))
-                if sheet not in row_ranges:
-                    row_ranges[sheet] = [row_num, row_num]
-                else:
-                    row_ranges[sheet][0] = min(row_ranges[sheet][0], row_num)
-                    row_ranges[sheet][1] = max(row_ranges[sheet][1], row_num)
-            except (ValueError, IndexError):
-                pass
-        
-        # Convert to tuple format
-        row_range_by_sheet = {
-            sheet: tuple(range_list) for sheet, range_list in row_ranges.items()
-        }
-        
-        # Collect formula patterns matched
-        formula_patterns = []
-        if operation.find_pattern:
-            formula_patterns.append(operation.find_pattern)
-        
-        # Estimate duration (rough estimate: 10ms per cell)
-        estimated_duration = len(changes) * 0.01
-        
-        return ScopeSummary(
-            total_cells=len(changes),
-            total_sheets=len(affected_sheets),
-            sheet_names=affected_sheets,
-            headers_affected=affected_headers,
-            row_range_by_sheet=row_range_by_sheet,
-            formula_patterns_matched=formula_patterns,
-            estimated_duration_seconds=estimated_duration,
-        )
 
     def _generate_diff_text(self, changes: list[ChangeSpec]) -> str:
         """Generate human-readable diff text (legacy format)."""
@@ -348,51 +372,43 @@ class PreviewGenerator:
         
         return "\n".join(lines)
 
-    def _generate_enhanced_diff_text(self, changes: list[ChangeSpec]) -> str:
-        """Generate enhanced diff text with formula highlighting."""
+    def _format_change_diff(self, change: ChangeSpec) -> list[str]:
+        """Format the enhanced diff lines for a single change."""
         lines = []
-        max_display = getattr(settings, 'max_preview_diffs_displayed', 100)
         
-        for idx, change in enumerate(changes[:max_display]):
-            # Header with location info
-            header_info = f" (Header: {change.header})" if change.header else ""
-            row_info = f" (Row: {change.row_label})" if change.row_label else ""
-            lines.append(f"--- {change.sheet_name}!{change.cell}{header_info}{row_info}")
-            
-            # Show before
+        # Header with location info
+        header_info = f" (Header: {change.header})" if change.header else ""
+        row_info = f" (Row: {change.row_label})" if change.row_label else ""
+        lines.append(f"--- {change.sheet_name}!{change.cell}{header_info}{row_info}")
+        
+        # Show before
+        if change.old_formula:
+            lines.append(f"-  FORMULA: {change.old_formula}")
+            if change.old_value is not None:
+                lines.append(f"-  VALUE:   {change.old_value}")
+        elif change.old_value is not None:
+            lines.append(f"-  {change.old_value}")
+        
+        # Show after
+        if change.new_formula:
+            lines.append(f"+  FORMULA: {change.new_formula}")
+            # Use differ to highlight changes if both formulas exist
             if change.old_formula:
-                lines.append(f"-  FORMULA: {change.old_formula}")
-                if change.old_value is not None:
-                    lines.append(f"-  VALUE:   {change.old_value}")
-            elif change.old_value is not None:
-                lines.append(f"-  {change.old_value}")
-            
-            # Show after
-            if change.new_formula:
-                lines.append(f"+  FORMULA: {change.new_formula}")
-                # Use differ to highlight changes if both formulas exist
-                if change.old_formula:
-                    diff = self.differ.diff_formula(
-                        change.old_formula, change.new_formula, change.cell, change.sheet_name
-                    )
-                    if diff.changes:
-                        # Show changes summary
-                        changes_text = ", ".join([
-                            f"{c['type']}: '{c['old']}' -> '{c['new']}'" 
-                            for c in diff.changes[:3]  # Show first 3 changes
-                        ])
-                        lines.append(f"   CHANGES: {changes_text}")
-            elif change.new_value is not None:
-                lines.append(f"+  {change.new_value}")
-            
-            lines.append("")
-        
-        # Add summary if truncated
-        if len(changes) > max_display:
-            remaining = len(changes) - max_display
-            lines.append(f"... and {remaining} more changes (showing first {max_display})")
-        
-        return "\n".join(lines)
+                diff = self.differ.diff_formula(
+                    change.old_formula, change.new_formula, change.cell, change.sheet_name
+                )
+                if diff.changes:
+                    # Show changes summary
+                    changes_text = ", ".join([
+                        f"{c['type']}: '{c['old']}' -> '{c['new']}'" 
+                        for c in diff.changes[:3]  # Show first 3 changes
+                    ])
+                    lines.append(f"   CHANGES: {changes_text}")
+        elif change.new_value is not None:
+            lines.append(f"+  {change.new_value}")
+        
+        lines.append("")
+        return lines
 
     def generate_preview_diffs(self, changes: list[ChangeSpec]) -> list[PreviewDiff]:
         """Generate detailed PreviewDiff objects for UI consumption."""
@@ -1,12 +1,14 @@
 """Safety, preview, and audit models for operations."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Literal
 from pydantic import BaseModel, Field
 
 
-class PreviewDiff(BaseModel):
-    """Detailed diff for a single cell change."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PreviewDiff:
+    """Detailed diff for a single cell change (slotted, built per changed cell)."""
 
     cell_address: str
     sheet_name: str
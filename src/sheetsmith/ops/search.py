@@ -2,20 +2,194 @@
 
 import re
 import logging
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional
+from pydantic import TypeAdapter
 from ..sheets import GoogleSheetsClient
 from ..sheets.client import parse_cell_notation
+from ..config import settings
 from .models import SearchCriteria, CellMatch, SearchResult
 
 logger = logging.getLogger(__name__)
 
+# Bulk validator for the matches of one sheet
+_CELL_MATCH_LIST = TypeAdapter(list[CellMatch])
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledCriteria:
+    """
+    Search criteria with per-search invariant work hoisted out of the cell loop.
+    
+    Regexes are compiled once and literal needles/header text are lowercased
+    once for case-insensitive searches.
+    """
+
+    criteria: SearchCriteria
+    case_sensitive: bool
+    header_text: Optional[str] = None  # Lowercased unless case-sensitive
+    formula_re: Optional[re.Pattern] = None
+    formula_needle: Optional[str] = None  # Lowercased unless case-sensitive
+    value_re: Optional[re.Pattern] = None
+    value_needle: Optional[str] = None  # Lowercased unless case-sensitive
+    # Whether cell text must be lowercased before the literal check. False when
+    # case-sensitive or when the needle has no cased characters (e.g. "1.5").
+    fold_formula: bool = False
+    fold_value: bool = False
+    # Cell predicate specialized for these criteria (see _build_cell_matcher)
+    matches_cell: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "matches_cell", _build_cell_matcher(self))
+
+    @property
+    def has_pattern(self) -> bool:
+        """Whether a formula or value pattern is part of the criteria."""
+        return bool(self.criteria.formula_pattern or self.criteria.value_pattern)
+
+    @classmethod
+    def compile(cls, criteria: SearchCriteria) -> "_CompiledCriteria":
+        """
+        Compile search criteria.
+        
+        Raises:
+            re.error: If a regex pattern is invalid
+        """
+        case_sensitive = criteria.case_sensitive
+        flags = 0 if case_sensitive else re.IGNORECASE
+        
+        def fold(text: Optional[str]) -> Optional[str]:
+            if not text or case_sensitive:
+                return text
+            return text.lower()
+        
+        def needs_fold(needle: Optional[str]) -> bool:
+            return bool(needle) and not case_sensitive and needle.upper() != needle.lower()
+        
+        if criteria.is_regex:
+            return cls(
+                criteria=criteria,
+                case_sensitive=case_sensitive,
+                header_text=fold(criteria.header_text),
+                formula_re=(
+                    re.compile(criteria.formula_pattern, flags)
+                    if criteria.formula_pattern
+                    else None
+                ),
+                value_re=(
+                    re.compile(criteria.value_pattern, flags) if criteria.value_pattern else None
+                ),
+            )
+        
+        return cls(
+            criteria=criteria,
+            case_sensitive=case_sensitive,
+            header_text=fold(criteria.header_text),
+            formula_needle=fold(criteria.formula_pattern),
+            value_needle=fold(criteria.value_pattern),
+            fold_formula=needs_fold(criteria.formula_pattern),
+            fold_value=needs_fold(criteria.value_pattern),
+        )
+
+
+# Every character str() (or its lowercase) can produce for an int, float or
+# bool value: digits, sign, decimal point, exponent, inf/nan and True/False
+_SCALAR_TEXT_CHARS = frozenset("0123456789+-.e" + "infnan" + "TrueFalse" + "truefalse")
+
+
+def _build_cell_matcher(criteria: _CompiledCriteria) -> Callable[[Any], bool]:
+    """
+    Build a cell predicate specialized for the compiled pattern criteria.
+    
+    All regex/literal/case-folding decisions are made here once, so the
+    per-cell check runs only the branch that applies instead of re-testing
+    every option of the criteria for each cell.
+
+    Each haystack (formula, value) carries at most one literal needle, so a
+    single C-level ``in`` scan per haystack is already the minimum; a
+    multi-pattern automaton only pays off once several needles share one
+    haystack.
+    """
+    checks: list[Callable[[Any], bool]] = []
+    
+    if criteria.formula_re is not None:
+        formula_search = criteria.formula_re.search
+        
+        def check_formula(cell) -> bool:
+            return bool(cell.formula) and formula_search(cell.formula) is not None
+        
+        checks.append(check_formula)
+    elif criteria.formula_needle:
+        formula_needle = criteria.formula_needle
+        
+        if criteria.fold_formula:
+            def check_formula(cell) -> bool:
+                return bool(cell.formula) and formula_needle in cell.formula.lower()
+        else:
+            def check_formula(cell) -> bool:
+                return bool(cell.formula) and formula_needle in cell.formula
+        
+        checks.append(check_formula)
+    
+    if criteria.value_re is not None:
+        value_search = criteria.value_re.search
+        
+        def check_value(cell) -> bool:
+            return cell.value is not None and value_search(str(cell.value)) is not None
+        
+        checks.append(check_value)
+    elif criteria.value_needle:
+        value_needle = criteria.value_needle
+        fold_value = criteria.fold_value
+        # Non-text values (numbers, booleans) only need str() when the needle
+        # could occur in their text form at all
+        scalar_may_match = _SCALAR_TEXT_CHARS.issuperset(value_needle)
+        
+        def check_value(cell) -> bool:
+            value = cell.value
+            if isinstance(value, str):
+                text = value
+            elif value is None or not scalar_may_match:
+                return False
+            else:
+                text = str(value)
+            return value_needle in (text.lower() if fold_value else text)
+        
+        checks.append(check_value)
+    
+    if not checks:
+        return lambda cell: True
+    if len(checks) == 1:
+        return checks[0]
+    
+    first, second = checks
+    return lambda cell: first(cell) and second(cell)
+
 
 class CellSearchEngine:
     """Engine for searching cells based on various criteria."""
 
     def __init__(self, sheets_client: Optional[GoogleSheetsClient] = None):
         self.sheets_client = sheets_client or GoogleSheetsClient()
+        # Created on the first parallel search and kept for the engine's
+        # lifetime, so its threads (and the Sheets service each of them builds
+        # on first use) are reused by every later search
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the engine's long-lived sheet search pool."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.search_max_workers),
+                    thread_name_prefix="sheet-search",
+                )
+            return self._executor
 
     def search(
         self,
@@ -43,22 +217,61 @@ class CellSearchEngine:
         
         logger.info(f"Searching {len(sheets_to_search)} sheets with criteria: {criteria}")
         
-        for sheet in info["sheets"]:
-            if sheet["title"] not in sheets_to_search:
-                continue
-            
-            if len(matches) >= limit:
-                logger.info(f"Reached limit of {limit} matches")
-                break
-            
-            # Search this sheet
-            sheet_matches = self._search_sheet(
-                spreadsheet_id=spreadsheet_id,
-                sheet=sheet,
-                criteria=criteria,
-                limit=limit - len(matches),
+        # Compile patterns once per search rather than once per cell
+        try:
+            compiled = _CompiledCriteria.compile(criteria)
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern: {e}")
+            return SearchResult(
+                matches=[],
+                total_count=0,
+                searched_sheets=sheets_to_search,
+                execution_time_ms=(time.time() - start_time) * 1000,
             )
-            matches.extend(sheet_matches)
+        
+        sheets = [s for s in info["sheets"] if s["title"] in sheets_to_search]
+        
+        # Small limits are often met by the first sheet; searching sheets one
+        # by one then skips reading the rest, which parallel reads cannot
+        if (
+            min(settings.search_max_workers, len(sheets)) <= 1
+            or limit < settings.search_parallel_min_limit
+        ):
+            for sheet in sheets:
+                if len(matches) >= limit:
+                    logger.info(f"Reached limit of {limit} matches")
+                    break
+                
+                # Search this sheet
+                sheet_matches = self._search_sheet(
+                    spreadsheet_id=spreadsheet_id,
+                    sheet=sheet,
+                    criteria=compiled,
+                    limit=limit - len(matches),
+                )
+                matches.extend(sheet_matches)
+        else:
+            # Sheet reads are independent, I/O-bound API calls: run them
+            # concurrently and merge in sheet order so results stay deterministic
+            executor = self._get_executor()
+            futures = [
+                executor.submit(
+                    self._search_sheet,
+                    spreadsheet_id=spreadsheet_id,
+                    sheet=sheet,
+                    criteria=compiled,
+                    limit=limit,
+                )
+                for sheet in sheets
+            ]
+            for future in futures:
+                if len(matches) >= limit:
+                    logger.info(f"Reached limit of {limit} matches")
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                # islice avoids copying the sheet's list just to cap it
+                matches.extend(islice(future.result(), limit - len(matches)))
         
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
         
@@ -73,151 +286,153 @@ class CellSearchEngine:
         self,
         spreadsheet_id: str,
         sheet: dict,
-        criteria: SearchCriteria,
+        criteria: _CompiledCriteria,
         limit: int,
     ) -> list[CellMatch]:
         """Search a single sheet for matching cells."""
         from ..sheets.client import index_to_col_letter
         
-        matches: list[CellMatch] = []
+        raw_matches: list[dict] = []
         sheet_name = sheet["title"]
+        last_col = index_to_col_letter(sheet["col_count"] - 1)
+        chunk_rows = max(1, settings.search_read_chunk_rows)
+        headers: dict[int, str] = {}
+        target_cols: Optional[set[int]] = None
         
-        # Read the entire sheet with formulas
-        range_notation = f"'{sheet_name}'!A1:{index_to_col_letter(sheet['col_count'] - 1)}{sheet['row_count']}"
-        
-        try:
-            sheet_data = self.sheets_client.read_range(
-                spreadsheet_id, range_notation, include_formulas=True
-            )
-        except Exception as e:
-            logger.warning(f"Failed to read sheet '{sheet_name}': {e}")
-            return matches
-        
-        # Extract headers from first row if needed
-        headers = self._extract_headers(sheet_data.cells)
+        if criteria.header_text:
+            # Read the header row alone first: the header filter resolves to
+            # column indexes, and the body reads then stop at the last of them
+            header_range = f"'{sheet_name}'!A1:{last_col}1"
+            try:
+                header_data = self.sheets_client.read_range(
+                    spreadsheet_id, header_range, include_formulas=False
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read headers of sheet '{sheet_name}': {e}")
+                return []
+            
+            headers, _ = self._index_cells(header_data.cells)
+            target_cols = self._target_columns(headers, criteria)
+            if not target_cols:
+                logger.info(f"No matching header column in sheet '{sheet_name}'")
+                return []
+            last_col = index_to_col_letter(max(target_cols))
         
-        # Search each cell
-        for cell in sheet_data.cells:
-            if len(matches) >= limit:
-                break
+        # Read the sheet (with formulas) in row chunks, so bounded searches stop
+        # early and memory stays proportional to the chunk size
+        for start_row in range(1, sheet["row_count"] + 1, chunk_rows):
+            end_row = min(start_row + chunk_rows - 1, sheet["row_count"])
+            range_notation = f"'{sheet_name}'!A{start_row}:{last_col}{end_row}"
             
-            if self._matches_criteria(cell, headers, criteria):
+            try:
+                sheet_data = self.sheets_client.read_range(
+                    spreadsheet_id, range_notation, include_formulas=True
+                )
+            except Exception as e:
+                # Drop the sheet rather than return a silently truncated match
+                # set that preview/apply would then act on
+                logger.warning(f"Failed to read sheet '{sheet_name}' ({range_notation}): {e}")
+                return []
+            
+            # Index headers and row labels; every chunk spans column A (row
+            # labels) and only the first one contains row 1 (headers)
+            chunk_headers, row_labels = self._index_cells(sheet_data.cells)
+            if start_row == 1:
+                headers = chunk_headers
+            
+            # Search each candidate cell; filter() drives the specialized
+            # predicate from C, so the loop body only runs for matches, and
+            # islice stops it once the remaining limit is reached
+            candidates = self._candidate_cells(sheet_data.cells, target_cols, criteria)
+            remaining = limit - len(raw_matches)
+            for cell in islice(filter(criteria.matches_cell, candidates), remaining):
                 # Get header for this cell
                 header = headers.get(cell.col)
                 
                 # Get row label (first column value of this row)
-                row_label = self._get_row_label(sheet_data.cells, cell.row)
+                row_label = row_labels.get(cell.row)
                 
-                matches.append(
-                    CellMatch(
-                        spreadsheet_id=spreadsheet_id,
-                        sheet_name=sheet_name,
-                        cell=cell.cell,
-                        row=cell.row,
-                        col=cell.col,
-                        header=header,
-                        row_label=row_label,
-                        value=cell.value,
-                        formula=cell.formula,
-                    )
+                # Collected as plain dicts and validated in bulk below
+                raw_matches.append(
+                    {
+                        "spreadsheet_id": spreadsheet_id,
+                        "sheet_name": sheet_name,
+                        "cell": cell.cell,
+                        "row": cell.row,
+                        "col": cell.col,
+                        "header": header,
+                        "row_label": row_label,
+                        "value": cell.value,
+                        "formula": cell.formula,
+                    }
                 )
+            
+            if len(raw_matches) >= limit:
+                break
         
-        logger.info(f"Found {len(matches)} matches in sheet '{sheet_name}'")
-        return matches
+        logger.info(f"Found {len(raw_matches)} matches in sheet '{sheet_name}'")
+        # One pydantic-core call for the whole list is cheaper than per-match
+        # CellMatch(...) calls (model_construct is slower still)
+        return _CELL_MATCH_LIST.validate_python(raw_matches)
 
-    def _extract_headers(self, cells: list) -> dict[int, str]:
+    def _index_cells(self, cells: list) -> tuple[dict[int, str], dict[int, str]]:
         """
-        Extract column headers from the first row.
+        Index column headers and row labels of the cells.
+        
+        ``read_range`` returns cells in row-major order, so the header row (if
+        present) comes first and header extraction stops at the first cell past
+        row 1 instead of checking every cell.
         
         Returns:
-            Dictionary mapping column index to header text
+            Tuple of (column index -> header text from row 1,
+            row number -> row label from column A)
         """
-        headers = {}
-        
-        # Find all cells in row 1
+        headers: dict[int, str] = {}
         for cell in cells:
-            if cell.row == 1 and cell.value:
+            if cell.row != 1:
+                break
+            if cell.value:
                 headers[cell.col] = str(cell.value)
         
-        return headers
-
-    def _get_row_label(self, cells: list, row: int) -> Optional[str]:
-        """Get the row label (first column value) for a given row."""
-        for cell in cells:
-            if cell.row == row and cell.col == 0:  # Column A (index 0)
-                return str(cell.value) if cell.value else None
-        return None
-
-    def _matches_criteria(self, cell, headers: dict, criteria: SearchCriteria) -> bool:
-        """Check if a cell matches the search criteria."""
+        # Column A (index 0) holds the row labels
+        row_labels = {cell.row: str(cell.value) for cell in cells if cell.col == 0 and cell.value}
         
-        # Skip header row (row 1) in value/formula searches
-        if criteria.formula_pattern or criteria.value_pattern:
-            if cell.row == 1:
-                return False
+        return headers, row_labels
+
+    def _target_columns(
+        self, headers: dict[int, str], criteria: _CompiledCriteria
+    ) -> Optional[set[int]]:
+        """
+        Resolve the header filter to the set of matching column indexes.
         
-        # Check header text filter
-        if criteria.header_text:
-            header = headers.get(cell.col)
-            if not header:
-                return False
-            
-            if criteria.case_sensitive:
-                if criteria.header_text != header:
-                    return False
-            else:
-                if criteria.header_text.lower() != header.lower():
-                    return False
+        Headers are lowercased once here (for case-insensitive searches) rather
+        than once per cell or chunk. Returns None when there is no header filter.
+        """
+        if not criteria.header_text:
+            return None
         
-        # Check formula pattern
-        if criteria.formula_pattern:
-            if not cell.formula:
-                return False
-            
-            try:
-                flags = 0 if criteria.case_sensitive else re.IGNORECASE
-                if criteria.is_regex:
-                    if not re.search(criteria.formula_pattern, cell.formula, flags):
-                        return False
-                else:
-                    # Simple substring search
-                    if criteria.case_sensitive:
-                        if criteria.formula_pattern not in cell.formula:
-                            return False
-                    else:
-                        if criteria.formula_pattern.lower() not in cell.formula.lower():
-                            return False
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern: {e}")
-                return False
+        if not criteria.case_sensitive:
+            headers = {col: header.lower() for col, header in headers.items()}
+        return {col for col, header in headers.items() if header == criteria.header_text}
+
+    def _candidate_cells(
+        self, cells: list, target_cols: Optional[set[int]], criteria: _CompiledCriteria
+    ) -> Iterable:
+        """
+        Narrow the cells to check using the cheap structural filters.
         
-        # Check value pattern
-        if criteria.value_pattern:
-            if cell.value is None:
-                return False
-            
-            value_str = str(cell.value)
-            
-            try:
-                flags = 0 if criteria.case_sensitive else re.IGNORECASE
-                if criteria.is_regex:
-                    if not re.search(criteria.value_pattern, value_str, flags):
-                        return False
-                else:
-                    # Simple substring search
-                    if criteria.case_sensitive:
-                        if criteria.value_pattern not in value_str:
-                            return False
-                    else:
-                        if criteria.value_pattern.lower() not in value_str.lower():
-                            return False
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern: {e}")
-                return False
+        Only cells in the header-filtered columns are kept and the header row is
+        dropped for pattern searches, so the (more expensive) pattern checks
+        only ever see cells that could match.
+        """
+        # Skip header row (row 1) in value/formula searches. Both filters are
+        # fused into one generator so each cell is only resumed through once.
+        if target_cols is not None:
+            if criteria.has_pattern:
+                return (cell for cell in cells if cell.col in target_cols and cell.row != 1)
+            return (cell for cell in cells if cell.col in target_cols)
         
-        # Check row label filter
-        if criteria.row_label:
-            # This is handled at a higher level since we need to look at column A
-            pass
+        if criteria.has_pattern:
+            return (cell for cell in cells if cell.row != 1)
         
-        return True
+        return cells
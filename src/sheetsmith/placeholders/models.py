@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PlaceholderType(str, Enum):
@@ -17,6 +17,9 @@ class PlaceholderType(str, Enum):
 class Placeholder(BaseModel):
     """Represents a placeholder in a formula."""
 
+    # Frozen: parsed placeholders are memoized and shared between callers
+    model_config = ConfigDict(frozen=True)
+
     name: str  # The placeholder name (e.g., "base_damage")
     type: PlaceholderType
     syntax: str  # Original syntax (e.g., "{{base_damage}}")
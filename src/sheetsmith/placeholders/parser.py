@@ -1,134 +1,141 @@
 """Parser for extracting placeholders from formulas."""
 
+import functools
 import logging
+import re
 from typing import Optional
 
 from .models import Placeholder, PlaceholderType, ValidationResult
 from .syntax import (
-    HEADER_PATTERN,
-    INTERSECTION_PATTERN,
-    CROSS_SHEET_PATTERN,
-    VARIABLE_PATTERN,
-    ANY_PLACEHOLDER_PATTERN,
+    BRACKET_RUN_PATTERN,
+    PLACEHOLDER_TOKEN_PATTERN,
+    has_placeholder_delimiters,
     is_valid_placeholder_name,
 )
 
 logger = logging.getLogger(__name__)
 
 
-class PlaceholderParser:
-    """Parse and extract placeholders from formulas."""
+@functools.lru_cache(maxsize=1024)
+def _extract(formula: str) -> tuple[Placeholder, ...]:
+    """
+    Extract the placeholders of a formula (memoized; Placeholder is frozen).
 
-    def extract_placeholders(self, formula: str) -> list[Placeholder]:
-        """
-        Extract all placeholders from a formula.
+    Args:
+        formula: The formula string to parse
 
-        Args:
-            formula: The formula string to parse
+    Returns:
+        Tuple of Placeholder objects found in the formula
+    """
+    # Most formulas carry no placeholders
+    if not has_placeholder_delimiters(formula):
+        return ()
 
-        Returns:
-            List of Placeholder objects found in the formula
-        """
-        placeholders = []
+    placeholders = []
 
-        # Find all placeholders in the formula
-        for match in ANY_PLACEHOLDER_PATTERN.finditer(formula):
-            placeholder_text = match.group(0)
-            start_pos = match.start()
-            end_pos = match.end()
+    # Find all placeholders in the formula; the matched group gives the type
+    for match in PLACEHOLDER_TOKEN_PATTERN.finditer(formula):
+        placeholder = _build_placeholder(match)
 
-            # Determine placeholder type and extract details
-            placeholder = self._parse_placeholder(placeholder_text, start_pos, end_pos)
+        if placeholder:
+            placeholders.append(placeholder)
+            logger.debug(f"Found placeholder: {placeholder.syntax} (type: {placeholder.type})")
 
-            if placeholder:
-                placeholders.append(placeholder)
-                logger.debug(f"Found placeholder: {placeholder.syntax} (type: {placeholder.type})")
+    return tuple(placeholders)
 
-        return placeholders
 
-    def _parse_placeholder(self, text: str, start_pos: int, end_pos: int) -> Optional[Placeholder]:
-        """
-        Parse a single placeholder text and create a Placeholder object.
+def _build_placeholder(match: re.Match) -> Optional[Placeholder]:
+    """
+    Create a Placeholder from a PLACEHOLDER_TOKEN_PATTERN match.
 
-        Args:
-            text: The placeholder text (e.g., "{{base_damage}}")
-            start_pos: Start position in formula
-            end_pos: End position in formula
+    Uses the regular Pydantic constructor: validation runs in pydantic-core
+    and is cheaper than the pure-Python ``model_construct`` path.
 
-        Returns:
-            Placeholder object or None if invalid
-        """
-        # Try to match as cross-sheet reference first
-        cross_sheet_match = CROSS_SHEET_PATTERN.match(text)
-        if cross_sheet_match:
-            # Extract sheet name (could be with quotes or without)
-            sheet_name = cross_sheet_match.group(1) or cross_sheet_match.group(2)
-            header_name = cross_sheet_match.group(3)
-
-            if not is_valid_placeholder_name(header_name):
-                logger.warning(f"Invalid placeholder name: {header_name}")
-                return None
-
-            return Placeholder(
-                name=header_name.strip(),
-                type=PlaceholderType.CROSS_SHEET,
-                syntax=text,
-                sheet=sheet_name,
-                start_pos=start_pos,
-                end_pos=end_pos,
-            )
+    Args:
+        match: Match whose ``lastgroup`` names the placeholder type
 
-        # Try to match as intersection (header:row_label)
-        intersection_match = INTERSECTION_PATTERN.match(text)
-        if intersection_match:
-            header_name = intersection_match.group(1)
-            row_label = intersection_match.group(2)
-
-            if not is_valid_placeholder_name(header_name):
-                logger.warning(f"Invalid placeholder name: {header_name}")
-                return None
-
-            return Placeholder(
-                name=header_name.strip(),
-                type=PlaceholderType.INTERSECTION,
-                syntax=text,
-                row_label=row_label.strip(),
-                start_pos=start_pos,
-                end_pos=end_pos,
-            )
+    Returns:
+        Placeholder object or None if invalid
+    """
+    kind = match.lastgroup
+    text = match.group(0)
 
-        # Try to match as simple header reference
-        header_match = HEADER_PATTERN.match(text)
-        if header_match:
-            header_name = header_match.group(1)
-
-            if not is_valid_placeholder_name(header_name):
-                logger.warning(f"Invalid placeholder name: {header_name}")
-                return None
-
-            return Placeholder(
-                name=header_name.strip(),
-                type=PlaceholderType.HEADER,
-                syntax=text,
-                start_pos=start_pos,
-                end_pos=end_pos,
-            )
+    if kind == "cross_sheet":
+        # Sheet name could be with quotes or without
+        sheet_name = match.group("quoted_sheet") or match.group("bare_sheet")
+        header_name = match.group("cross_name")
 
-        # Try to match as variable
-        variable_match = VARIABLE_PATTERN.match(text)
-        if variable_match:
-            variable_name = variable_match.group(1)
-
-            return Placeholder(
-                name=variable_name.strip(),
-                type=PlaceholderType.VARIABLE,
-                syntax=text,
-                start_pos=start_pos,
-                end_pos=end_pos,
-            )
+        if not is_valid_placeholder_name(header_name):
+            logger.warning(f"Invalid placeholder name: {header_name}")
+            return None
 
-        logger.warning(f"Could not parse placeholder: {text}")
-        return None
+        return Placeholder(
+            name=header_name.strip(),
+            type=PlaceholderType.CROSS_SHEET,
+            syntax=text,
+            sheet=sheet_name,
+            start_pos=match.start(),
+            end_pos=match.end(),
+        )
+
+    if kind == "intersection":
+        header_name = match.group("intersection_name")
+
+        if not is_valid_placeholder_name(header_name):
+            logger.warning(f"Invalid placeholder name: {header_name}")
+            return None
+
+        return Placeholder(
+            name=header_name.strip(),
+            type=PlaceholderType.INTERSECTION,
+            syntax=text,
+            row_label=match.group("row_label").strip(),
+            start_pos=match.start(),
+            end_pos=match.end(),
+        )
+
+    if kind == "header":
+        header_name = match.group("header_name")
+
+        if not is_valid_placeholder_name(header_name):
+            logger.warning(f"Invalid placeholder name: {header_name}")
+            return None
+
+        return Placeholder(
+            name=header_name.strip(),
+            type=PlaceholderType.HEADER,
+            syntax=text,
+            start_pos=match.start(),
+            end_pos=match.end(),
+        )
+
+    # Variable reference
+    return Placeholder(
+        name=match.group("variable_name").strip(),
+        type=PlaceholderType.VARIABLE,
+        syntax=text,
+        start_pos=match.start(),
+        end_pos=match.end(),
+    )
+
+
+class PlaceholderParser:
+    """Parse and extract placeholders from formulas."""
+
+    def extract_placeholders(self, formula: str) -> list[Placeholder]:
+        """
+        Extract all placeholders from a formula.
+
+        Results are memoized per formula string, so validating and then
+        resolving the same formula only scans it once.
+
+        Args:
+            formula: The formula string to parse
+
+        Returns:
+            List of Placeholder objects found in the formula
+        """
+        return list(_extract(formula))
 
     def validate_syntax(self, formula: str) -> ValidationResult:
         """
@@ -146,16 +153,26 @@ class PlaceholderParser:
         # Extract placeholders
         placeholders = self.extract_placeholders(formula)
 
+        # Tally brackets and spot empty placeholders in a single scan
+        open_double = close_double = 0
+        has_empty = False
+        for run in BRACKET_RUN_PATTERN.finditer(formula):
+            if run.group("open"):
+                open_double += len(run.group("open")) // 2
+                if run.group("empty_close"):
+                    close_double += len(run.group("empty_close")) // 2
+                    has_empty = True
+            else:
+                close_double += len(run.group("close")) // 2
+
         # Check for malformed brackets
-        open_double = formula.count("{{")
-        close_double = formula.count("}}")
         if open_double != close_double:
             errors.append(
                 f"Mismatched placeholder brackets: {open_double} opening, {close_double} closing"
             )
 
         # Check for empty placeholders
-        if "{{ }}" in formula or "{{  }}" in formula:
+        if has_empty:
             errors.append("Empty placeholders are not allowed")
 
         # Check for invalid characters in placeholders
@@ -167,7 +184,8 @@ class PlaceholderParser:
                 )
 
         # Check if formula starts with =
-        if formula.strip() and not formula.strip().startswith("="):
+        stripped = formula.strip()
+        if stripped and not stripped.startswith("="):
             warnings.append("Formula does not start with '=' - this may not be a valid formula")
 
         return ValidationResult(
@@ -1,9 +1,13 @@
 """Resolver for mapping placeholders to actual cell references."""
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Awaitable, Callable, Optional, Union
 
 from ..mapping import (
+    CellMapping,
+    ColumnMapping,
     MappingManager,
 )
 from ..sheets import GoogleSheetsClient
@@ -16,10 +20,21 @@ from .models import (
     MappingPreview,
 )
 from .parser import PlaceholderParser
-from .syntax import fuzzy_match_score
+from .syntax import HeaderIndex, has_placeholder_delimiters, rank_header_matches
 
 logger = logging.getLogger(__name__)
 
+# How long a sheet's header row stays cached for mapping previews
+HEADER_CACHE_TTL_SECONDS = 60
+
+# (spreadsheet_id, sheet_name, header text, row_label) -> mapping. The header
+# is kept verbatim because the mapping manager matches headers exactly
+MappingKey = tuple[str, str, str, Optional[str]]
+
+# The parser is stateless (its patterns are compiled once in syntax.py), so
+# every resolver shares one instance
+_SHARED_PARSER = PlaceholderParser()
+
 
 class PlaceholderResolver:
     """Resolve placeholders to actual cell references."""
@@ -38,8 +53,10 @@ class PlaceholderResolver:
         """
         self.sheets_client = sheets_client
         self.mapping_manager = mapping_manager or MappingManager(sheets_client)
-        self.parser = PlaceholderParser()
+        self.parser = _SHARED_PARSER
         self._initialized = False
+        # (spreadsheet_id, sheet_name) -> (header index, cached at)
+        self._header_cache: dict[tuple[str, str], tuple[HeaderIndex, float]] = {}
 
     async def initialize(self):
         """Initialize the resolver (creates database tables if needed)."""
@@ -74,16 +91,30 @@ class PlaceholderResolver:
             HeaderNotFoundError: If header not found
             DisambiguationRequiredError: If multiple headers match
         """
+        return await self._resolve(placeholder, spreadsheet_id, context, {})
+
+    async def _resolve(
+        self,
+        placeholder: Placeholder,
+        spreadsheet_id: str,
+        context: ResolutionContext,
+        mappings: dict[MappingKey, asyncio.Future],
+    ) -> PlaceholderMapping:
+        """Resolve a placeholder, sharing fetched mappings through ``mappings``."""
         if placeholder.type == PlaceholderType.HEADER:
-            return await self._resolve_header_placeholder(placeholder, spreadsheet_id, context)
+            return await self._resolve_header_placeholder(
+                placeholder, spreadsheet_id, context, mappings
+            )
 
         elif placeholder.type == PlaceholderType.INTERSECTION:
             return await self._resolve_intersection_placeholder(
-                placeholder, spreadsheet_id, context
+                placeholder, spreadsheet_id, context, mappings
             )
 
         elif placeholder.type == PlaceholderType.CROSS_SHEET:
-            return await self._resolve_cross_sheet_placeholder(placeholder, spreadsheet_id, context)
+            return await self._resolve_cross_sheet_placeholder(
+                placeholder, spreadsheet_id, context, mappings
+            )
 
         elif placeholder.type == PlaceholderType.VARIABLE:
             return await self._resolve_variable_placeholder(placeholder, spreadsheet_id, context)
@@ -96,14 +127,19 @@ class PlaceholderResolver:
         placeholder: Placeholder,
         spreadsheet_id: str,
         context: ResolutionContext,
+        mappings: dict[MappingKey, asyncio.Future],
     ) -> PlaceholderMapping:
         """Resolve a header-based placeholder ({{header_name}})."""
         # Get column mapping for this header
-        column_mapping = await self.mapping_manager.get_column_by_header(
-            spreadsheet_id=spreadsheet_id,
-            sheet_name=context.current_sheet,
-            header_text=placeholder.name,
-            auto_create=True,
+        column_mapping = await self._shared_mapping(
+            mappings,
+            (spreadsheet_id, context.current_sheet, placeholder.name, None),
+            lambda: self.mapping_manager.get_column_by_header(
+                spreadsheet_id=spreadsheet_id,
+                sheet_name=context.current_sheet,
+                header_text=placeholder.name,
+                auto_create=True,
+            ),
         )
 
         # Build cell reference
@@ -126,15 +162,20 @@ class PlaceholderResolver:
         placeholder: Placeholder,
         spreadsheet_id: str,
         context: ResolutionContext,
+        mappings: dict[MappingKey, asyncio.Future],
     ) -> PlaceholderMapping:
         """Resolve an intersection placeholder ({{header:row_label}})."""
         # Get cell mapping for this intersection
-        cell_mapping = await self.mapping_manager.get_concept_cell(
-            spreadsheet_id=spreadsheet_id,
-            sheet_name=context.current_sheet,
-            column_header=placeholder.name,
-            row_label=placeholder.row_label,
-            auto_create=True,
+        cell_mapping = await self._shared_mapping(
+            mappings,
+            (spreadsheet_id, context.current_sheet, placeholder.name, placeholder.row_label),
+            lambda: self.mapping_manager.get_concept_cell(
+                spreadsheet_id=spreadsheet_id,
+                sheet_name=context.current_sheet,
+                column_header=placeholder.name,
+                row_label=placeholder.row_label,
+                auto_create=True,
+            ),
         )
 
         # Build cell reference (always absolute for intersection)
@@ -154,14 +195,19 @@ class PlaceholderResolver:
         placeholder: Placeholder,
         spreadsheet_id: str,
         context: ResolutionContext,
+        mappings: dict[MappingKey, asyncio.Future],
     ) -> PlaceholderMapping:
         """Resolve a cross-sheet placeholder ('Sheet'!{{header}})."""
         # Get column mapping in the target sheet
-        column_mapping = await self.mapping_manager.get_column_by_header(
-            spreadsheet_id=spreadsheet_id,
-            sheet_name=placeholder.sheet,
-            header_text=placeholder.name,
-            auto_create=True,
+        column_mapping = await self._shared_mapping(
+            mappings,
+            (spreadsheet_id, placeholder.sheet, placeholder.name, None),
+            lambda: self.mapping_manager.get_column_by_header(
+                spreadsheet_id=spreadsheet_id,
+                sheet_name=placeholder.sheet,
+                header_text=placeholder.name,
+                auto_create=True,
+            ),
         )
 
         # For cross-sheet references, we typically want absolute references
@@ -179,6 +225,28 @@ class PlaceholderResolver:
             sheet_name=placeholder.sheet,
         )
 
+    @staticmethod
+    async def _shared_mapping(
+        mappings: dict[MappingKey, asyncio.Future],
+        key: MappingKey,
+        fetch: Callable[[], Awaitable[Union[ColumnMapping, CellMapping]]],
+    ) -> Union[ColumnMapping, CellMapping]:
+        """
+        Return the mapping fetched for ``key`` in this resolution, or fetch it.
+
+        ``mappings`` lives for a single resolve/resolve_all call, so every entry
+        was just validated by the mapping manager; nothing is reused across
+        calls, where the sheet may have been edited in the meantime. Entries
+        are the in-flight fetches, so placeholders resolved concurrently that
+        share a key make one manager call and cannot both auto-create the
+        mapping. Keys hold the header text verbatim, since the manager matches
+        headers exactly.
+        """
+        fetching = mappings.get(key)
+        if fetching is None:
+            fetching = mappings[key] = asyncio.ensure_future(fetch())
+        return await fetching
+
     async def _resolve_variable_placeholder(
         self,
         placeholder: Placeholder,
@@ -214,8 +282,10 @@ class PlaceholderResolver:
             HeaderNotFoundError: If any header not found
             DisambiguationRequiredError: If any header is ambiguous
         """
-        # Parse placeholders
-        placeholders = self.parser.extract_placeholders(formula)
+        # Parse placeholders, skipping the parser when no placeholder can occur
+        placeholders = (
+            self.parser.extract_placeholders(formula) if has_placeholder_delimiters(formula) else []
+        )
 
         if not placeholders:
             # No placeholders, return formula as-is
@@ -226,35 +296,45 @@ class PlaceholderResolver:
                 warnings=["No placeholders found in formula"],
             )
 
-        # Resolve each placeholder
+        # Resolve each distinct placeholder concurrently; repeated placeholders
+        # share the first occurrence's result, and placeholders naming the same
+        # header (e.g. {{Damage}} and 'Base'!{{Damage}} on sheet Base) share one
+        # mapping fetch
+        unique = {p.syntax: p for p in placeholders}
+        shared_mappings: dict[MappingKey, asyncio.Future] = {}
+        results = await asyncio.gather(
+            *(self._resolve(p, spreadsheet_id, context, shared_mappings) for p in unique.values()),
+            return_exceptions=True,
+        )
+        results_by_syntax = dict(zip(unique, results))
+
         mappings = []
+        mappings_by_syntax: dict[str, PlaceholderMapping] = {}
         warnings = []
 
         for placeholder in placeholders:
-            try:
-                mapping = await self.resolve(placeholder, spreadsheet_id, context)
-                mappings.append(mapping)
-            except NotImplementedError as e:
-                warnings.append(str(e))
-            except Exception as e:
-                logger.error(f"Error resolving placeholder {placeholder.syntax}: {e}")
-                raise
-
-        # Build resolved formula by replacing placeholders
-        resolved = formula
-        # Replace in reverse order to preserve positions
-        for placeholder in reversed(placeholders):
-            # Find the mapping for this placeholder
-            mapping = next(
-                (m for m in mappings if m.placeholder == placeholder.syntax),
-                None,
-            )
+            result = results_by_syntax[placeholder.syntax]
+            if isinstance(result, NotImplementedError):
+                warnings.append(str(result))
+            elif isinstance(result, BaseException):
+                logger.error(f"Error resolving placeholder {placeholder.syntax}: {result}")
+                raise result
+            else:
+                mappings.append(result)
+                mappings_by_syntax[placeholder.syntax] = result
+
+        # Build resolved formula in one left-to-right pass, joining the
+        # literal text between placeholders with their replacements
+        parts = []
+        cursor = 0
+        for placeholder in sorted(placeholders, key=lambda p: p.start_pos):
+            mapping = mappings_by_syntax.get(placeholder.syntax)
             if mapping:
-                resolved = (
-                    resolved[: placeholder.start_pos]
-                    + mapping.resolved_to
-                    + resolved[placeholder.end_pos :]
-                )
+                parts.append(formula[cursor : placeholder.start_pos])
+                parts.append(mapping.resolved_to)
+                cursor = placeholder.end_pos
+        parts.append(formula[cursor:])
+        resolved = "".join(parts)
 
         return ResolvedFormula(
             original=formula,
@@ -263,6 +343,76 @@ class PlaceholderResolver:
             warnings=warnings,
         )
 
+    def _get_sheet_headers(self, spreadsheet_id: str, sheet_name: str) -> HeaderIndex:
+        """
+        Get the headers of a sheet, indexed for fuzzy ranking and cached per sheet.
+
+        Only row 1 is read, and each header is normalized once per cache fill
+        rather than on every fuzzy comparison.
+
+        Returns:
+            HeaderIndex of the unique header texts
+        """
+        headers = self._cached_headers(spreadsheet_id, sheet_name)
+        if headers is not None:
+            return headers
+
+        sheet_range = self.sheets_client.read_range(
+            spreadsheet_id, f"'{sheet_name}'!1:1", include_formulas=False
+        )
+        return self._cache_sheet_headers(spreadsheet_id, sheet_name, sheet_range)
+
+    def _prefetch_sheet_headers(self, spreadsheet_id: str, sheet_names: list[str]):
+        """Fill the header cache for all uncached sheets with one batched read."""
+        missing = [
+            name
+            for name in dict.fromkeys(sheet_names)
+            if self._cached_headers(spreadsheet_id, name) is None
+        ]
+        if not missing:
+            return
+
+        try:
+            sheet_ranges = self.sheets_client.batch_read_ranges(
+                spreadsheet_id, [f"'{name}'!1:1" for name in missing], include_formulas=False
+            )
+        except Exception as e:
+            # Per-sheet reads in _get_sheet_headers report the error per placeholder
+            logger.warning(f"Batched header read failed, reading sheets one by one: {e}")
+            return
+
+        for name, sheet_range in zip(missing, sheet_ranges):
+            self._cache_sheet_headers(spreadsheet_id, name, sheet_range)
+
+    def _cached_headers(self, spreadsheet_id: str, sheet_name: str) -> Optional[HeaderIndex]:
+        """Return a sheet's cached headers, or None if missing or expired."""
+        cached = self._header_cache.get((spreadsheet_id, sheet_name))
+        if cached and time.monotonic() - cached[1] < HEADER_CACHE_TTL_SECONDS:
+            return cached[0]
+        return None
+
+    def _cache_sheet_headers(
+        self, spreadsheet_id: str, sheet_name: str, sheet_range
+    ) -> HeaderIndex:
+        """Index the row-1 headers of a read range and cache them."""
+        headers = HeaderIndex(
+            str(cell.value) for cell in sheet_range.cells if cell.row == 1 and cell.value
+        )
+        self._header_cache[(spreadsheet_id, sheet_name)] = (headers, time.monotonic())
+        return headers
+
+    def invalidate_headers(self, spreadsheet_id: str, sheet_name: Optional[str] = None):
+        """
+        Drop cached headers after a spreadsheet (or one of its sheets) changed.
+
+        Args:
+            spreadsheet_id: The spreadsheet whose headers changed
+            sheet_name: Only drop this sheet's entries (all sheets if None)
+        """
+        for key in list(self._header_cache):
+            if key[0] == spreadsheet_id and (sheet_name is None or key[1] == sheet_name):
+                del self._header_cache[key]
+
     async def preview_mappings(
         self,
         formula: str,
@@ -287,35 +437,26 @@ class PlaceholderResolver:
         potential_mappings = {}
         requires_disambiguation = []
 
+        # Read the headers of every referenced sheet in one batched request
+        header_placeholder_types = (PlaceholderType.HEADER, PlaceholderType.CROSS_SHEET)
+        self._prefetch_sheet_headers(
+            spreadsheet_id,
+            [p.sheet or sheet_name for p in placeholders if p.type in header_placeholder_types],
+        )
+
         for placeholder in placeholders:
-            if placeholder.type in (PlaceholderType.HEADER, PlaceholderType.CROSS_SHEET):
+            if placeholder.type in header_placeholder_types:
                 # Get all headers in the sheet to find potential matches
                 target_sheet = placeholder.sheet if placeholder.sheet else sheet_name
 
                 try:
-                    # Read first few rows to get headers
-                    sheet_range = self.sheets_client.read_range(
-                        spreadsheet_id, f"{target_sheet}!1:10"
-                    )
-
-                    # Extract unique values from first row (headers)
-                    headers = set()
-                    for cell in sheet_range.cells:
-                        if cell.row == 1 and cell.value:
-                            headers.add(str(cell.value))
-
-                    # Find fuzzy matches
-                    matches = []
-                    for header in headers:
-                        score = fuzzy_match_score(placeholder.name, header)
-                        if score > 0.5:  # Threshold for potential match
-                            matches.append(header)
-
-                    potential_mappings[placeholder.syntax] = sorted(
-                        matches,
-                        key=lambda h: fuzzy_match_score(placeholder.name, h),
-                        reverse=True,
-                    )
+                    headers = self._get_sheet_headers(spreadsheet_id, target_sheet)
+
+                    # Find fuzzy matches (scored once each, best first)
+                    matches = [
+                        header for header, _ in rank_header_matches(placeholder.name, headers)
+                    ]
+                    potential_mappings[placeholder.syntax] = matches
 
                     # Check if disambiguation needed
                     if len(matches) > 1:
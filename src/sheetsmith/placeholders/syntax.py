@@ -1,7 +1,8 @@
 """Placeholder syntax definitions and patterns."""
 
 import re
-from typing import Pattern
+from operator import itemgetter
+from typing import Iterable, Mapping, Optional, Pattern, Union
 
 # Placeholder syntax patterns
 # {{header_name}} - Column by header name (current row)
@@ -21,6 +22,38 @@ ANY_PLACEHOLDER_PATTERN: Pattern = re.compile(
     r"(?:'[^']+'!|\w+!)?\{\{[^{}:]+(?::[^{}:]+)?\}\}|\$\{[^{}]+\}"
 )
 
+# Single-pass tokenizer: one alternation whose outer named group identifies the
+# placeholder type (read via ``match.lastgroup``), so each placeholder costs one
+# regex scan instead of a detection pass plus up to four per-type match attempts.
+# Alternatives are ordered by precedence: cross-sheet, intersection, header, variable.
+PLACEHOLDER_TOKEN_PATTERN: Pattern = re.compile(
+    r"(?P<cross_sheet>(?:'(?P<quoted_sheet>[^']+)'!|(?P<bare_sheet>\w+)!)"
+    r"\{\{(?P<cross_name>[^{}:]+(?::[^{}:]+)?)\}\})"
+    r"|(?P<intersection>\{\{(?P<intersection_name>[^{}:]+):(?P<row_label>[^{}:]+)\}\})"
+    r"|(?P<header>\{\{(?P<header_name>[^{}:]+)\}\})"
+    r"|(?P<variable>\$\{(?P<variable_name>[^{}]+)\})"
+)
+
+# Runs of 2+ braces for validation. A run of n braces holds n // 2 non-overlapping
+# "{{" / "}}" pairs, and an opening run followed (after optional whitespace) by a
+# closing run is an empty placeholder, so one finditer pass covers both checks.
+BRACKET_RUN_PATTERN: Pattern = re.compile(
+    r"(?P<open>\{{2,})(?:\s*(?P<empty_close>\}{2,}))?|(?P<close>\}{2,})"
+)
+
+# Valid placeholder name: a letter followed by alphanumerics, underscores or spaces
+PLACEHOLDER_NAME_PATTERN: Pattern = re.compile(r"^[A-Za-z][A-Za-z0-9_\s]*$")
+
+
+def has_placeholder_delimiters(formula: str) -> bool:
+    """
+    Cheap pre-check: can this formula contain a placeholder at all?
+
+    Every placeholder starts with "{{" or "${", and two substring tests are
+    much cheaper than any regex scan on the common no-placeholder path.
+    """
+    return "{{" in formula or "${" in formula
+
 
 def normalize_name(name: str) -> str:
     """
@@ -48,9 +81,90 @@ def fuzzy_match_score(placeholder_name: str, header_text: str) -> float:
         Score from 0.0 to 1.0, where 1.0 is exact match
     """
     # Normalize both strings
+    return _normalized_match_score(normalize_name(placeholder_name), normalize_name(header_text))
+
+
+def normalize_headers(headers: Iterable[str]) -> dict[str, str]:
+    """
+    Normalize header texts once, for reuse across many placeholder lookups.
+
+    Returns:
+        Dict mapping each original header to its normalized form
+    """
+    return {header: normalize_name(header) for header in headers}
+
+
+class HeaderIndex:
+    """
+    A sheet's headers prepared once for repeated rank_header_matches calls.
+
+    Keeps each header's normalized form and character set, so ranking a
+    placeholder does no per-header preprocessing.
+    """
+
+    def __init__(self, headers: Union[Iterable[str], Mapping[str, str]]):
+        normalized = headers if isinstance(headers, Mapping) else normalize_headers(headers)
+        self.entries: list[tuple[str, str, frozenset[str]]] = [
+            (header, norm_header, frozenset(norm_header))
+            for header, norm_header in normalized.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def rank_header_matches(
+    placeholder_name: str,
+    headers: Union[Iterable[str], Mapping[str, str], HeaderIndex],
+    threshold: float = 0.5,
+) -> list[tuple[str, float]]:
+    """
+    Score all headers against a placeholder name in one batch.
+
+    The placeholder name is normalized once for the whole batch and each
+    header is scored exactly once.
+
+    Args:
+        placeholder_name: The placeholder name to match
+        headers: Candidate header texts, a mapping of header to its
+            normalized form (see normalize_headers), or a prebuilt HeaderIndex
+        threshold: Only headers scoring above this are returned
+
+    Returns:
+        (header, score) pairs above the threshold, best match first
+    """
+    if not isinstance(headers, HeaderIndex):
+        headers = HeaderIndex(headers)
+
     norm_placeholder = normalize_name(placeholder_name)
-    norm_header = normalize_name(header_text)
+    placeholder_chars = frozenset(norm_placeholder)
+    scored = []
+    for header, norm_header, header_chars in headers.entries:
+        score = _normalized_match_score(
+            norm_placeholder, norm_header, threshold, placeholder_chars, header_chars
+        )
+        if score > threshold:
+            scored.append((header, score))
+
+    # Each header was scored once above; sort on the stored score (stable, so
+    # equal scores keep sheet order)
+    scored.sort(key=itemgetter(1), reverse=True)
+    return scored
+
+
+def _normalized_match_score(
+    norm_placeholder: str,
+    norm_header: str,
+    threshold: float = 0.0,
+    placeholder_chars: Optional[frozenset[str]] = None,
+    header_chars: Optional[frozenset[str]] = None,
+) -> float:
+    """
+    Fuzzy match score of two already-normalized names (see fuzzy_match_score).
 
+    Scores that provably cannot exceed ``threshold`` may be returned as 0.0.
+    The character sets of either name can be passed in when already known.
+    """
     # Exact match after normalization
     if norm_placeholder == norm_header:
         return 1.0
@@ -63,12 +177,22 @@ def fuzzy_match_score(placeholder_name: str, header_text: str) -> float:
         return 0.85
 
     # Calculate simple similarity based on common characters
-    common = set(norm_placeholder) & set(norm_header)
-    max_len = max(len(norm_placeholder), len(norm_header))
+    min_len, max_len = sorted((len(norm_placeholder), len(norm_header)))
 
     if max_len == 0:
         return 0.0
 
+    # Length filter: at most min_len characters are shared, so names of very
+    # different lengths cannot pass the threshold; skip building the sets
+    if min_len * 0.7 <= threshold * max_len:
+        return 0.0
+
+    if placeholder_chars is None:
+        placeholder_chars = frozenset(norm_placeholder)
+    if header_chars is None:
+        header_chars = frozenset(norm_header)
+    common = placeholder_chars & header_chars
+
     return len(common) / max_len * 0.7
 
 
@@ -98,4 +222,4 @@ def is_valid_placeholder_name(name: str) -> bool:
         return False
 
     # Can only contain alphanumeric, underscore, and space
-    return bool(re.match(r"^[A-Za-z][A-Za-z0-9_\s]*$", clean_name))
+    return bool(PLACEHOLDER_NAME_PATTERN.match(clean_name))
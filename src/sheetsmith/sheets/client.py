@@ -1,14 +1,21 @@
 """Google Sheets API client."""
 
+import copy
+import functools
 import logging
 import re
-from typing import Optional
+import string
+import sys
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from pydantic import TypeAdapter
 
 from ..config import settings
 from .models import (
@@ -24,7 +31,36 @@ logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+# Bulk validator for the cells of one range
+_CELL_DATA_LIST = TypeAdapter(list[CellData])
 
+# read_range cell filter: (row, 0-based col, value, formula) -> keep the cell?
+CellFilter = Callable[[int, int, Any, Optional[str]], bool]
+
+# How long get_spreadsheet_info results are reused
+SPREADSHEET_INFO_TTL_SECONDS = 60
+
+# Spreadsheets whose info is cached at once; oldest evicted first
+SPREADSHEET_INFO_MAX_ENTRIES = 32
+
+# Field mask for grid reads: only what read_range needs from each cell
+GRID_DATA_FIELDS = (
+    "sheets(data(startRow,startColumn,rowData.values(formattedValue,userEnteredValue)))"
+)
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_ASCII_DIGITS = frozenset(string.digits)
+
+# Characters that make a search pattern more than literal text
+_REGEX_META_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Delete table for bytes.translate: every byte except ASCII 0-9
+_NON_DIGIT_BYTES = bytes(i for i in range(256) if not 48 <= i <= 57)
+
+
+# The A1 helpers below run once per cell in read and search loops but see a
+# small recurring set of inputs, so they are memoized (bounded LRU).
+@functools.lru_cache(maxsize=4096)
 def col_letter_to_index(col: str) -> int:
     """Convert column letter(s) to 0-based index. A=0, B=1, ..., Z=25, AA=26, etc."""
     result = 0
@@ -33,6 +69,7 @@ def col_letter_to_index(col: str) -> int:
     return result - 1
 
 
+@functools.lru_cache(maxsize=4096)
 def index_to_col_letter(index: int) -> str:
     """Convert 0-based index to column letter(s)."""
     result = ""
@@ -44,20 +81,91 @@ def index_to_col_letter(index: int) -> str:
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_cell_notation(cell: str) -> tuple[str, int]:
     """Parse A1 notation into column letters and row number."""
-    match = re.match(r"([A-Za-z]+)(\d+)", cell)
-    if not match:
+    # A hand-written scan: the grammar is letters then digits, and this is
+    # cheaper than a regex match on a cache miss. Trailing text is ignored.
+    end = len(cell)
+    split = 0
+    while split < end and cell[split] in _ASCII_LETTERS:
+        split += 1
+    stop = split
+    while stop < end and cell[stop] in _ASCII_DIGITS:
+        stop += 1
+    if split == 0 or stop == split:
         raise ValueError(f"Invalid cell notation: {cell}")
-    return match.group(1).upper(), int(match.group(2))
+    return cell[:split].upper(), int(cell[split:stop])
+
+
+def parse_range_start(cell: str) -> tuple[str, int]:
+    """
+    Parse the start of an A1 range into column letters and row number.
+
+    Unlike parse_cell_notation this also accepts whole-row ("3") and
+    whole-column ("C") starts, defaulting to column A and row 1.
+    """
+    match = re.match(r"([A-Za-z]*)(\d*)$", cell)
+    if not match or not cell:
+        raise ValueError(f"Invalid range start: {cell}")
+    return (match.group(1).upper() or "A"), int(match.group(2) or 1)
+
+
+def literal_prefilter(pattern: str, case_sensitive: bool) -> Optional[Callable[[str], bool]]:
+    """
+    Build a cheap substring check that rules out formulas a literal pattern cannot match.
+
+    Most formula searches are plain text, where a substring test is several
+    times faster than a regex search. The check never rejects a formula the
+    regex would match: case-insensitive folding is only trusted for ASCII
+    formulas, and anything else is passed through to the regex.
+
+    Returns:
+        The check, or None if the pattern uses regex syntax
+    """
+    if not pattern.isascii() or any(char in _REGEX_META_CHARS for char in pattern):
+        return None
+    if case_sensitive:
+        return lambda text: pattern in text
+    needle = pattern.lower()
+    return lambda text: not text.isascii() or needle in text.lower()
+
+
+def _iter_formulas(value_range: dict, range_notation: str) -> Iterator[tuple[int, int, str]]:
+    """Yield (row, 0-based col, formula) for each formula cell of a FORMULA-rendered ValueRange."""
+    values = value_range.get("values", [])
+    if not values:
+        return
+    range_part = value_range.get("range", range_notation).split("!")[-1]
+    start_col, start_row = parse_range_start(range_part.split(":")[0])
+    start_col_idx = col_letter_to_index(start_col)
+    for row_idx, row_values in enumerate(values, start_row):
+        for col_idx, value in enumerate(row_values, start_col_idx):
+            if isinstance(value, str) and value.startswith("="):
+                yield row_idx, col_idx, value
+
+
+def cell_row_number(cell: str) -> Optional[int]:
+    """Extract the row number from A1 notation ("B12" -> 12), or None if absent.
+
+    Uses a single C-level ``bytes.translate`` pass instead of a per-character
+    ``filter(str.isdigit, ...)``; non-ASCII characters are ignored.
+    """
+    digits = cell.encode("ascii", errors="ignore").translate(None, _NON_DIGIT_BYTES)
+    return int(digits) if digits else None
 
 
 class GoogleSheetsClient:
     """Client for interacting with Google Sheets API."""
 
     def __init__(self):
-        self._service = None
         self._credentials = None
+        self._credentials_lock = threading.Lock()
+        # httplib2 (used by googleapiclient) is not thread-safe, so each thread
+        # gets its own service object; the credentials are shared.
+        self._local = threading.local()
+        # spreadsheet_id -> (spreadsheet info, cached at)
+        self._info_cache: dict[str, tuple[dict, float]] = {}
 
     def _get_credentials(self) -> Credentials:
         """Get or refresh OAuth2 credentials."""
@@ -89,23 +197,43 @@ class GoogleSheetsClient:
 
     @property
     def service(self):
-        """Get or create the Sheets API service."""
-        if self._service is None:
-            self._credentials = self._get_credentials()
-            self._service = build("sheets", "v4", credentials=self._credentials)
-        return self._service
+        """Get or create the Sheets API service for the calling thread."""
+        service = getattr(self._local, "service", None)
+        if service is None:
+            with self._credentials_lock:
+                if self._credentials is None:
+                    self._credentials = self._get_credentials()
+            service = build("sheets", "v4", credentials=self._credentials)
+            self._local.service = service
+        return service
 
     def get_spreadsheet_info(self, spreadsheet_id: str) -> dict:
-        """Get basic information about a spreadsheet."""
+        """
+        Get basic information about a spreadsheet.
+
+        The result is cached per spreadsheet for SPREADSHEET_INFO_TTL_SECONDS
+        (for at most SPREADSHEET_INFO_MAX_ENTRIES spreadsheets) and callers get
+        their own copy. Only batch_update invalidates the cache,
+        so sheets added, removed or resized outside this client can go unseen
+        until the TTL expires; call invalidate_info to force a fresh read.
+        """
+        cached = self._info_cache.get(spreadsheet_id)
+        if cached:
+            if time.monotonic() - cached[1] < SPREADSHEET_INFO_TTL_SECONDS:
+                return copy.deepcopy(cached[0])
+            del self._info_cache[spreadsheet_id]
+
         try:
             result = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-            return {
+            info = {
                 "id": result["spreadsheetId"],
                 "title": result["properties"]["title"],
                 "sheets": [
                     {
                         "id": sheet["properties"]["sheetId"],
-                        "title": sheet["properties"]["title"],
+                        # Interned, like the names parsed in _build_sheet_range, so
+                        # every record naming a sheet shares one string
+                        "title": sys.intern(sheet["properties"]["title"]),
                         "row_count": sheet["properties"]["gridProperties"]["rowCount"],
                         "col_count": sheet["properties"]["gridProperties"]["columnCount"],
                     }
@@ -115,20 +243,49 @@ class GoogleSheetsClient:
         except HttpError as e:
             raise RuntimeError(f"Failed to get spreadsheet info: {e}")
 
+        if len(self._info_cache) >= SPREADSHEET_INFO_MAX_ENTRIES:
+            del self._info_cache[next(iter(self._info_cache))]
+        self._info_cache[spreadsheet_id] = (info, time.monotonic())
+        return copy.deepcopy(info)
+
+    def invalidate_info(self, spreadsheet_id: Optional[str] = None):
+        """Drop cached spreadsheet info for one spreadsheet, or all of them."""
+        if spreadsheet_id is None:
+            self._info_cache.clear()
+        else:
+            self._info_cache.pop(spreadsheet_id, None)
+
     def read_range(
         self,
         spreadsheet_id: str,
         range_notation: str,
         include_formulas: bool = True,
+        cell_filter: Optional[CellFilter] = None,
     ) -> SheetRange:
-        """Read values and optionally formulas from a range."""
-        try:
-            # Parse sheet name from range
-            if "!" in range_notation:
-                sheet_name = range_notation.split("!")[0].strip("'")
+        """
+        Read values and optionally formulas from a range.
+
+        Args:
+            cell_filter: Optional ``(row, col, value, formula) -> bool`` check;
+                only cells it accepts are built into the result, so callers
+                that need a few cells of a large range skip the rest cheaply
+
+        Returns:
+            SheetRange with the (accepted) non-empty cells
+        """
+        if include_formulas:
+            # Values and formulas in one request; fall back to two value GETs
+            # if the grid response cannot be read
+            try:
+                grid_results = self._get_grid_range(spreadsheet_id, range_notation)
+            except (HttpError, KeyError, IndexError) as e:
+                logger.debug(f"Grid read of {range_notation} failed, using values API: {e}")
             else:
-                sheet_name = "Sheet1"
+                return self._build_sheet_range(
+                    spreadsheet_id, range_notation, *grid_results, cell_filter=cell_filter
+                )
 
+        try:
             # Get values
             values_result = (
                 self.service.spreadsheets()
@@ -136,10 +293,9 @@ class GoogleSheetsClient:
                 .get(spreadsheetId=spreadsheet_id, range=range_notation)
                 .execute()
             )
-            values = values_result.get("values", [])
 
             # Get formulas if requested
-            formulas = []
+            formulas_result = {}
             if include_formulas:
                 formulas_result = (
                     self.service.spreadsheets()
@@ -151,48 +307,211 @@ class GoogleSheetsClient:
                     )
                     .execute()
                 )
-                formulas = formulas_result.get("values", [])
-
-            # Parse the starting cell from range
-            range_part = range_notation.split("!")[-1]
-            start_cell = range_part.split(":")[0]
-            start_col, start_row = parse_cell_notation(start_cell)
-            start_col_idx = col_letter_to_index(start_col)
-
-            # Build cell data
-            cells = []
-            for row_idx, row_values in enumerate(values):
-                for col_idx, value in enumerate(row_values):
-                    abs_row = start_row + row_idx
-                    abs_col = start_col_idx + col_idx
-                    cell_notation = f"{index_to_col_letter(abs_col)}{abs_row}"
-
-                    formula = None
-                    if formulas and row_idx < len(formulas) and col_idx < len(formulas[row_idx]):
-                        formula_value = formulas[row_idx][col_idx]
-                        if isinstance(formula_value, str) and formula_value.startswith("="):
-                            formula = formula_value
-
-                    cells.append(
-                        CellData(
-                            sheet_name=sheet_name,
-                            cell=cell_notation,
-                            row=abs_row,
-                            col=abs_col,
-                            value=value,
-                            formula=formula,
-                        )
-                    )
 
+            return self._build_sheet_range(
+                spreadsheet_id,
+                range_notation,
+                values_result,
+                formulas_result,
+                cell_filter=cell_filter,
+            )
+
+        except HttpError as e:
+            raise RuntimeError(f"Failed to read range: {e}")
+
+    def _get_grid_range(self, spreadsheet_id: str, range_notation: str) -> tuple[dict, dict]:
+        """
+        Fetch a range's values and formulas with one spreadsheets.get call.
+
+        The grid data is reshaped into a pair of ValueRange-like dicts (the
+        formatted values and the formulas), trimmed of trailing empty cells
+        and rows the way the values API trims them.
+        """
+        result = (
+            self.service.spreadsheets()
+            .get(
+                spreadsheetId=spreadsheet_id,
+                ranges=[range_notation],
+                includeGridData=True,
+                fields=GRID_DATA_FIELDS,
+            )
+            .execute()
+        )
+        grid = result["sheets"][0]["data"][0]
+
+        values = []
+        formulas = []
+        for row_data in grid.get("rowData", []):
+            row_values = []
+            row_formulas = []
+            for cell in row_data.get("values", []):
+                row_values.append(cell.get("formattedValue", ""))
+                row_formulas.append(cell.get("userEnteredValue", {}).get("formulaValue", ""))
+            while row_values and row_values[-1] == "":
+                row_values.pop()
+            values.append(row_values)
+            formulas.append(row_formulas)
+        while values and not values[-1]:
+            values.pop()
+
+        start = f"{index_to_col_letter(grid.get('startColumn', 0))}{grid.get('startRow', 0) + 1}"
+        return {"range": start, "values": values}, {"values": formulas}
+
+    def batch_read_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        include_formulas: bool = True,
+        cell_filter: Optional[CellFilter] = None,
+    ) -> list[SheetRange]:
+        """
+        Read several ranges with a single values.batchGet request.
+
+        With formulas this is two requests in total (values, then formulas),
+        regardless of how many ranges are read. ``cell_filter`` works as in
+        read_range.
+
+        Returns:
+            One SheetRange per requested range, in request order
+        """
+        if not ranges:
+            return []
+
+        try:
+            value_ranges = self._batch_get(spreadsheet_id, ranges)
+            formula_ranges = (
+                self._batch_get(spreadsheet_id, ranges, value_render_option="FORMULA")
+                if include_formulas
+                else [{}] * len(ranges)
+            )
+        except HttpError as e:
+            raise RuntimeError(f"Failed to read ranges: {e}")
+
+        return [
+            self._build_sheet_range(
+                spreadsheet_id, range_notation, values, formulas, cell_filter=cell_filter
+            )
+            for range_notation, values, formulas in zip(ranges, value_ranges, formula_ranges)
+        ]
+
+    def _batch_get(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> list[dict]:
+        """Fetch the ValueRange objects of several ranges in one request."""
+        result = (
+            self.service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                valueRenderOption=value_render_option,
+            )
+            .execute()
+        )
+        return result.get("valueRanges", [])
+
+    def _batch_get_isolated(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> list[Optional[dict]]:
+        """
+        Fetch several ranges in one request, falling back to one request per range.
+
+        A single bad range (e.g. a sheet renamed or deleted since its info was
+        cached) fails the whole batchGet; the fallback keeps the other ranges
+        and yields None for each range that still cannot be read.
+        """
+        try:
+            return self._batch_get(spreadsheet_id, ranges, value_render_option)
+        except Exception as e:
+            logger.warning(f"Batched read of {len(ranges)} ranges failed, reading each: {e}")
+
+        results: list[Optional[dict]] = []
+        for range_notation in ranges:
+            try:
+                value_ranges = self._batch_get(
+                    spreadsheet_id, [range_notation], value_render_option
+                )
+            except Exception as e:
+                logger.warning(f"Skipping unreadable range {range_notation}: {e}")
+                results.append(None)
+            else:
+                results.append(value_ranges[0] if value_ranges else {})
+        return results
+
+    def _build_sheet_range(
+        self,
+        spreadsheet_id: str,
+        range_notation: str,
+        values_result: dict,
+        formulas_result: dict,
+        cell_filter: Optional[CellFilter] = None,
+    ) -> SheetRange:
+        """Build a SheetRange from the values and (optional) formulas ValueRanges."""
+        # Parse sheet name from range; interned so cells from separate reads
+        # share one name object (cheap set/dict keys downstream)
+        if "!" in range_notation:
+            sheet_name = sys.intern(range_notation.split("!")[0].strip("'"))
+        else:
+            sheet_name = "Sheet1"
+
+        values = values_result.get("values", [])
+        if not values:
             return SheetRange(
                 spreadsheet_id=spreadsheet_id,
                 sheet_name=sheet_name,
                 range_notation=range_notation,
-                cells=cells,
+                cells=[],
             )
+        formulas = formulas_result.get("values", [])
+
+        # Parse the starting cell from the range the API resolved (it always
+        # names a start cell, also for whole-row or whole-column requests)
+        range_part = values_result.get("range", range_notation).split("!")[-1]
+        start_cell = range_part.split(":")[0]
+        start_col, start_row = parse_range_start(start_cell)
+        start_col_idx = col_letter_to_index(start_col)
+
+        # Build cell data
+        raw_cells = []
+        for row_idx, row_values in enumerate(values):
+            for col_idx, value in enumerate(row_values):
+                abs_row = start_row + row_idx
+                abs_col = start_col_idx + col_idx
+
+                formula = None
+                if formulas and row_idx < len(formulas) and col_idx < len(formulas[row_idx]):
+                    formula_value = formulas[row_idx][col_idx]
+                    if isinstance(formula_value, str) and formula_value.startswith("="):
+                        formula = formula_value
+
+                if cell_filter is not None and not cell_filter(abs_row, abs_col, value, formula):
+                    continue
+
+                raw_cells.append(
+                    {
+                        "sheet_name": sheet_name,
+                        "cell": f"{index_to_col_letter(abs_col)}{abs_row}",
+                        "row": abs_row,
+                        "col": abs_col,
+                        "value": value,
+                        "formula": formula,
+                    }
+                )
 
-        except HttpError as e:
-            raise RuntimeError(f"Failed to read range: {e}")
+        return SheetRange(
+            spreadsheet_id=spreadsheet_id,
+            sheet_name=sheet_name,
+            range_notation=range_notation,
+            # One pydantic-core call for the whole list is cheaper than
+            # per-cell CellData(...) calls (model_construct is slower still)
+            cells=_CELL_DATA_LIST.validate_python(raw_cells),
+        )
 
     def search_formulas(
         self,
@@ -213,43 +532,58 @@ class GoogleSheetsClient:
             compiled_pattern = re.compile(pattern, regex_flags)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern: {e}")
-
-        for sheet in info["sheets"]:
-            if sheet["title"] not in sheets_to_search:
-                continue
-
+        might_match = literal_prefilter(pattern, case_sensitive)
+
+        # An empty grid has no valid A1 range (A1:<row> would fail the batch)
+        sheets = [
+            s
+            for s in info["sheets"]
+            if s["title"] in sheets_to_search and s["col_count"] > 0 and s["row_count"] > 0
+        ]
+        for sheet in sheets:
             logger.info(
                 f"Scanning sheet '{sheet['title']}' - dimensions: "
                 f"{sheet['row_count']}x{sheet['col_count']}"
             )
 
-            # Read the entire sheet
-            range_notation = f"'{sheet['title']}'!A1:{index_to_col_letter(sheet['col_count'] - 1)}{sheet['row_count']}"
-            logger.debug(f"Range notation: {range_notation}")
+        # Read the formulas of all sheets in one batchGet request; only the
+        # FORMULA rendering is needed to match formulas
+        ranges = []
+        for sheet in sheets:
+            last_col = index_to_col_letter(sheet["col_count"] - 1)
+            ranges.append(f"'{sheet['title']}'!A1:{last_col}{sheet['row_count']}")
+        logger.debug(f"Range notations: {ranges}")
 
-            try:
-                sheet_data = self.read_range(spreadsheet_id, range_notation, include_formulas=True)
-            except Exception:
-                continue
+        formula_ranges = self._batch_get_isolated(
+            spreadsheet_id, ranges, value_render_option="FORMULA"
+        )
 
-            for cell in sheet_data.formulas:
-                if cell.formula:
-                    match = compiled_pattern.search(cell.formula)
-                    if match:
-                        matches.append(
-                            FormulaMatch(
-                                spreadsheet_id=spreadsheet_id,
-                                sheet_name=sheet["title"],
-                                cell=cell.cell,
-                                row=cell.row,
-                                col=cell.col,
-                                formula=cell.formula,
-                                matched_text=match.group(0),
-                            )
+        for sheet, range_notation, formula_range in zip(sheets, ranges, formula_ranges):
+            if formula_range is None:
+                continue
+            sheet_match_count = 0
+
+            # Scan the raw rows: a CellData is never built for a cell, and A1
+            # notation is only computed for the formulas that match
+            for row, col, formula in _iter_formulas(formula_range, range_notation):
+                if might_match is not None and not might_match(formula):
+                    continue
+                match = compiled_pattern.search(formula)
+                if match:
+                    sheet_match_count += 1
+                    matches.append(
+                        FormulaMatch(
+                            spreadsheet_id=spreadsheet_id,
+                            sheet_name=sheet["title"],
+                            cell=f"{index_to_col_letter(col)}{row}",
+                            row=row,
+                            col=col,
+                            formula=formula,
+                            matched_text=match.group(0),
                         )
+                    )
 
-            sheet_matches = [m for m in matches if m.sheet_name == sheet["title"]]
-            logger.info(f"Found {len(sheet_matches)} matching formulas in sheet '{sheet['title']}'")
+            logger.info(f"Found {sheet_match_count} matching formulas in sheet '{sheet['title']}'")
 
         return matches
 
@@ -285,6 +619,9 @@ class GoogleSheetsClient:
                 .batchUpdate(spreadsheetId=batch.spreadsheet_id, body=body)
                 .execute()
             )
+            # Writes past the grid edge grow the sheet, so row/column counts
+            # in the cached info may be stale
+            self.invalidate_info(batch.spreadsheet_id)
 
             return UpdateResult(
                 success=True,
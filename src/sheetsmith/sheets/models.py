@@ -1,7 +1,11 @@
 """Data models for Google Sheets operations."""
 
-from typing import Any, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Iterable, Optional
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+# str.translate table reducing an A1 cell reference to its column letters
+# ("$AB$12" -> "AB") in one C-level pass
+_COLUMN_LETTERS_TABLE = str.maketrans("", "", "0123456789$")
 
 
 class CellData(BaseModel):
@@ -17,7 +21,7 @@ class CellData(BaseModel):
 
     @property
     def has_formula(self) -> bool:
-        return self.formula is not None and self.formula.startswith("=")
+        return bool(self.formula) and self.formula[0] == "="
 
 
 class SheetRange(BaseModel):
@@ -30,8 +34,14 @@ class SheetRange(BaseModel):
 
     @property
     def formulas(self) -> list[CellData]:
-        """Return only cells that contain formulas."""
-        return [cell for cell in self.cells if cell.has_formula]
+        """Return only cells that contain formulas.
+
+        Rescans ``cells`` on every access; callers needing the list more than
+        once should keep a local reference.
+        """
+        # Same check as CellData.has_formula, inlined: this scans every cell
+        # and a property call per cell costs more than the check itself
+        return [cell for cell in self.cells if cell.formula and cell.formula[0] == "="]
 
 
 class FormulaMatch(BaseModel):
@@ -84,6 +94,16 @@ class BatchUpdate(BaseModel):
             )
         )
 
+    def add_updates(self, updates: Iterable[dict]):
+        """
+        Add many cell updates at once.
+
+        Each dict holds CellUpdate fields. The whole list is validated in one
+        pydantic-core call, which is cheaper than one add_update per cell
+        (and than model_construct, which skips validation but is slower).
+        """
+        self.updates.extend(_CELL_UPDATE_LIST.validate_python(list(updates)))
+
     def get_statistics(self) -> dict:
         """Calculate statistics about this batch update."""
         if not self.updates:
@@ -95,24 +115,25 @@ class BatchUpdate(BaseModel):
                 "column_count": 0,
             }
 
-        sheets = set()
-        columns = set()
-
-        for update in self.updates:
-            sheets.add(update.sheet_name)
-            # Extract column from cell notation (e.g., "A1" -> "A")
-            col = "".join(c for c in update.cell if c.isalpha())
-            columns.add(col)
+        sheets = {update.sheet_name for update in self.updates}
+        # Extract column from cell notation (e.g., "A1" -> "A", "$B$2" -> "B").
+        # One translate over the joined references beats a call per cell.
+        cells = "\n".join([update.cell for update in self.updates])
+        columns = set(cells.translate(_COLUMN_LETTERS_TABLE).split("\n"))
 
         return {
             "total_cells": len(self.updates),
-            "affected_sheets": sorted(list(sheets)),
-            "affected_columns": sorted(list(columns)),
+            "affected_sheets": sorted(sheets),
+            "affected_columns": sorted(columns),
             "sheet_count": len(sheets),
             "column_count": len(columns),
         }
 
 
+# Bulk validator used by BatchUpdate.add_updates
+_CELL_UPDATE_LIST = TypeAdapter(list[CellUpdate])
+
+
 class UpdateResult(BaseModel):
     """Result of applying updates."""
 
@@ -123,22 +144,43 @@ class UpdateResult(BaseModel):
     details: list[dict] = Field(default_factory=list)
 
 
+class PatchChange(BaseModel):
+    """A single cell change within a patch."""
+
+    sheet: str
+    cell: str  # A1 notation
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+    @field_validator("old", "new", mode="before")
+    @classmethod
+    def _stringify_constants(cls, value: Any) -> Any:
+        # Changes come straight from LLM tool input, where constant cells may
+        # arrive as numbers or booleans; render them as the diff shows them
+        if value is None or isinstance(value, str):
+            return value
+        return str(value)
+
+
 class Patch(BaseModel):
     """Represents a proposed change to formulas."""
 
     id: str
     spreadsheet_id: str
     description: str
-    changes: list[dict] = Field(default_factory=list)  # List of {cell, old, new}
+    # Plain {sheet, cell, old, new} dicts are accepted and validated into PatchChange
+    changes: list[PatchChange] = Field(default_factory=list)
     created_at: str
     status: str = "pending"  # pending, approved, applied, rejected
 
     def to_diff_string(self) -> str:
         """Generate a human-readable diff."""
-        lines = [f"Patch: {self.description}", f"Spreadsheet: {self.spreadsheet_id}", ""]
-        for change in self.changes:
-            lines.append(f"--- {change['sheet']}!{change['cell']}")
-            lines.append(f"-  {change['old']}")
-            lines.append(f"+  {change['new']}")
-            lines.append("")
-        return "\n".join(lines)
+        # One formatted block per change instead of four list appends; each
+        # block opens with the blank line separating it from the previous one
+        header = f"Patch: {self.description}\nSpreadsheet: {self.spreadsheet_id}\n"
+        return header + "".join(
+            [
+                f"\n--- {change.sheet}!{change.cell}\n-  {change.old}\n+  {change.new}\n"
+                for change in self.changes
+            ]
+        )
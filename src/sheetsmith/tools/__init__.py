@@ -1,8 +1,36 @@
 """MCP-style tools for the SheetSmith agent."""
 
-from .gsheets import GSheetsTools
-from .memory import MemoryTools
-from .formula import FormulaTools
-from .registry import ToolRegistry, Tool
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .formula import FormulaTools
+    from .gsheets import GSheetsTools
+    from .memory import MemoryTools
+    from .registry import Tool, ToolRegistry
+
+# Exported name -> submodule defining it; loaded on first access so that
+# importing the registry does not pull in the Google Sheets client stack
+_EXPORTS = {
+    "GSheetsTools": ".gsheets",
+    "MemoryTools": ".memory",
+    "FormulaTools": ".formula",
+    "ToolRegistry": ".registry",
+    "Tool": ".registry",
+}
 
 __all__ = ["GSheetsTools", "MemoryTools", "FormulaTools", "ToolRegistry", "Tool"]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,19 +1,42 @@
 """Formula replacement tools for the agent."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from ..sheets import GoogleSheetsClient
-from ..engine import DeterministicReplacer, ReplacementPlan
 from ..engine.safety import SafetyValidator
 from .registry import Tool, ToolParameter, ToolRegistry
 
+if TYPE_CHECKING:
+    from ..engine import DeterministicReplacer
+    from ..sheets import GoogleSheetsClient
+
 
 class FormulaTools:
     """Formula manipulation tools that can be registered with the agent."""
 
-    def __init__(self, client: Optional[GoogleSheetsClient] = None):
-        self.client = client or GoogleSheetsClient()
-        self.replacer = DeterministicReplacer(self.client)
+    def __init__(self, client: Optional["GoogleSheetsClient"] = None):
+        # Client and replacer are built on first use, so registering the
+        # tools (or just reading their metadata) stays cheap
+        self._client = client
+        self._replacer: Optional["DeterministicReplacer"] = None
+        self._validator = SafetyValidator()
+
+    @property
+    def client(self) -> "GoogleSheetsClient":
+        """The Sheets client, created on first access if none was given."""
+        if self._client is None:
+            from ..sheets import GoogleSheetsClient
+
+            self._client = GoogleSheetsClient()
+        return self._client
+
+    @property
+    def replacer(self) -> "DeterministicReplacer":
+        """The deterministic replacer, created on first access."""
+        if self._replacer is None:
+            from ..engine import DeterministicReplacer
+
+            self._replacer = DeterministicReplacer(self.client)
+        return self._replacer
 
     def register(self, registry: ToolRegistry):
         """Register all formula tools with the registry."""
@@ -40,6 +63,8 @@ class FormulaTools:
             This tool bypasses LLM for the actual replacement operation,
             using direct string/regex replacement for efficiency.
             """
+            from ..engine import ReplacementPlan
+
             plan = ReplacementPlan(
                 action="replace",
                 search_pattern=search_pattern,
@@ -58,12 +83,17 @@ class FormulaTools:
                 description=description,
             )
 
-            # Add safety validation to response
-            validator = SafetyValidator()
-            is_safe, violations = validator.validate_operation(
-                cells_affected=result.cells_updated if not dry_run else result.matches_found,
-                sheets_affected=len(result.affected_sheets),
-            )
+            # Add safety validation to response. A replacement that failed
+            # before matching anything has nothing to validate; failures with
+            # matches (e.g. a rejected dry run) still report their violations.
+            if result.success or result.matches_found:
+                is_safe, violations = self._validator.validate_operation(
+                    cells_affected=result.cells_updated if not dry_run else result.matches_found,
+                    sheets_affected=len(result.affected_sheets),
+                )
+                requires_preview = self._validator.requires_preview(result.matches_found)
+            else:
+                is_safe, violations, requires_preview = True, [], False
 
             return {
                 "success": result.success,
@@ -84,7 +114,7 @@ class FormulaTools:
                         }
                         for v in violations
                     ],
-                    "requires_preview": validator.requires_preview(result.matches_found)
+                    "requires_preview": requires_preview,
                 },
                 "message": (
                     f"{'Preview:' if dry_run else 'Updated'} {result.cells_updated} cells "
@@ -1,23 +1,39 @@
 """Google Sheets tools for the agent."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from ..sheets import GoogleSheetsClient, BatchUpdate
+from ..sheets.models import BatchUpdate
 from .registry import Tool, ToolParameter, ToolRegistry
 
+if TYPE_CHECKING:
+    from ..sheets import GoogleSheetsClient
+
 
 class GSheetsTools:
     """Google Sheets tools that can be registered with the agent."""
 
-    def __init__(self, client: Optional[GoogleSheetsClient] = None):
-        self.client = client or GoogleSheetsClient()
+    def __init__(self, client: Optional["GoogleSheetsClient"] = None):
+        self._client = client
+
+    @property
+    def client(self) -> "GoogleSheetsClient":
+        """The Sheets client, created on first access if none was given."""
+        if self._client is None:
+            from ..sheets import GoogleSheetsClient
+
+            self._client = GoogleSheetsClient()
+        return self._client
 
     def register(self, registry: ToolRegistry):
         """Register all Google Sheets tools with the registry."""
-        registry.register(self._read_range_tool())
-        registry.register(self._search_formulas_tool())
-        registry.register(self._batch_update_tool())
-        registry.register(self._get_spreadsheet_info_tool())
+        registry.register_many(
+            (
+                self._read_range_tool(),
+                self._search_formulas_tool(),
+                self._batch_update_tool(),
+                self._get_spreadsheet_info_tool(),
+            )
+        )
 
     def _read_range_tool(self) -> Tool:
         """Create the read_range tool."""
@@ -33,6 +49,8 @@ class GSheetsTools:
                 "sheet_name": result.sheet_name,
                 "range": result.range_notation,
                 "cell_count": len(result.cells),
+                # Dict literals per cell: faster than attrgetter + dict(zip(...)),
+                # which builds an extra tuple and zip iterator for every cell
                 "cells": [
                     {
                         "cell": c.cell,
@@ -87,6 +105,8 @@ class GSheetsTools:
                 "spreadsheet_id": spreadsheet_id,
                 "pattern": pattern,
                 "match_count": len(matches),
+                # Built by hand: a TypeAdapter(list[FormulaMatch]).dump_python
+                # with an include set is ~4x slower for large match lists
                 "matches": [
                     {
                         "sheet": m.sheet_name,
@@ -143,13 +163,9 @@ class GSheetsTools:
                 spreadsheet_id=spreadsheet_id,
                 description=description,
             )
-            for update in updates:
-                batch.add_update(
-                    sheet_name=update["sheet_name"],
-                    cell=update["cell"],
-                    new_value=update.get("new_value"),
-                    new_formula=update.get("new_formula"),
-                )
+            # The update dicts come from the model, so they are validated
+            # (in one bulk call) rather than trusted via model_construct
+            batch.add_updates(updates)
 
             result = self.client.batch_update(batch)
             stats = batch.get_statistics()
@@ -6,6 +6,128 @@ import uuid
 from ..memory import MemoryStore, Rule, LogicBlock
 from .registry import Tool, ToolParameter, ToolRegistry
 
+# Parameter definitions are immutable, so they are built once at import and
+# shared by every MemoryTools instance
+_STORE_RULE_PARAMS = (
+    ToolParameter(
+        name="name",
+        type="string",
+        description="Short name for the rule",
+    ),
+    ToolParameter(
+        name="description",
+        type="string",
+        description="Detailed description of what the rule enforces",
+    ),
+    ToolParameter(
+        name="rule_type",
+        type="string",
+        description="Type of rule",
+        enum=("formula_style", "naming", "structure", "custom"),
+    ),
+    ToolParameter(
+        name="content",
+        type="string",
+        description="The actual rule content or pattern",
+    ),
+    ToolParameter(
+        name="examples",
+        type="array",
+        description="Example formulas or patterns that follow this rule",
+        required=False,
+    ),
+    ToolParameter(
+        name="tags",
+        type="array",
+        description="Tags for categorizing the rule",
+        required=False,
+    ),
+)
+
+_GET_RULES_PARAMS = (
+    ToolParameter(
+        name="rule_type",
+        type="string",
+        description="Filter by rule type",
+        required=False,
+        enum=("formula_style", "naming", "structure", "custom"),
+    ),
+    ToolParameter(
+        name="tags",
+        type="array",
+        description="Filter by tags",
+        required=False,
+    ),
+)
+
+_DELETE_RULE_PARAMS = (
+    ToolParameter(
+        name="rule_id",
+        type="string",
+        description="The ID of the rule to delete",
+    ),
+)
+
+_STORE_LOGIC_BLOCK_PARAMS = (
+    ToolParameter(
+        name="name",
+        type="string",
+        description="Name of the logic block (e.g., 'Abloom Status Mapping')",
+    ),
+    ToolParameter(
+        name="block_type",
+        type="string",
+        description="Type of logic block",
+        enum=("kit", "teammate", "rotation", "custom"),
+    ),
+    ToolParameter(
+        name="description",
+        type="string",
+        description="Description of what this logic block does",
+    ),
+    ToolParameter(
+        name="formula_pattern",
+        type="string",
+        description="The formula pattern for this logic block",
+    ),
+    ToolParameter(
+        name="variables",
+        type="object",
+        description="Dictionary of variable names to descriptions",
+        required=False,
+    ),
+    ToolParameter(
+        name="tags",
+        type="array",
+        description="Tags for categorizing the logic block",
+        required=False,
+    ),
+)
+
+_GET_LOGIC_BLOCKS_PARAMS = (
+    ToolParameter(
+        name="block_type",
+        type="string",
+        description="Filter by block type",
+        required=False,
+        enum=("kit", "teammate", "rotation", "custom"),
+    ),
+    ToolParameter(
+        name="tags",
+        type="array",
+        description="Filter by tags",
+        required=False,
+    ),
+)
+
+_SEARCH_LOGIC_BLOCKS_PARAMS = (
+    ToolParameter(
+        name="query",
+        type="string",
+        description="Search query",
+    ),
+)
+
 
 class MemoryTools:
     """Memory tools that can be registered with the agent."""
@@ -15,12 +137,16 @@ class MemoryTools:
 
     def register(self, registry: ToolRegistry):
         """Register all memory tools with the registry."""
-        registry.register(self._store_rule_tool())
-        registry.register(self._get_rules_tool())
-        registry.register(self._delete_rule_tool())
-        registry.register(self._store_logic_block_tool())
-        registry.register(self._get_logic_blocks_tool())
-        registry.register(self._search_logic_blocks_tool())
+        registry.register_many(
+            (
+                self._store_rule_tool(),
+                self._get_rules_tool(),
+                self._delete_rule_tool(),
+                self._store_logic_block_tool(),
+                self._get_logic_blocks_tool(),
+                self._search_logic_blocks_tool(),
+            )
+        )
 
     def _store_rule_tool(self) -> Tool:
         """Create the store_rule tool."""
@@ -54,41 +180,7 @@ class MemoryTools:
             description="Store a project-specific rule or convention. Rules help maintain "
             "consistency in formula writing, naming conventions, and structure. "
             "The agent will reference these rules when suggesting changes.",
-            parameters=[
-                ToolParameter(
-                    name="name",
-                    type="string",
-                    description="Short name for the rule",
-                ),
-                ToolParameter(
-                    name="description",
-                    type="string",
-                    description="Detailed description of what the rule enforces",
-                ),
-                ToolParameter(
-                    name="rule_type",
-                    type="string",
-                    description="Type of rule",
-                    enum=["formula_style", "naming", "structure", "custom"],
-                ),
-                ToolParameter(
-                    name="content",
-                    type="string",
-                    description="The actual rule content or pattern",
-                ),
-                ToolParameter(
-                    name="examples",
-                    type="array",
-                    description="Example formulas or patterns that follow this rule",
-                    required=False,
-                ),
-                ToolParameter(
-                    name="tags",
-                    type="array",
-                    description="Tags for categorizing the rule",
-                    required=False,
-                ),
-            ],
+            parameters=_STORE_RULE_PARAMS,
             handler=handler,
         )
 
@@ -120,21 +212,7 @@ class MemoryTools:
             name="memory.get_rules",
             description="Retrieve stored rules. Use this to understand project conventions "
             "before making suggestions or applying changes.",
-            parameters=[
-                ToolParameter(
-                    name="rule_type",
-                    type="string",
-                    description="Filter by rule type",
-                    required=False,
-                    enum=["formula_style", "naming", "structure", "custom"],
-                ),
-                ToolParameter(
-                    name="tags",
-                    type="array",
-                    description="Filter by tags",
-                    required=False,
-                ),
-            ],
+            parameters=_GET_RULES_PARAMS,
             handler=handler,
         )
 
@@ -151,13 +229,7 @@ class MemoryTools:
         return Tool(
             name="memory.delete_rule",
             description="Delete a stored rule by its ID.",
-            parameters=[
-                ToolParameter(
-                    name="rule_id",
-                    type="string",
-                    description="The ID of the rule to delete",
-                ),
-            ],
+            parameters=_DELETE_RULE_PARAMS,
             handler=handler,
         )
 
@@ -192,41 +264,7 @@ class MemoryTools:
             name="memory.store_logic_block",
             description="Store a known logic block pattern (character kit, teammate, rotation). "
             "This helps the agent recognize and update shared logic across sheets.",
-            parameters=[
-                ToolParameter(
-                    name="name",
-                    type="string",
-                    description="Name of the logic block (e.g., 'Abloom Status Mapping')",
-                ),
-                ToolParameter(
-                    name="block_type",
-                    type="string",
-                    description="Type of logic block",
-                    enum=["kit", "teammate", "rotation", "custom"],
-                ),
-                ToolParameter(
-                    name="description",
-                    type="string",
-                    description="Description of what this logic block does",
-                ),
-                ToolParameter(
-                    name="formula_pattern",
-                    type="string",
-                    description="The formula pattern for this logic block",
-                ),
-                ToolParameter(
-                    name="variables",
-                    type="object",
-                    description="Dictionary of variable names to descriptions",
-                    required=False,
-                ),
-                ToolParameter(
-                    name="tags",
-                    type="array",
-                    description="Tags for categorizing the logic block",
-                    required=False,
-                ),
-            ],
+            parameters=_STORE_LOGIC_BLOCK_PARAMS,
             handler=handler,
         )
 
@@ -258,21 +296,7 @@ class MemoryTools:
             name="memory.get_logic_blocks",
             description="Retrieve stored logic blocks. Use this to find known patterns "
             "for character kits, teammates, or rotations.",
-            parameters=[
-                ToolParameter(
-                    name="block_type",
-                    type="string",
-                    description="Filter by block type",
-                    required=False,
-                    enum=["kit", "teammate", "rotation", "custom"],
-                ),
-                ToolParameter(
-                    name="tags",
-                    type="array",
-                    description="Filter by tags",
-                    required=False,
-                ),
-            ],
+            parameters=_GET_LOGIC_BLOCKS_PARAMS,
             handler=handler,
         )
 
@@ -298,12 +322,6 @@ class MemoryTools:
         return Tool(
             name="memory.search_logic_blocks",
             description="Search for logic blocks by name, description, or formula pattern.",
-            parameters=[
-                ToolParameter(
-                    name="query",
-                    type="string",
-                    description="Search query",
-                ),
-            ],
+            parameters=_SEARCH_LOGIC_BLOCKS_PARAMS,
             handler=handler,
         )
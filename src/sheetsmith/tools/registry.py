@@ -1,29 +1,46 @@
 """Tool registry for managing available tools."""
 
-from typing import Any, Callable, Optional
-from pydantic import BaseModel, ConfigDict, Field
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Optional
 
 
-class ToolParameter(BaseModel):
-    """Definition of a tool parameter."""
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ToolParameter:
+    """Definition of a tool parameter.
+
+    Plain slotted dataclass rather than a Pydantic model: tool definitions are
+    static records written in code, so there is nothing to validate.
+    """
 
     name: str
     type: str
     description: str
     required: bool = True
     default: Any = None
-    enum: Optional[list[str]] = None
+    enum: Optional[tuple[str, ...]] = None
 
+    def __post_init__(self):
+        # Store enum values as a tuple so the parameter stays hashable and the
+        # choices cannot be edited after the registry cached its schema
+        if self.enum is not None and not isinstance(self.enum, tuple):
+            object.__setattr__(self, "enum", tuple(self.enum))
 
-class Tool(BaseModel):
-    """Definition of a tool that can be used by the agent."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Tool:
+    """Definition of a tool that can be used by the agent."""
 
     name: str
     description: str
-    parameters: list[ToolParameter] = Field(default_factory=list)
-    handler: Optional[Callable] = Field(default=None, exclude=True)
+    parameters: tuple[ToolParameter, ...] = ()
+    handler: Optional[Callable] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        # Tool builders pass lists; store a tuple so the definition (and the
+        # schema the registry caches from it) cannot change after creation
+        if not isinstance(self.parameters, tuple):
+            object.__setattr__(self, "parameters", tuple(self.parameters))
 
     def to_anthropic_schema(self) -> dict:
         """Convert to Anthropic tool schema format."""
@@ -33,7 +50,7 @@ class Tool(BaseModel):
         for param in self.parameters:
             prop = {"type": param.type, "description": param.description}
             if param.enum:
-                prop["enum"] = param.enum
+                prop["enum"] = list(param.enum)
             if param.default is not None:
                 prop["default"] = param.default
             properties[param.name] = prop
@@ -56,10 +73,28 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        # Anthropic schema of each registered tool, built once when registered
+        self._schemas: dict[str, dict] = {}
+        # to_anthropic_tools result, dropped whenever a tool is registered
+        self._anthropic_tools_cache: Optional[list[dict]] = None
+        # Names of tools whose handler is a coroutine function, decided once
+        # at registration instead of on every execute
+        self._async_tools: set[str] = set()
 
     def register(self, tool: Tool):
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._schemas[tool.name] = tool.to_anthropic_schema()
+        self._anthropic_tools_cache = None
+        if inspect.iscoroutinefunction(tool.handler):
+            self._async_tools.add(tool.name)
+        else:
+            self._async_tools.discard(tool.name)
+
+    def register_many(self, tools: Iterable[Tool]):
+        """Register several tools, e.g. every tool of one tool group."""
+        for tool in tools:
+            self.register(tool)
 
     def get(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
@@ -70,8 +105,16 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def to_anthropic_tools(self) -> list[dict]:
-        """Convert all tools to Anthropic format."""
-        return [tool.to_anthropic_schema() for tool in self._tools.values()]
+        """
+        Convert all tools to Anthropic format.
+
+        Schemas are built once per registered tool and shared between calls
+        (every LLM request sends them), so callers must not mutate them. The
+        list itself is a fresh copy that callers may append to or filter.
+        """
+        if self._anthropic_tools_cache is None:
+            self._anthropic_tools_cache = list(self._schemas.values())
+        return list(self._anthropic_tools_cache)
 
     async def execute(self, tool_name: str, **kwargs) -> Any:
         """Execute a tool by name."""
@@ -81,8 +124,6 @@ class ToolRegistry:
         if not tool.handler:
             raise ValueError(f"Tool {tool_name} has no handler")
 
-        import asyncio
-
-        if asyncio.iscoroutinefunction(tool.handler):
+        if tool_name in self._async_tools:
             return await tool.handler(**kwargs)
         return tool.handler(**kwargs)
@@ -1,11 +1,11 @@
 """Pytest configuration and shared fixtures."""
 
-import os
 from pathlib import Path
 from unittest.mock import Mock
 from typing import AsyncGenerator
 
 import pytest
+import pytest_asyncio
 
 from sheetsmith.config import Settings
 from sheetsmith.sheets import GoogleSheetsClient
@@ -14,7 +14,7 @@ from sheetsmith.llm import AnthropicClient
 
 
 @pytest.fixture
-def mock_settings(tmp_path: Path) -> Settings:
+def mock_settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Settings:
     """Create settings with test values."""
     # Create temporary files for credentials
     creds_file = tmp_path / "credentials.json"
@@ -24,13 +24,13 @@ def mock_settings(tmp_path: Path) -> Settings:
     creds_file.write_text('{"installed": {"client_id": "test"}}')
     token_file.write_text('{"token": "test"}')
 
-    # Override environment variables for this test
-    os.environ["GOOGLE_CREDENTIALS_PATH"] = str(creds_file)
-    os.environ["GOOGLE_TOKEN_PATH"] = str(token_file)
-    os.environ["DATABASE_PATH"] = str(db_file)
-    os.environ["ANTHROPIC_API_KEY"] = "test-key-123"
-    os.environ["LLM_PROVIDER"] = "anthropic"
-    os.environ["MODEL_NAME"] = "claude-sonnet-4-20250514"
+    # Override environment variables for this test only; monkeypatch restores them
+    monkeypatch.setenv("GOOGLE_CREDENTIALS_PATH", str(creds_file))
+    monkeypatch.setenv("GOOGLE_TOKEN_PATH", str(token_file))
+    monkeypatch.setenv("DATABASE_PATH", str(db_file))
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key-123")
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+    monkeypatch.setenv("MODEL_NAME", "claude-sonnet-4-20250514")
 
     # Create fresh Settings instance
     settings = Settings(
@@ -78,11 +78,11 @@ def mock_sheets_client() -> Mock:
     return client
 
 
-@pytest.fixture
-async def mock_memory_store(tmp_path: Path) -> AsyncGenerator[MemoryStore, None]:
+@pytest_asyncio.fixture
+async def mock_memory_store() -> AsyncGenerator[MemoryStore, None]:
     """Create an in-memory database for testing."""
-    db_path = tmp_path / "test_memory.db"
-    store = MemoryStore(str(db_path))
+    # One connection per store, so a private :memory: database is enough
+    store = MemoryStore(Path(":memory:"))
     await store.initialize()
     yield store
     await store.close()
@@ -3,14 +3,18 @@
 from unittest.mock import patch, Mock
 
 import pytest
-from fastapi.testclient import TestClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_client():
-    """Create a test client without lifespan (to avoid agent initialization)."""
+    """Create a test client without lifespan (to avoid agent initialization).
+
+    Module-scoped: the app holds no state between requests, so one app and
+    client serve every test here.
+    """
     # Create app without lifespan to avoid initializing the agent
     from fastapi import FastAPI
+    from fastapi.testclient import TestClient
     from sheetsmith.api.routes import router
 
     app = FastAPI()
@@ -2,14 +2,12 @@
 
 import pytest
 from unittest.mock import Mock, patch
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
-
-from sheetsmith.api.routes import router
 
 
 def test_placeholder_routes_registered():
     """Test that placeholder routes are properly registered."""
+    from sheetsmith.api.routes import router
+
     route_paths = [route.path for route in router.routes]
     
     # Check all placeholder endpoints are registered
@@ -19,18 +17,23 @@ def test_placeholder_routes_registered():
     assert "/placeholders/apply" in route_paths
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_agent():
-    """Create a mocked SheetSmith agent."""
+    """Create a mocked SheetSmith agent (shared; no test configures it)."""
     agent = Mock()
     agent.sheets_client = Mock()
     agent.memory_store = Mock()
     return agent
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(mock_agent):
-    """Create a test client for the API."""
+    """Create a test client for the API, shared by the tests in this module."""
+    # FastAPI and the routes are imported here so collecting this module stays cheap
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sheetsmith.api.routes import router
+
     app = FastAPI()
     app.include_router(router, prefix="/api")
     
@@ -1,6 +1,6 @@
 """Tests for API routes."""
 
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,6 +8,7 @@ from fastapi import FastAPI
 
 from sheetsmith.api.routes import (
     router,
+    get_agent,
     ChatRequest,
     ChatResponse,
 )
@@ -25,94 +26,83 @@ def mock_agent():
     return agent
 
 
-@pytest.fixture
-def test_client(mock_agent):
-    """Create a test client with mocked agent."""
+@pytest.fixture(scope="module")
+def app():
+    """Create the app once per module; tests only swap the agent it is served."""
     app = FastAPI()
     app.include_router(router, prefix="/api")
+    return app
+
+
+@pytest.fixture(scope="module")
+def test_client(app):
+    """Create a test client shared by the tests in this module."""
+    return TestClient(app)
 
-    # Mock the get_agent function to return our mock
-    with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-        yield TestClient(app)
+
+@pytest.fixture(autouse=True)
+def override_agent(app, mock_agent):
+    """Serve this test's mock agent wherever a route depends on the agent."""
+    app.dependency_overrides[get_agent] = lambda: mock_agent
+    yield
+    app.dependency_overrides.pop(get_agent, None)
 
 
 class TestChatEndpoint:
     """Test the /api/chat endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_chat_basic_functionality(self, test_client, mock_agent):
-        """Test basic chat functionality with mocked agent."""
-        with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-            response = test_client.post("/api/chat", json={"message": "Hello, SheetSmith!"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "response" in data
-        assert "conversation_length" in data
-        assert data["response"] == "Test response"
-        assert data["conversation_length"] == 1
-
-    @pytest.mark.asyncio
-    async def test_chat_with_spreadsheet_id(self, test_client, mock_agent):
-        """Test chat with spreadsheet ID adds context."""
-        with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-            response = test_client.post(
-                "/api/chat", json={"message": "Update cell A1", "spreadsheet_id": "test-sheet-123"}
-            )
+    @pytest.mark.parametrize(
+        "payload, expected_message",
+        [
+            ({"message": "Hello, SheetSmith!"}, "Hello, SheetSmith!"),
+            # Spreadsheet context is prepended to the message
+            (
+                {"message": "Update cell A1", "spreadsheet_id": "test-sheet-123"},
+                "[Working with spreadsheet: test-sheet-123]\n\nUpdate cell A1",
+            ),
+            # ...but not when the message already mentions the spreadsheet
+            (
+                {
+                    "message": "Update spreadsheet test-sheet-456",
+                    "spreadsheet_id": "test-sheet-456",
+                },
+                "Update spreadsheet test-sheet-456",
+            ),
+        ],
+        ids=["message-only", "adds-spreadsheet-context", "no-duplicate-context"],
+    )
+    def test_chat_passes_message_to_agent(
+        self, test_client, mock_agent, payload, expected_message
+    ):
+        """Test chat forwards the (contextualized) message and returns the agent reply."""
+        response = test_client.post("/api/chat", json=payload)
 
         assert response.status_code == 200
+        assert response.json() == {"response": "Test response", "conversation_length": 1}
+        mock_agent.process_message.assert_called_once_with(expected_message)
 
-        # Verify the agent was called with modified message including spreadsheet context
-        mock_agent.process_message.assert_called_once()
-        call_args = mock_agent.process_message.call_args[0][0]
-        assert "test-sheet-123" in call_args
-
-    @pytest.mark.asyncio
-    async def test_chat_handles_agent_error(self, test_client, mock_agent):
+    def test_chat_handles_agent_error(self, test_client, mock_agent):
         """Test that chat endpoint handles agent errors properly."""
         mock_agent.process_message = AsyncMock(side_effect=Exception("Agent error"))
 
-        with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-            response = test_client.post("/api/chat", json={"message": "Test message"})
+        response = test_client.post("/api/chat", json={"message": "Test message"})
 
         assert response.status_code == 500
         assert "Agent error" in response.json()["detail"]
 
-    @pytest.mark.asyncio
-    async def test_chat_request_validation(self, test_client):
+    def test_chat_request_validation(self, test_client):
         """Test that ChatRequest model validates input."""
         # Missing required field 'message'
         response = test_client.post("/api/chat", json={})
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
-    async def test_chat_does_not_duplicate_spreadsheet_context(self, test_client, mock_agent):
-        """Test that spreadsheet context is not added if already mentioned."""
-        with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-            response = test_client.post(
-                "/api/chat",
-                json={
-                    "message": "Update spreadsheet test-sheet-456",
-                    "spreadsheet_id": "test-sheet-456",
-                },
-            )
-
-        assert response.status_code == 200
-
-        # Message should not have duplicate context since it already mentions spreadsheet
-        mock_agent.process_message.assert_called_once()
-        call_args = mock_agent.process_message.call_args[0][0]
-        # Should be original message without added context
-        assert call_args == "Update spreadsheet test-sheet-456"
-
 
 class TestResetChatEndpoint:
     """Test the /api/chat/reset endpoint."""
 
     def test_reset_chat_success(self, test_client, mock_agent):
         """Test that reset chat endpoint works correctly."""
-        with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-            response = test_client.post("/api/chat/reset")
+        response = test_client.post("/api/chat/reset")
 
         assert response.status_code == 200
         data = response.json()
@@ -124,8 +114,7 @@ class TestResetChatEndpoint:
 
     def test_reset_chat_returns_correct_message(self, test_client, mock_agent):
         """Test that reset returns appropriate message."""
-        with patch("sheetsmith.api.routes.get_agent", return_value=mock_agent):
-            response = test_client.post("/api/chat/reset")
+        response = test_client.post("/api/chat/reset")
 
         assert response.status_code == 200
         data = response.json()
@@ -1,33 +1,83 @@
 """Integration tests for safety API endpoints."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock
 
 from sheetsmith.api.app import create_app
-from sheetsmith.ops.models import Operation, OperationType, SearchCriteria
+from sheetsmith.api.routes import get_ops_engine
+from sheetsmith.ops.models import (
+    ApplyResponse,
+    Operation,
+    OperationType,
+    PreviewResponse,
+    ScopeInfo,
+    SearchCriteria,
+)
 
+# Fixed timestamp for canned engine results; no test asserts on it
+FIXED_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def app():
-    """Create FastAPI app for testing."""
+    """Create FastAPI app for testing, shared by the tests in this module."""
     return create_app()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     """Create a test client for the FastAPI app."""
     return TestClient(app)
 
 
 @pytest.fixture
-def mock_ops_engine():
-    """Create a mocked ops engine."""
+def mock_ops_engine(app):
+    """Create a mocked ops engine and serve it to the app's ops routes."""
     engine = Mock()
     engine.generate_preview = Mock()
     engine.apply_changes = AsyncMock()
     engine.sheets_client = Mock()
-    return engine
+    app.dependency_overrides[get_ops_engine] = lambda: engine
+    yield engine
+    app.dependency_overrides.pop(get_ops_engine, None)
+
+
+@pytest.fixture(scope="module")
+def mock_preview_response() -> PreviewResponse:
+    """Canned empty preview returned by the mocked engine (read-only, so shared)."""
+    return PreviewResponse(
+        preview_id="test-preview-123",
+        spreadsheet_id="test-sheet-123",
+        operation_type=OperationType.REPLACE_IN_FORMULAS,
+        description="Test operation",
+        changes=[],
+        scope=ScopeInfo(
+            total_cells=0,
+            affected_sheets=[],
+            affected_headers=[],
+            sheet_count=0,
+            requires_approval=False,
+        ),
+        diff_text="",
+        created_at=FIXED_TIME,
+        expires_at=FIXED_TIME + timedelta(minutes=30),
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_apply_response() -> ApplyResponse:
+    """Canned successful apply result returned by the mocked engine."""
+    return ApplyResponse(
+        success=True,
+        preview_id="test-preview-123",
+        spreadsheet_id="test-sheet-123",
+        cells_updated=10,
+        errors=[],
+        applied_at=FIXED_TIME,
+    )
 
 
 class TestSafetyAPIEndpoints:
@@ -50,14 +100,8 @@ class TestSafetyAPIEndpoints:
         assert data["safety_limits"]["max_cells_per_operation"] > 0
         assert data["safety_limits"]["max_sheets_per_operation"] > 0
 
-    @patch("sheetsmith.api.routes.get_ops_engine")
-    def test_preflight_endpoint_basic(self, mock_get_engine, client):
+    def test_preflight_endpoint_basic(self, mock_ops_engine, client):
         """Test preflight endpoint with basic operation."""
-        # Setup mock
-        mock_engine = Mock()
-        mock_engine.sheets_client = Mock()
-        mock_get_engine.return_value = mock_engine
-        
         # Make request
         request_data = {
             "spreadsheet_id": "test-123",
@@ -82,14 +126,8 @@ class TestSafetyAPIEndpoints:
         assert "ambiguities" in data
         assert "estimated_scope" in data
 
-    @patch("sheetsmith.api.routes.get_ops_engine")
-    def test_audit_mappings_endpoint(self, mock_get_engine, client):
+    def test_audit_mappings_endpoint(self, mock_ops_engine, client):
         """Test audit mappings endpoint."""
-        # Setup mock
-        mock_engine = Mock()
-        mock_engine.sheets_client = Mock()
-        mock_get_engine.return_value = mock_engine
-        
         # Make request
         response = client.post(
             "/api/ops/audit/mappings",
@@ -122,33 +160,9 @@ class TestSafetyAPIEndpoints:
 class TestDryRunSupport:
     """Tests for dry-run functionality in API."""
 
-    @patch("sheetsmith.api.routes.get_ops_engine")
-    def test_preview_with_dry_run(self, mock_get_engine, client):
+    def test_preview_with_dry_run(self, mock_ops_engine, mock_preview_response, client):
         """Test preview endpoint with dry_run flag."""
-        from sheetsmith.ops.models import PreviewResponse, ScopeInfo
-        from datetime import datetime, timedelta, timezone
-        
-        # Setup mock
-        mock_engine = Mock()
-        mock_preview = PreviewResponse(
-            preview_id="test-preview-123",
-            spreadsheet_id="test-sheet-123",
-            operation_type=OperationType.REPLACE_IN_FORMULAS,
-            description="Test operation",
-            changes=[],
-            scope=ScopeInfo(
-                total_cells=0,
-                affected_sheets=[],
-                affected_headers=[],
-                sheet_count=0,
-                requires_approval=False,
-            ),
-            diff_text="",
-            created_at=datetime.now(timezone.utc),
-            expires_at=datetime.now(timezone.utc) + timedelta(minutes=30),
-        )
-        mock_engine.generate_preview.return_value = mock_preview
-        mock_get_engine.return_value = mock_engine
+        mock_ops_engine.generate_preview.return_value = mock_preview_response
         
         # Make request with dry_run
         request_data = {
@@ -170,24 +184,9 @@ class TestDryRunSupport:
         assert "dry_run" in data
         assert data["dry_run"] is True
 
-    @patch("sheetsmith.api.routes.get_ops_engine")
-    def test_apply_with_dry_run(self, mock_get_engine, client):
+    def test_apply_with_dry_run(self, mock_ops_engine, mock_apply_response, client):
         """Test apply endpoint with dry_run flag."""
-        from sheetsmith.ops.models import ApplyResponse
-        from datetime import datetime, timezone
-        
-        # Setup mock
-        mock_engine = Mock()
-        mock_result = ApplyResponse(
-            success=True,
-            preview_id="test-preview-123",
-            spreadsheet_id="test-sheet-123",
-            cells_updated=10,
-            errors=[],
-            applied_at=datetime.now(timezone.utc),
-        )
-        mock_engine.apply_changes = AsyncMock(return_value=mock_result)
-        mock_get_engine.return_value = mock_engine
+        mock_ops_engine.apply_changes.return_value = mock_apply_response
         
         # Make request with dry_run
         request_data = {
@@ -205,6 +204,6 @@ class TestDryRunSupport:
         assert data["dry_run"] is True
         
         # Verify dry_run was passed to engine
-        mock_engine.apply_changes.assert_called_once()
-        call_kwargs = mock_engine.apply_changes.call_args[1]
+        mock_ops_engine.apply_changes.assert_called_once()
+        call_kwargs = mock_ops_engine.apply_changes.call_args[1]
         assert call_kwargs.get("dry_run") is True
@@ -2,18 +2,43 @@
 
 from pathlib import Path
 
+import pytest
 
 from sheetsmith.config import Settings, _parse_cors_origins
 
 
+@pytest.fixture(scope="module")
+def default_settings() -> Settings:
+    """Settings built from field defaults, shared by the tests that only read them.
+
+    Field defaults are read from the environment once, when sheetsmith.config
+    is imported, so there is no environment to reset between tests.
+    """
+    return Settings()
+
+
 class TestParseCorsoOrigins:
     """Test CORS origins parsing."""
 
-    def test_parse_cors_origins_with_value(self, monkeypatch):
-        """Test parsing CORS origins from environment variable."""
-        monkeypatch.setenv("CORS_ALLOW_ORIGINS", "http://localhost:3000,http://localhost:8080")
-        result = _parse_cors_origins()
-        assert result == ["http://localhost:3000", "http://localhost:8080"]
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (
+                "http://localhost:3000,http://localhost:8080",
+                ["http://localhost:3000", "http://localhost:8080"],
+            ),
+            # Empty string splits to empty list, which defaults to ["*"]
+            ("", ["*"]),
+        ],
+    )
+    def test_parse_cors_origins_value(self, raw, expected):
+        """Test parsing an explicit CORS origins value."""
+        assert _parse_cors_origins(raw) == expected
+
+    def test_parse_cors_origins_from_environment(self, monkeypatch):
+        """Test the environment variable is read when no value is given."""
+        monkeypatch.setenv("CORS_ALLOW_ORIGINS", "http://localhost:3000")
+        assert _parse_cors_origins() == ["http://localhost:3000"]
 
     def test_parse_cors_origins_without_value(self, monkeypatch):
         """Test default CORS origins when not set."""
@@ -21,36 +46,13 @@ class TestParseCorsoOrigins:
         result = _parse_cors_origins()
         assert result == ["*"]
 
-    def test_parse_cors_origins_empty_string(self, monkeypatch):
-        """Test parsing empty CORS origins defaults to wildcard."""
-        monkeypatch.setenv("CORS_ALLOW_ORIGINS", "")
-        result = _parse_cors_origins()
-        # Empty string splits to empty list, which defaults to ["*"]
-        assert result == ["*"]
-
 
 class TestSettings:
     """Test Settings configuration."""
 
-    def test_settings_initialization_with_defaults(self, tmp_path, monkeypatch):
+    def test_settings_initialization_with_defaults(self, default_settings):
         """Test Settings initialization with default values."""
-        # Clear environment variables
-        for key in [
-            "GOOGLE_CREDENTIALS_PATH",
-            "GOOGLE_TOKEN_PATH",
-            "DATABASE_PATH",
-            "ANTHROPIC_API_KEY",
-            "OPENROUTER_API_KEY",
-            "LLM_PROVIDER",
-            "MODEL_NAME",
-            "HOST",
-            "PORT",
-            "DEBUG",
-            "MAX_TOKENS",
-        ]:
-            monkeypatch.delenv(key, raising=False)
-
-        settings = Settings()
+        settings = default_settings
 
         # Check default values
         assert settings.google_credentials_path == Path("credentials.json")
@@ -116,20 +118,11 @@ class TestSettings:
 
         assert settings.cors_allow_origins == ["http://localhost:3000", "http://example.com"]
 
-    def test_settings_debug_flag_variations(self, monkeypatch):
+    @pytest.mark.parametrize("flag", [True, False])
+    def test_settings_debug_flag_variations(self, flag):
         """Test debug flag with various boolean values."""
-        # Test True
-        settings = Settings(debug=True)
-        assert settings.debug is True
-
-        # Test False
-        settings = Settings(debug=False)
-        assert settings.debug is False
+        assert Settings(debug=flag).debug is flag
 
-    def test_settings_openrouter_model_default(self, monkeypatch):
+    def test_settings_openrouter_model_default(self, default_settings):
         """Test OpenRouter model has correct default."""
-        monkeypatch.delenv("OPENROUTER_MODEL", raising=False)
-
-        settings = Settings()
-
-        assert settings.openrouter_model == "anthropic/claude-3.5-sonnet"
+        assert default_settings.openrouter_model == "anthropic/claude-3.5-sonnet"
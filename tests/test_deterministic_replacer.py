@@ -7,7 +7,7 @@ from sheetsmith.engine.replace import (
     DeterministicReplacer,
     ReplacementPlan,
 )
-from sheetsmith.sheets.models import FormulaMatch
+from sheetsmith.sheets.models import CellData, FormulaMatch, SheetRange
 
 
 @pytest.fixture
@@ -168,6 +168,68 @@ class TestDeterministicReplacer:
         batch_call = mock_sheets_client.batch_update.call_args[0][0]
         assert batch_call.updates[0].new_formula == "=SUM(A1:A10) * 30.0%"
 
+    def test_replacement_pattern_compiled_once(self, replacer, monkeypatch):
+        """Test the search pattern is compiled once for all matched formulas."""
+        import re
+        from sheetsmith.engine import replace as replace_module
+
+        compiled = []
+        real_compile = re.compile
+        monkeypatch.setattr(
+            replace_module.re,
+            "compile",
+            lambda *args: compiled.append(args) or real_compile(*args),
+        )
+        matches = [
+            FormulaMatch(
+                spreadsheet_id="test-123",
+                sheet_name="Sheet1",
+                cell=f"A{row}",
+                row=row,
+                col=0,
+                formula=f"=VLOOKUP(B{row}, Data, 2)",
+                matched_text="vlookup",
+            )
+            for row in range(1, 4)
+        ]
+        plan = ReplacementPlan(
+            action="replace",
+            search_pattern="vlookup",
+            replace_with="XLOOKUP",
+            case_sensitive=False,
+        )
+
+        replacements = replacer._generate_replacements(matches, plan)
+
+        assert [r["new_formula"] for r in replacements] == [
+            "=XLOOKUP(B1, Data, 2)",
+            "=XLOOKUP(B2, Data, 2)",
+            "=XLOOKUP(B3, Data, 2)",
+        ]
+        assert len(compiled) == 1
+
+    def test_invalid_regex_produces_no_replacements(self, replacer):
+        """Test an invalid regex pattern yields no replacements."""
+        matches = [
+            FormulaMatch(
+                spreadsheet_id="test-123",
+                sheet_name="Sheet1",
+                cell="A1",
+                row=1,
+                col=0,
+                formula="=SUM(A1:A10)",
+                matched_text="SUM",
+            ),
+        ]
+        plan = ReplacementPlan(
+            action="replace",
+            search_pattern="SUM(",
+            replace_with="TOTAL(",
+            is_regex=True,
+        )
+
+        assert replacer._generate_replacements(matches, plan) == []
+
     def test_dry_run_mode(self, replacer, mock_sheets_client):
         """Test dry run mode (preview without applying)."""
         # Mock search results
@@ -284,6 +346,137 @@ class TestDeterministicReplacer:
         # Verify batch_update was NOT called
         mock_sheets_client.batch_update.assert_not_called()
 
+    def test_column_header_search_batches_reads(self, replacer, mock_sheets_client):
+        """Test a column-restricted search reads all sheets in two batched calls."""
+        mock_sheets_client.get_spreadsheet_info.return_value = {
+            "sheets": [
+                {"title": "Base", "row_count": 50, "col_count": 4},
+                {"title": "Other", "row_count": 20, "col_count": 2},
+            ]
+        }
+        header_rows = [
+            SheetRange(
+                spreadsheet_id="test-123",
+                sheet_name="Base",
+                range_notation="'Base'!A1:D1",
+                cells=[CellData(sheet_name="Base", cell="C1", row=1, col=2, value="Damage")],
+            ),
+            SheetRange(spreadsheet_id="test-123", sheet_name="Other", range_notation="'Other'!A1:B1"),
+        ]
+        column = SheetRange(
+            spreadsheet_id="test-123",
+            sheet_name="Base",
+            range_notation="'Base'!C2:C50",
+            cells=[
+                CellData(sheet_name="Base", cell="C2", row=2, col=2, formula="=A2*Kit!B1"),
+                CellData(sheet_name="Base", cell="C3", row=3, col=2, formula="=A3*2"),
+            ],
+        )
+        mock_sheets_client.batch_read_ranges.side_effect = [header_rows, [column]]
+
+        matches = replacer._search_formulas(
+            spreadsheet_id="test-123",
+            pattern="Kit!B1",
+            sheet_names=None,
+            case_sensitive=False,
+            is_regex=False,
+            column_header="damage",
+        )
+
+        assert [(m.sheet_name, m.cell) for m in matches] == [("Base", "C2")]
+        header_call, column_call = mock_sheets_client.batch_read_ranges.call_args_list
+        assert header_call.args[1] == ["'Base'!A1:D1", "'Other'!A1:B1"]
+        assert column_call.args[1] == ["'Base'!C2:C50"]
+        mock_sheets_client.read_range.assert_not_called()
+
+    def test_column_header_search_skips_only_unreadable_sheet(self, replacer, mock_sheets_client):
+        """Test a failed batch falls back to per-sheet reads and skips just the bad sheet."""
+        mock_sheets_client.get_spreadsheet_info.return_value = {
+            "sheets": [
+                {"title": "Gone", "row_count": 20, "col_count": 2},
+                {"title": "Base", "row_count": 50, "col_count": 4},
+            ]
+        }
+        base_headers = SheetRange(
+            spreadsheet_id="test-123",
+            sheet_name="Base",
+            range_notation="'Base'!A1:D1",
+            cells=[CellData(sheet_name="Base", cell="C1", row=1, col=2, value="Damage")],
+        )
+        column = SheetRange(
+            spreadsheet_id="test-123",
+            sheet_name="Base",
+            range_notation="'Base'!C2:C50",
+            cells=[CellData(sheet_name="Base", cell="C2", row=2, col=2, formula="=A2*Kit!B1")],
+        )
+        mock_sheets_client.batch_read_ranges.side_effect = [
+            RuntimeError("Unable to parse range: 'Gone'!A1:B1"),
+            [column],
+        ]
+        mock_sheets_client.read_range.side_effect = [RuntimeError("Gone"), base_headers]
+
+        matches = replacer._search_formulas(
+            spreadsheet_id="test-123",
+            pattern="Kit!B1",
+            sheet_names=None,
+            case_sensitive=False,
+            is_regex=False,
+            column_header="damage",
+        )
+
+        assert [(m.sheet_name, m.cell) for m in matches] == [("Base", "C2")]
+        assert [c.args[1] for c in mock_sheets_client.read_range.call_args_list] == [
+            "'Gone'!A1:B1",
+            "'Base'!A1:D1",
+        ]
+
+    def test_column_header_replacement_compiles_pattern_once(
+        self, replacer, mock_sheets_client, monkeypatch
+    ):
+        """Test the column search and the replacement share one compiled pattern."""
+        import re
+        from sheetsmith.engine import replace as replace_module
+
+        compiled = []
+        real_compile = re.compile
+        monkeypatch.setattr(
+            replace_module.re,
+            "compile",
+            lambda *args: compiled.append(args) or real_compile(*args),
+        )
+        mock_sheets_client.get_spreadsheet_info.return_value = {
+            "sheets": [{"title": "Base", "row_count": 50, "col_count": 4}]
+        }
+        header_rows = [
+            SheetRange(
+                spreadsheet_id="test-123",
+                sheet_name="Base",
+                range_notation="'Base'!A1:D1",
+                cells=[CellData(sheet_name="Base", cell="C1", row=1, col=2, value="Damage")],
+            )
+        ]
+        column = SheetRange(
+            spreadsheet_id="test-123",
+            sheet_name="Base",
+            range_notation="'Base'!C2:C50",
+            cells=[CellData(sheet_name="Base", cell="C2", row=2, col=2, formula="=A2*kit!B1")],
+        )
+        mock_sheets_client.batch_read_ranges.side_effect = [header_rows, [column]]
+
+        plan = ReplacementPlan(
+            action="replace",
+            search_pattern="Kit!B1",
+            replace_with="Kit!B2",
+            column_header="Damage",
+            dry_run=True,
+        )
+        result = replacer.execute_replacement("test-123", plan)
+
+        assert result.success
+        assert "+ =A2*Kit!B2" in result.preview
+        assert len(compiled) == 1
+
+
 
 class TestCanHandleDeterministically:
     """Tests for determining if a request can be handled deterministically."""
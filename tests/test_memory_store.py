@@ -0,0 +1,165 @@
+"""Tests for the memory store."""
+
+import pytest
+
+from sheetsmith.memory.models import LogicBlock, Rule
+
+
+@pytest.fixture
+def store(mock_memory_store):
+    """An initialized memory store backed by a private in-memory database."""
+    return mock_memory_store
+
+
+def _rule(rule_id: str, rule_type: str = "naming", tags=None) -> Rule:
+    return Rule(
+        id=rule_id,
+        name=rule_id,
+        description="Test rule",
+        rule_type=rule_type,
+        content="Use snake_case",
+        tags=tags or [],
+    )
+
+
+class TestListCaches:
+    """Test the cached get_rules/get_logic_blocks reads."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_rule_filter_served_from_cache(self, store):
+        """Test a repeated filter does not query the database again."""
+        await store.store_rule(_rule("r1", tags=["a", "b"]))
+
+        first = await store.get_rules("naming", ["b", "a"])
+        connection, store._connection = store._connection, None  # queries now fail
+        try:
+            second = await store.get_rules("naming", ["a", "b"])
+        finally:
+            store._connection = connection
+
+        assert [r.id for r in second] == ["r1"]
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_cached_models_are_not_shared(self, store):
+        """Test mutating a returned model does not change later cached reads."""
+        await store.store_rule(_rule("r1", tags=["a"]))
+        await store.store_logic_block(
+            LogicBlock(
+                id="b1",
+                name="Kit",
+                block_type="kit",
+                description="Test block",
+                formula_pattern="=A1*2",
+            )
+        )
+
+        rule = (await store.get_rules())[0]
+        rule.name = "changed"
+        rule.tags.append("b")
+        (await store.get_logic_blocks())[0].name = "changed"
+        (await store.search_logic_blocks("Kit"))[0].name = "changed"
+
+        rule = (await store.get_rules())[0]
+        assert (rule.name, rule.tags) == ("r1", ["a"])
+        assert (await store.get_logic_blocks())[0].name == "Kit"
+        assert (await store.search_logic_blocks("Kit"))[0].name == "Kit"
+
+    @pytest.mark.asyncio
+    async def test_rule_writes_invalidate_cache(self, store):
+        """Test storing and deleting rules refreshes cached results."""
+        await store.store_rule(_rule("r1"))
+        assert [r.id for r in await store.get_rules()] == ["r1"]
+
+        await store.store_rule(_rule("r2", rule_type="custom"))
+        assert sorted(r.id for r in await store.get_rules()) == ["r1", "r2"]
+
+        await store.delete_rule("r1")
+        assert [r.id for r in await store.get_rules()] == ["r2"]
+
+    @pytest.mark.asyncio
+    async def test_logic_block_writes_invalidate_cache(self, store):
+        """Test storing a logic block refreshes cached results."""
+        assert await store.get_logic_blocks("kit") == []
+
+        await store.store_logic_block(
+            LogicBlock(
+                id="b1",
+                name="Kit",
+                block_type="kit",
+                description="Test block",
+                formula_pattern="=A1*2",
+            )
+        )
+
+        assert [b.id for b in await store.get_logic_blocks("kit")] == ["b1"]
+
+    @pytest.mark.asyncio
+    async def test_search_cached_until_block_write(self, store):
+        """Test repeated searches are cached and refreshed after a write."""
+        assert await store.search_logic_blocks("Kit") == []
+        assert "Kit" in store._block_search_cache
+
+        await store.store_logic_block(
+            LogicBlock(
+                id="b1",
+                name="Fire Kit",
+                block_type="kit",
+                description="Test block",
+                formula_pattern="=A1*2",
+            )
+        )
+
+        assert [b.id for b in await store.search_logic_blocks("Kit")] == ["b1"]
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_oldest_filter(self, store, monkeypatch):
+        """Test the cache stays bounded by evicting its oldest entry."""
+        monkeypatch.setattr("sheetsmith.memory.store.LIST_CACHE_MAX_ENTRIES", 2)
+
+        for rule_type in ("naming", "custom", "structure"):
+            await store.get_rules(rule_type)
+
+        assert list(store._rules_cache) == [("custom", None), ("structure", None)]
+
+
+class TestTagFilters:
+    """Test tag filtering done in SQL."""
+
+    @pytest.mark.asyncio
+    async def test_rules_match_any_requested_tag(self, store):
+        """Test a rule matches when it carries any of the requested tags."""
+        await store.store_rule(_rule("r1", tags=["damage", "kit"]))
+        await store.store_rule(_rule("r2", tags=["naming"]))
+        await store.store_rule(_rule("r3", rule_type="custom", tags=["kit"]))
+        await store.store_rule(_rule("r4"))
+
+        assert sorted(r.id for r in await store.get_rules(tags=["kit", "naming"])) == [
+            "r1",
+            "r2",
+            "r3",
+        ]
+        assert [r.id for r in await store.get_rules("custom", ["kit"])] == ["r3"]
+        assert await store.get_rules(tags=["missing"]) == []
+
+    @pytest.mark.asyncio
+    async def test_logic_blocks_match_any_requested_tag(self, store):
+        """Test logic blocks are filtered by type and any matching tag."""
+        for block_id, block_type, tags in (
+            ("b1", "kit", ["fire"]),
+            ("b2", "kit", ["ice"]),
+            ("b3", "teammate", ["fire"]),
+        ):
+            await store.store_logic_block(
+                LogicBlock(
+                    id=block_id,
+                    name=block_id,
+                    block_type=block_type,
+                    description="Test block",
+                    formula_pattern="=A1",
+                    tags=tags,
+                )
+            )
+
+        assert [b.id for b in await store.get_logic_blocks("kit", ["fire", "fire"])] == ["b1"]
+        assert sorted(b.id for b in await store.get_logic_blocks(tags=["fire"])) == ["b1", "b3"]
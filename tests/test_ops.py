@@ -168,6 +168,282 @@ class TestSearchEngine:
         # Should only return 1 match
         assert result.total_count == 1
 
+    def test_search_attaches_header_and_row_label(self, mock_sheets_client):
+        """Matches carry the column header and the column A row label."""
+        from sheetsmith.ops.search import CellSearchEngine
+        
+        engine = CellSearchEngine(mock_sheets_client)
+        
+        criteria = SearchCriteria(formula_pattern="SUM")
+        result = engine.search("test-sheet-123", criteria)
+        
+        assert [(m.cell, m.header, m.row_label) for m in result.matches] == [
+            ("B2", "Amount", "Item1"),
+            ("B3", "Amount", "Item2"),
+        ]
+
+
+    def test_search_case_insensitive_literal_and_regex(self, mock_sheets_client):
+        """Literal and regex patterns honour case-insensitive matching."""
+        from sheetsmith.ops.search import CellSearchEngine
+        
+        engine = CellSearchEngine(mock_sheets_client)
+        
+        literal = engine.search("test-sheet-123", SearchCriteria(formula_pattern="sum(c"))
+        regex = engine.search(
+            "test-sheet-123", SearchCriteria(formula_pattern=r"sum\(c3", is_regex=True)
+        )
+        
+        assert literal.total_count == 2
+        assert [m.cell for m in regex.matches] == ["B3"]
+
+    def test_search_by_header_only_checks_target_column(self, mock_sheets_client):
+        """Header searches never run pattern checks on other columns or row 1."""
+        from sheetsmith.ops.search import CellSearchEngine
+        
+        engine = CellSearchEngine(mock_sheets_client)
+        checked = []
+        original = engine._candidate_cells
+        engine._candidate_cells = lambda *args: [
+            checked.append(cell.cell) or cell for cell in original(*args)
+        ]
+        
+        criteria = SearchCriteria(header_text="amount", formula_pattern="SUM")
+        result = engine.search("test-sheet-123", criteria)
+        
+        assert [m.cell for m in result.matches] == ["B2", "B3"]
+        assert checked == ["B2", "B3"]
+
+    def test_unknown_header_reads_only_header_row(self, mock_sheets_client):
+        """A header filter that matches no column skips reading the sheet body."""
+        from sheetsmith.ops.search import CellSearchEngine
+
+        engine = CellSearchEngine(mock_sheets_client)
+
+        result = engine.search("test-sheet-123", SearchCriteria(header_text="Missing"))
+
+        assert result.total_count == 0
+        mock_sheets_client.read_range.assert_called_once_with(
+            "test-sheet-123", "'Sheet1'!A1:Z1", include_formulas=False
+        )
+
+    def test_header_search_reads_up_to_matching_column(self, mock_sheets_client):
+        """Body reads of a header search stop at the last matching column."""
+        from sheetsmith.ops.search import CellSearchEngine
+
+        engine = CellSearchEngine(mock_sheets_client)
+
+        engine.search("test-sheet-123", SearchCriteria(header_text="Amount"))
+
+        ranges = [call.args[1] for call in mock_sheets_client.read_range.call_args_list]
+        assert ranges == ["'Sheet1'!A1:Z1", "'Sheet1'!A1:B100"]
+
+    def test_caseless_needle_skips_lowercasing(self):
+        """Needles without cased characters never force cell text to be lowered."""
+        from sheetsmith.ops.search import _CompiledCriteria
+        
+        numeric = _CompiledCriteria.compile(
+            SearchCriteria(formula_pattern="*1.5", value_pattern="100")
+        )
+        cased = _CompiledCriteria.compile(SearchCriteria(formula_pattern="Sum"))
+        sensitive = _CompiledCriteria.compile(
+            SearchCriteria(formula_pattern="SUM", case_sensitive=True)
+        )
+        
+        assert (numeric.fold_formula, numeric.fold_value) == (False, False)
+        assert cased.fold_formula is True
+        assert cased.formula_needle == "sum"
+        assert sensitive.fold_formula is False
+
+    def test_compiled_matcher_agrees_with_criteria(self):
+        """The specialized cell predicate applies formula and value patterns together."""
+        from sheetsmith.ops.search import _CompiledCriteria
+
+        cell = CellData(sheet_name="Sheet1", cell="B2", row=2, col=1, value=100, formula="=SUM(C2)")
+        blank = CellData(sheet_name="Sheet1", cell="C2", row=2, col=2, value=None)
+
+        both = _CompiledCriteria.compile(SearchCriteria(formula_pattern="sum", value_pattern="10"))
+        wrong_value = _CompiledCriteria.compile(
+            SearchCriteria(formula_pattern="SUM", value_pattern="^2", is_regex=True)
+        )
+        anything = _CompiledCriteria.compile(SearchCriteria(header_text="Amount"))
+
+        assert both.matches_cell(cell) is True
+        assert both.matches_cell(blank) is False
+        assert wrong_value.matches_cell(cell) is False
+        assert anything.matches_cell(blank) is True
+
+    def test_value_needle_skips_str_for_non_text_values(self):
+        """Numeric values are only stringified when the needle could occur in them."""
+        from sheetsmith.ops.search import _CompiledCriteria
+
+        class Value(float):
+            def __str__(self):
+                raise AssertionError("str() should be skipped")
+
+        number = CellData(sheet_name="Sheet1", cell="B2", row=2, col=1, value=150)
+        flag = CellData(sheet_name="Sheet1", cell="C2", row=2, col=2, value=True)
+        guarded = CellData(sheet_name="Sheet1", cell="D2", row=2, col=3, value=Value(1.5))
+
+        assert _CompiledCriteria.compile(SearchCriteria(value_pattern="15")).matches_cell(number)
+        assert _CompiledCriteria.compile(SearchCriteria(value_pattern="true")).matches_cell(flag)
+        assert not _CompiledCriteria.compile(SearchCriteria(value_pattern="Item")).matches_cell(
+            guarded
+        )
+
+    def test_search_invalid_regex_returns_no_matches(self, mock_sheets_client):
+        """An invalid regex is reported once and yields an empty result."""
+        from sheetsmith.ops.search import CellSearchEngine
+        
+        engine = CellSearchEngine(mock_sheets_client)
+        
+        criteria = SearchCriteria(formula_pattern="SUM(", is_regex=True)
+        result = engine.search("test-sheet-123", criteria)
+        
+        assert result.total_count == 0
+        assert result.searched_sheets == ["Sheet1"]
+
+    def test_search_reads_sheet_in_row_chunks(self, mock_sheets_client, monkeypatch):
+        """Sheets are read chunk by chunk; headers from row 1 carry over."""
+        from sheetsmith.ops.search import CellSearchEngine, settings
+
+        monkeypatch.setattr(settings, "search_read_chunk_rows", 40)
+
+        def chunk(row, value=None, formula=None):
+            return SheetRange(
+                spreadsheet_id="test-sheet-123",
+                sheet_name="Sheet1",
+                range_notation="",
+                cells=[
+                    CellData(sheet_name="Sheet1", cell=f"A{row}", row=row, col=0, value=f"Item{row}"),
+                    CellData(
+                        sheet_name="Sheet1", cell=f"B{row}", row=row, col=1,
+                        value=value, formula=formula,
+                    ),
+                ],
+            )
+
+        mock_sheets_client.read_range.side_effect = [
+            chunk(1, value="Amount"),
+            chunk(41, value=5, formula="=SUM(C41:D41)"),
+            chunk(81, value=7, formula="=SUM(C81:D81)"),
+        ]
+        engine = CellSearchEngine(mock_sheets_client)
+
+        result = engine.search("test-sheet-123", SearchCriteria(formula_pattern="SUM"))
+
+        ranges = [call.args[1] for call in mock_sheets_client.read_range.call_args_list]
+        assert ranges == ["'Sheet1'!A1:Z40", "'Sheet1'!A41:Z80", "'Sheet1'!A81:Z100"]
+        assert [(m.cell, m.header, m.row_label) for m in result.matches] == [
+            ("B41", "Amount", "Item41"),
+            ("B81", "Amount", "Item81"),
+        ]
+
+    def test_search_drops_sheet_when_later_chunk_fails(self, mock_sheets_client, monkeypatch):
+        """A failed chunk read drops the sheet instead of returning a truncated match set."""
+        from sheetsmith.ops.search import CellSearchEngine, settings
+
+        monkeypatch.setattr(settings, "search_read_chunk_rows", 50)
+        mock_sheets_client.read_range.side_effect = [
+            mock_sheets_client.read_range.return_value,
+            RuntimeError("quota exceeded"),
+        ]
+        engine = CellSearchEngine(mock_sheets_client)
+
+        result = engine.search("test-sheet-123", SearchCriteria(formula_pattern="SUM"))
+
+        assert mock_sheets_client.read_range.call_count == 2
+        assert result.matches == []
+
+    def test_search_stops_reading_once_limit_reached(self, mock_sheets_client, monkeypatch):
+        """No further chunks are fetched after the limit is hit."""
+        from sheetsmith.ops.search import CellSearchEngine, settings
+
+        monkeypatch.setattr(settings, "search_read_chunk_rows", 10)
+        engine = CellSearchEngine(mock_sheets_client)
+
+        result = engine.search("test-sheet-123", SearchCriteria(formula_pattern="SUM"), limit=1)
+
+        assert result.total_count == 1
+        assert mock_sheets_client.read_range.call_count == 1
+
+    def test_search_multiple_sheets_concurrently_in_sheet_order(
+        self, mock_sheets_client, monkeypatch
+    ):
+        """Sheets are searched in parallel but merged in sheet order up to the limit."""
+        from sheetsmith.ops.search import CellSearchEngine, settings
+
+        monkeypatch.setattr(settings, "search_parallel_min_limit", 1)
+        titles = ["Sheet1", "Sheet2", "Sheet3"]
+        mock_sheets_client.get_spreadsheet_info.return_value = {
+            "id": "test-sheet-123",
+            "title": "Test Sheet",
+            "sheets": [
+                {"title": t, "id": i, "row_count": 100, "col_count": 26}
+                for i, t in enumerate(titles)
+            ],
+        }
+        engine = CellSearchEngine(mock_sheets_client)
+
+        result = engine.search("test-sheet-123", SearchCriteria(formula_pattern="SUM"), limit=5)
+
+        assert result.total_count == 5
+        assert [m.sheet_name for m in result.matches] == [
+            "Sheet1", "Sheet1", "Sheet2", "Sheet2", "Sheet3",
+        ]
+
+        # The pool outlives the search, so its threads are reused next time
+        executor = engine._executor
+        assert executor is not None
+        engine.search("test-sheet-123", SearchCriteria(formula_pattern="SUM"), limit=5)
+        assert engine._executor is executor
+
+    def test_small_limit_searches_sheets_serially(self, mock_sheets_client):
+        """A limit met by the first sheet leaves the other sheets unread."""
+        from sheetsmith.ops.search import CellSearchEngine
+
+        mock_sheets_client.get_spreadsheet_info.return_value = {
+            "id": "test-sheet-123",
+            "title": "Test Sheet",
+            "sheets": [
+                {"title": t, "id": i, "row_count": 100, "col_count": 26}
+                for i, t in enumerate(["Sheet1", "Sheet2", "Sheet3"])
+            ],
+        }
+        engine = CellSearchEngine(mock_sheets_client)
+
+        result = engine.search("test-sheet-123", SearchCriteria(formula_pattern="SUM"), limit=2)
+
+        assert [m.sheet_name for m in result.matches] == ["Sheet1", "Sheet1"]
+        assert mock_sheets_client.read_range.call_count == 1
+        assert engine._executor is None
+
+
+class TestChangeSpec:
+    """Tests for the ChangeSpec data carrier."""
+
+    def test_change_spec_is_slotted_and_frozen(self):
+        """ChangeSpec should not carry a per-instance __dict__ and be immutable."""
+        change = ChangeSpec(sheet_name="Sheet1", cell="B2", old_value=1, new_value=2)
+
+        assert not hasattr(change, "__dict__")
+        with pytest.raises(AttributeError):
+            change.new_value = 3
+
+    def test_change_spec_validated_inside_operation(self):
+        """Pydantic still builds ChangeSpec instances from raw request data."""
+        operation = Operation.model_validate(
+            {
+                "operation_type": "set_value_by_header",
+                "description": "Set values",
+                "changes": [{"sheet_name": "Sheet1", "cell": "B2", "new_value": 5}],
+            }
+        )
+
+        assert isinstance(operation.changes[0], ChangeSpec)
+        assert operation.changes[0].cell == "B2"
+        assert operation.model_dump()["changes"][0]["new_value"] == 5
+
 
 class TestPreviewCache:
     """Tests for PreviewCache."""
@@ -340,3 +616,47 @@ class TestPreviewGenerator:
         assert preview.scope.total_cells == 2
         assert preview.scope.sheet_count == 1
         assert "Sheet1" in preview.scope.affected_sheets
+
+    def test_preview_changes_are_streamed(self, mock_sheets_client):
+        """Preview builders yield changes lazily instead of returning lists."""
+        import types
+        from sheetsmith.ops.preview import PreviewGenerator
+        from sheetsmith.ops.search import CellSearchEngine
+
+        generator = PreviewGenerator(mock_sheets_client, CellSearchEngine(mock_sheets_client))
+        operation = Operation(
+            operation_type=OperationType.REPLACE_IN_FORMULAS,
+            description="Test operation",
+            find_pattern="SUM",
+            replace_with="SUMIF",
+        )
+
+        changes = generator._preview_replace_in_formulas("test-sheet-123", operation)
+
+        assert isinstance(changes, types.GeneratorType)
+        assert [c.cell for c in changes] == ["B2", "B3"]
+
+    def test_accumulator_aggregates_in_one_pass(self, monkeypatch):
+        """The accumulator tracks scope, row ranges and a bounded diff text."""
+        from sheetsmith.config import settings
+        from sheetsmith.ops.preview import _PreviewAccumulator
+
+        monkeypatch.setattr(settings, "max_preview_diffs_displayed", 2, raising=False)
+        formatted = []
+        accumulator = _PreviewAccumulator(lambda c: formatted.append(c.cell) or [c.cell])
+
+        for cell in ["B5", "B2", "B9"]:
+            accumulator.add(ChangeSpec(sheet_name="Sheet1", cell=cell, header="Amount"))
+        accumulator.add(ChangeSpec(sheet_name="Sheet2", cell="C3"))
+
+        summary = accumulator.scope_summary(
+            Operation(operation_type=OperationType.REPLACE_IN_FORMULAS, description="x")
+        )
+        assert summary.total_cells == 4
+        assert summary.sheet_names == ["Sheet1", "Sheet2"]
+        assert summary.headers_affected == ["Amount"]
+        assert summary.row_range_by_sheet == {"Sheet1": (2, 9), "Sheet2": (3, 3)}
+
+        # Only the displayed changes are formatted
+        assert formatted == ["B5", "B2"]
+        assert accumulator.diff_text().endswith("... and 2 more changes (showing first 2)")
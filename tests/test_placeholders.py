@@ -3,7 +3,9 @@
 import pytest
 import pytest_asyncio
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+from pydantic import ValidationError
 
 from sheetsmith.placeholders import (
     PlaceholderParser,
@@ -14,9 +16,11 @@ from sheetsmith.placeholders import (
     ResolutionContext,
 )
 from sheetsmith.placeholders.syntax import (
+    HeaderIndex,
     normalize_name,
     fuzzy_match_score,
     is_valid_placeholder_name,
+    rank_header_matches,
 )
 from sheetsmith.mapping import (
     MappingManager,
@@ -46,6 +50,40 @@ class TestPlaceholderSyntax:
         # No match
         assert fuzzy_match_score("foo", "bar") < 0.5
 
+    def test_rank_header_matches(self):
+        """Test batch ranking scores like fuzzy_match_score, best first."""
+        headers = ["Base Damage", "Damage", "Crit Chance", "Damage Bonus"]
+
+        ranked = rank_header_matches("damage", headers)
+
+        assert [h for h, _ in ranked] == ["Damage", "Base Damage", "Damage Bonus"]
+        assert all(score == fuzzy_match_score("damage", h) for h, score in ranked)
+
+    def test_rank_header_matches_with_header_index(self):
+        """Test a prebuilt HeaderIndex ranks like the plain header list."""
+        headers = ["Base Damage", "Damage", "Crit Chance", "Damage Bonus", "Base Damage"]
+        index = HeaderIndex(headers)
+
+        assert len(index) == 4
+        for name in ["damage", "crit", "base_dmg"]:
+            assert rank_header_matches(name, index) == rank_header_matches(name, headers)
+
+    def test_rank_header_matches_keeps_sheet_order_for_ties(self):
+        """Test equally scored headers stay in sheet order."""
+        headers = ["Damage Total", "Base Damage", "Damage Bonus"]
+
+        ranked = rank_header_matches("damage", headers)
+
+        assert [h for h, _ in ranked] == headers
+
+    def test_rank_header_matches_length_filter_is_lossless(self):
+        """Test the length filter only drops headers that score below the threshold."""
+        headers = ["hp", "dmg", "spd", "atk", "base dmg", "dmg per second", "damage multiplier"]
+
+        for name in ["dmg", "base_dmg", "hp", "damage"]:
+            expected = {h for h in headers if fuzzy_match_score(name, h) > 0.5}
+            assert {h for h, _ in rank_header_matches(name, headers)} == expected
+
     def test_is_valid_placeholder_name(self):
         """Test placeholder name validation."""
         # Valid names
@@ -111,6 +149,82 @@ class TestPlaceholderParser:
         assert placeholders[0].name == "burn_bonus"
         assert placeholders[0].sheet == "KitData"
 
+    def test_extract_mixed_placeholders_positions(self):
+        """Test one scan classifies every placeholder type with its span."""
+        parser = PlaceholderParser()
+        formula = "=Kit!{{bonus}} + {{atk:Jane}} * {{atk}} - ${rate}"
+
+        placeholders = parser.extract_placeholders(formula)
+
+        assert [p.type for p in placeholders] == [
+            PlaceholderType.CROSS_SHEET,
+            PlaceholderType.INTERSECTION,
+            PlaceholderType.HEADER,
+            PlaceholderType.VARIABLE,
+        ]
+        assert placeholders[0].sheet == "Kit"
+        assert placeholders[3].name == "rate"
+        for p in placeholders:
+            assert formula[p.start_pos : p.end_pos] == p.syntax
+
+    def test_extract_skips_invalid_cross_sheet_name(self):
+        """Test a cross-sheet placeholder with a row label is rejected."""
+        parser = PlaceholderParser()
+
+        assert parser.extract_placeholders("='Kit'!{{bonus:Jane}}") == []
+
+    def test_extract_scans_formula_once(self, monkeypatch):
+        """Test all placeholder types come from a single tokenizer pass."""
+        from sheetsmith.placeholders import parser as parser_module
+
+        scans = []
+        pattern = parser_module.PLACEHOLDER_TOKEN_PATTERN
+
+        class _CountingPattern:
+            def finditer(self, formula):
+                scans.append(formula)
+                return pattern.finditer(formula)
+
+        monkeypatch.setattr(parser_module, "PLACEHOLDER_TOKEN_PATTERN", _CountingPattern())
+        formula = "='Kit'!{{single_pass}} + {{atk:Jane}} * {{atk}} - ${single_rate}"
+
+        placeholders = PlaceholderParser().extract_placeholders(formula)
+
+        assert scans == [formula]
+        assert [p.type for p in placeholders] == [
+            PlaceholderType.CROSS_SHEET,
+            PlaceholderType.INTERSECTION,
+            PlaceholderType.HEADER,
+            PlaceholderType.VARIABLE,
+        ]
+
+    def test_extract_without_delimiters_skips_regex(self, monkeypatch):
+        """Test formulas without placeholder delimiters never reach the regex."""
+        from sheetsmith.placeholders import parser as parser_module
+
+        class _Boom:
+            def finditer(self, formula):
+                raise AssertionError("regex scan should be skipped")
+
+        monkeypatch.setattr(parser_module, "PLACEHOLDER_TOKEN_PATTERN", _Boom())
+        parser = PlaceholderParser()
+
+        assert parser.extract_placeholders("=SUM(A1:B2) + {A} + $B$1") == []
+
+    def test_extract_is_memoized_per_formula(self):
+        """Test repeated extraction of one formula reuses the parsed placeholders."""
+        parser = PlaceholderParser()
+        formula = "={{memo_header}} * ${memo_rate}"
+
+        first = parser.extract_placeholders(formula)
+        second = PlaceholderParser().extract_placeholders(formula)
+
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        with pytest.raises(ValidationError):
+            first[0].name = "changed"
+
     def test_validate_syntax_valid(self):
         """Test validating valid placeholder syntax."""
         parser = PlaceholderParser()
@@ -127,6 +241,24 @@ class TestPlaceholderParser:
         assert result.valid is False
         assert any("Mismatched" in error for error in result.errors)
 
+    def test_validate_syntax_empty_placeholder(self):
+        """Test empty placeholders are rejected without unbalancing brackets."""
+        parser = PlaceholderParser()
+
+        for formula in ("={{ }} * 2", "={{}} * 2", "={{{  }} * 2"):
+            result = parser.validate_syntax(formula)
+
+            assert result.valid is False
+            assert "Empty placeholders are not allowed" in result.errors
+            assert not any("Mismatched" in error for error in result.errors)
+
+    def test_validate_syntax_bracket_counts(self):
+        """Test bracket tallies match non-overlapping occurrence counts."""
+        parser = PlaceholderParser()
+        result = parser.validate_syntax("={{{{a}} + }}}}}")
+
+        assert "Mismatched placeholder brackets: 2 opening, 3 closing" in result.errors
+
     def test_validate_syntax_no_equals(self):
         """Test validating formula without equals sign."""
         parser = PlaceholderParser()
@@ -223,6 +355,11 @@ async def mock_sheets_client():
         )
 
     client.read_range = Mock(side_effect=mock_read_range)
+    client.batch_read_ranges = Mock(
+        side_effect=lambda spreadsheet_id, ranges, include_formulas=True: [
+            mock_read_range(spreadsheet_id, r, include_formulas) for r in ranges
+        ]
+    )
 
     return client
 
@@ -311,6 +448,141 @@ class TestPlaceholderResolver:
         assert resolved.resolved == "=F2 * G2"
         assert len(resolved.mappings) == 2
 
+    @pytest.mark.asyncio
+    async def test_resolve_all_repeated_placeholder(self, placeholder_resolver):
+        """Test every occurrence of a repeated placeholder is substituted."""
+        context = ResolutionContext(
+            current_sheet="Base",
+            current_row=3,
+            spreadsheet_id="test-sheet-123",
+            absolute_references=False,
+        )
+
+        manager = placeholder_resolver.mapping_manager
+        with patch.object(
+            manager, "get_column_by_header", wraps=manager.get_column_by_header
+        ) as get_column:
+            resolved = await placeholder_resolver.resolve_all(
+                formula="={{Base Damage}} + {{Multiplier}} * {{Base Damage}}",
+                spreadsheet_id="test-sheet-123",
+                context=context,
+            )
+
+        assert resolved.resolved == "=F3 + G3 * F3"
+        assert len(resolved.mappings) == 3
+        # The repeated placeholder is resolved once
+        assert get_column.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resolve_all_without_placeholders_skips_parser(self, placeholder_resolver):
+        """Test formulas without placeholder delimiters never reach the parser."""
+        context = ResolutionContext(
+            current_sheet="Base", current_row=2, spreadsheet_id="test-sheet-123"
+        )
+
+        with patch.object(placeholder_resolver.parser, "extract_placeholders") as extract:
+            resolved = await placeholder_resolver.resolve_all(
+                formula="=SUM(A1:A9)", spreadsheet_id="test-sheet-123", context=context
+            )
+
+        extract.assert_not_called()
+        assert resolved.resolved == "=SUM(A1:A9)"
+        assert resolved.warnings == ["No placeholders found in formula"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_revalidates_mapping_on_every_call(self, placeholder_resolver):
+        """Test mappings are not reused across calls, so the manager validates each one."""
+        context = ResolutionContext(
+            current_sheet="Base",
+            current_row=2,
+            spreadsheet_id="test-sheet-123",
+            absolute_references=False,
+        )
+        formula = "={{Base Damage}} * 2"
+        manager = placeholder_resolver.mapping_manager
+
+        with patch.object(
+            manager, "get_column_by_header", wraps=manager.get_column_by_header
+        ) as get_column:
+            for row in (2, 3):
+                context.current_row = row
+                resolved = await placeholder_resolver.resolve_all(
+                    formula=formula, spreadsheet_id="test-sheet-123", context=context
+                )
+
+        assert resolved.resolved == "=F3 * 2"
+        assert get_column.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_resolve_all_fetches_each_header_name_once(
+        self, placeholder_resolver, mapping_storage
+    ):
+        """Test placeholders naming the same header share one mapping fetch and mapping."""
+        context = ResolutionContext(
+            current_sheet="Base",
+            current_row=3,
+            spreadsheet_id="test-sheet-123",
+            absolute_references=False,
+        )
+        manager = placeholder_resolver.mapping_manager
+
+        with patch.object(
+            manager, "get_column_by_header", wraps=manager.get_column_by_header
+        ) as get_column:
+            resolved = await placeholder_resolver.resolve_all(
+                formula="={{Base Damage}} - 'Base'!{{Base Damage}}",
+                spreadsheet_id="test-sheet-123",
+                context=context,
+            )
+
+        assert resolved.resolved == "=F3 - 'Base'!$F$2"
+        assert get_column.call_count == 1
+        assert len(await mapping_storage.get_all_column_mappings("test-sheet-123")) == 1
+
+    @pytest.mark.parametrize(
+        "formula",
+        [
+            "={{base_damage}}",
+            "={{Base Damage}} * {{base_damage}}",
+            "={{base_damage}} * {{Base Damage}}",
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_resolve_all_validates_each_header_spelling(self, placeholder_resolver, formula):
+        """Test a header spelling is validated on its own, wherever it appears."""
+        from sheetsmith.mapping import HeaderNotFoundError
+
+        context = ResolutionContext(
+            current_sheet="Base",
+            current_row=2,
+            spreadsheet_id="test-sheet-123",
+            absolute_references=False,
+        )
+
+        with pytest.raises(HeaderNotFoundError):
+            await placeholder_resolver.resolve_all(
+                formula=formula, spreadsheet_id="test-sheet-123", context=context
+            )
+
+    @pytest.mark.asyncio
+    async def test_resolve_all_keeps_unresolved_placeholder(self, placeholder_resolver):
+        """Test placeholders that cannot be resolved are left in place."""
+        context = ResolutionContext(
+            current_sheet="Base",
+            current_row=2,
+            spreadsheet_id="test-sheet-123",
+            absolute_references=False,
+        )
+
+        resolved = await placeholder_resolver.resolve_all(
+            formula="={{Base Damage}} * ${rate} + {{Multiplier}}",
+            spreadsheet_id="test-sheet-123",
+            context=context,
+        )
+
+        assert resolved.resolved == "=F2 * ${rate} + G2"
+        assert len(resolved.warnings) == 1
+
     @pytest.mark.asyncio
     async def test_resolve_with_absolute_references(self, placeholder_resolver):
         """Test resolving with absolute references."""
@@ -348,6 +620,49 @@ class TestPlaceholderResolver:
         assert "{{Multiplier}}" in preview.potential_mappings
         assert "Base Damage" in preview.potential_mappings["{{Base Damage}}"]
 
+    @pytest.mark.asyncio
+    async def test_preview_mappings_scores_each_header_once(self, placeholder_resolver):
+        """Test ranking a placeholder scores every header exactly once."""
+        from sheetsmith.placeholders import syntax
+
+        headers = placeholder_resolver._get_sheet_headers("test-sheet-123", "Base")
+
+        with patch.object(
+            syntax, "_normalized_match_score", wraps=syntax._normalized_match_score
+        ) as scorer:
+            preview = await placeholder_resolver.preview_mappings(
+                formula="={{Damage}}", spreadsheet_id="test-sheet-123", sheet_name="Base"
+            )
+
+        assert scorer.call_count == len(headers)
+        assert preview.potential_mappings["{{Damage}}"][0] == "Base Damage"
+
+    @pytest.mark.asyncio
+    async def test_preview_mappings_caches_sheet_headers(
+        self, placeholder_resolver, mock_sheets_client
+    ):
+        """Test headers are read once per sheet (row 1 only) until invalidated."""
+        formula = "={{Base Damage}} * {{Multiplier}} + 'Stats'!{{Level}}"
+        mock_sheets_client.read_range.reset_mock()
+
+        for _ in range(2):
+            await placeholder_resolver.preview_mappings(
+                formula=formula, spreadsheet_id="test-sheet-123", sheet_name="Base"
+            )
+
+        # One batched read covering every referenced sheet, no per-placeholder reads
+        mock_sheets_client.batch_read_ranges.assert_called_once_with(
+            "test-sheet-123", ["'Base'!1:1", "'Stats'!1:1"], include_formulas=False
+        )
+        mock_sheets_client.read_range.assert_not_called()
+
+        placeholder_resolver.invalidate_headers("test-sheet-123", "Stats")
+        await placeholder_resolver.preview_mappings(
+            formula=formula, spreadsheet_id="test-sheet-123", sheet_name="Base"
+        )
+
+        assert mock_sheets_client.batch_read_ranges.call_args.args[1] == ["'Stats'!1:1"]
+
 
 class TestPlaceholderAssistant:
     """Test placeholder assistant."""
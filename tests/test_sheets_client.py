@@ -0,0 +1,408 @@
+"""Tests for sheets client helpers."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from sheetsmith.sheets.client import (
+    GoogleSheetsClient,
+    cell_row_number,
+    col_letter_to_index,
+    index_to_col_letter,
+    literal_prefilter,
+    parse_cell_notation,
+    parse_range_start,
+)
+
+
+class TestCellRowNumber:
+    """Test row extraction from A1 notation."""
+
+    def test_simple_cells(self):
+        """Row digits are extracted from A1 notation."""
+        assert cell_row_number("A1") == 1
+        assert cell_row_number("B12") == 12
+        assert cell_row_number("AA1000") == 1000
+
+    def test_no_digits_returns_none(self):
+        """Column-only references have no row number."""
+        assert cell_row_number("B") is None
+        assert cell_row_number("") is None
+
+    def test_non_ascii_characters_ignored(self):
+        """Non-ASCII characters are dropped rather than raising."""
+        assert cell_row_number("Ä5") == 5
+
+
+class TestParseRangeStart:
+    """Test parsing the start of A1 ranges."""
+
+    def test_cell_start(self):
+        """A regular cell start gives its column and row."""
+        assert parse_range_start("B12") == ("B", 12)
+
+    def test_whole_row_and_column_starts(self):
+        """Whole-row and whole-column starts default to column A / row 1."""
+        assert parse_range_start("3") == ("A", 3)
+        assert parse_range_start("c") == ("C", 1)
+
+
+class TestBatchReadRanges:
+    """Test batched range reads."""
+
+    def _client(self, value_ranges, formula_ranges):
+        client = GoogleSheetsClient()
+        batch_get = Mock()
+        batch_get.side_effect = lambda **kwargs: Mock(
+            execute=Mock(
+                return_value={
+                    "valueRanges": (
+                        formula_ranges
+                        if kwargs.get("valueRenderOption") == "FORMULA"
+                        else value_ranges
+                    )
+                }
+            )
+        )
+        service = Mock()
+        service.spreadsheets.return_value.values.return_value.batchGet = batch_get
+        client._local.service = service
+        return client, batch_get
+
+    def test_reads_all_ranges_in_two_requests(self):
+        """Values and formulas of every range come from one batchGet each."""
+        client, batch_get = self._client(
+            value_ranges=[
+                {"range": "Base!A1:B1", "values": [["Name", "Damage"]]},
+                {"range": "Stats!A2:B2", "values": [["Hero", "20"]]},
+            ],
+            formula_ranges=[
+                {"range": "Base!A1:B1", "values": [["Name", "Damage"]]},
+                {"range": "Stats!A2:B2", "values": [["Hero", "=B1*2"]]},
+            ],
+        )
+
+        base, stats = client.batch_read_ranges("sheet-1", ["Base!1:1", "'Stats'!A2:B2"])
+
+        assert batch_get.call_count == 2
+        assert [c.cell for c in base.cells] == ["A1", "B1"]
+        assert base.formulas == []
+        assert stats.sheet_name == "Stats"
+        assert [(c.cell, c.formula) for c in stats.formulas] == [("B2", "=B1*2")]
+
+    def test_empty_range_has_no_cells(self):
+        """A range without values yields an empty SheetRange."""
+        client, _ = self._client(
+            value_ranges=[{"range": "'Empty Sheet'!1:1"}],
+            formula_ranges=[{"range": "'Empty Sheet'!1:1"}],
+        )
+
+        (empty,) = client.batch_read_ranges("sheet-1", ["'Empty Sheet'!1:1"])
+
+        assert empty.sheet_name == "Empty Sheet"
+        assert empty.cells == []
+
+    def test_sheet_name_shared_across_reads(self):
+        """Cells from separate reads of one sheet share an interned name."""
+        ranges = [{"range": "Base!A1:A1", "values": [["x"]]}]
+        client, _ = self._client(value_ranges=ranges, formula_ranges=ranges)
+
+        (first,) = client.batch_read_ranges("sheet-1", ["".join(["Base", "!A1:A1"])])
+        (second,) = client.batch_read_ranges("sheet-1", ["".join(["'Base'", "!A1:A1"])])
+
+        assert first.cells[0].sheet_name is second.cells[0].sheet_name
+
+    def test_empty_range_list_makes_no_request(self):
+        """No ranges means no API call."""
+        client, batch_get = self._client([], [])
+
+        assert client.batch_read_ranges("sheet-1", []) == []
+        batch_get.assert_not_called()
+
+
+class TestA1Helpers:
+    """Test the memoized A1 notation helpers."""
+
+    def test_column_round_trip(self):
+        """Column letters and indexes convert both ways."""
+        for index in (0, 25, 26, 701, 702):
+            assert col_letter_to_index(index_to_col_letter(index)) == index
+
+    def test_parse_cell_notation(self):
+        """Cells split into upper-cased letters and row; trailing text is ignored."""
+        assert parse_cell_notation("ab12") == ("AB", 12)
+        assert parse_cell_notation("C3:D4") == ("C", 3)
+
+    @pytest.mark.parametrize("cell", ["", "A", "$A$1", "1A"])
+    def test_parse_cell_notation_rejects_invalid(self, cell):
+        """Cells without leading letters and a row number are rejected."""
+        with pytest.raises(ValueError):
+            parse_cell_notation(cell)
+
+    def test_invalid_cell_raises_every_time(self):
+        """Errors are not memoized away."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_cell_notation("12")
+
+
+class TestReadRangeGridData:
+    """Test reading values and formulas with a single grid request."""
+
+    def test_values_and_formulas_from_one_request(self):
+        """The grid path builds cells without calling the values API."""
+        client = GoogleSheetsClient()
+        service = Mock()
+        service.spreadsheets.return_value.get.return_value.execute.return_value = {
+            "sheets": [
+                {
+                    "data": [
+                        {
+                            "startRow": 1,
+                            "startColumn": 1,
+                            "rowData": [
+                                {
+                                    "values": [
+                                        {
+                                            "formattedValue": "10",
+                                            "userEnteredValue": {"numberValue": 10},
+                                        },
+                                        {
+                                            "formattedValue": "20",
+                                            "userEnteredValue": {"formulaValue": "=B2*2"},
+                                        },
+                                        {},
+                                    ]
+                                },
+                                {},
+                            ],
+                        }
+                    ]
+                }
+            ]
+        }
+        client._local.service = service
+
+        result = client.read_range("sheet-1", "'Base'!B2:D3")
+
+        service.spreadsheets.return_value.values.assert_not_called()
+        assert result.sheet_name == "Base"
+        assert [(c.cell, c.value) for c in result.cells] == [("B2", "10"), ("C2", "20")]
+        assert [(c.cell, c.formula) for c in result.formulas] == [("C2", "=B2*2")]
+
+    def test_cell_filter_skips_rejected_cells(self):
+        """Only cells accepted by the filter are built."""
+        client = GoogleSheetsClient()
+        service = Mock()
+        values_api = service.spreadsheets.return_value.values.return_value
+        values_api.get.return_value.execute.return_value = {
+            "range": "Base!A1:B2",
+            "values": [["Name", "Level"], ["Hero", "3"]],
+        }
+        client._local.service = service
+        seen = []
+
+        def keep_row_two(row, col, value, formula):
+            seen.append((row, col, value, formula))
+            return row == 2
+
+        result = client.read_range(
+            "sheet-1", "Base!A1:B2", include_formulas=False, cell_filter=keep_row_two
+        )
+
+        assert [(c.cell, c.value) for c in result.cells] == [("A2", "Hero"), ("B2", "3")]
+        assert seen[0] == (1, 0, "Name", None)
+
+    def test_falls_back_to_values_api(self):
+        """An unreadable grid response falls back to the values API."""
+        client = GoogleSheetsClient()
+        service = Mock()
+        service.spreadsheets.return_value.get.return_value.execute.return_value = {}
+        values_api = service.spreadsheets.return_value.values.return_value
+        values_api.get.return_value.execute.return_value = {
+            "range": "Base!A1:A1",
+            "values": [["x"]],
+        }
+        client._local.service = service
+
+        result = client.read_range("sheet-1", "Base!A1:A1")
+
+        assert [(c.cell, c.value) for c in result.cells] == [("A1", "x")]
+
+
+class TestLiteralPrefilter:
+    """Test the substring prefilter for formula searches."""
+
+    def test_regex_patterns_have_no_prefilter(self):
+        """Patterns using regex syntax always go through the regex."""
+        assert literal_prefilter(r"VLOOKUP\(", case_sensitive=False) is None
+        assert literal_prefilter("A.B", case_sensitive=True) is None
+
+    def test_case_insensitive_literal(self):
+        """Literal patterns are matched ignoring ASCII case."""
+        might_match = literal_prefilter("Kit!X1", case_sensitive=False)
+
+        assert might_match("=A1+KIT!x1")
+        assert not might_match("=SUM(A1:A9)")
+
+    def test_non_ascii_formulas_pass_through(self):
+        """Non-ASCII formulas are left for the regex to decide."""
+        might_match = literal_prefilter("st", case_sensitive=False)
+
+        assert might_match("=ſt")
+
+    def test_case_sensitive_literal(self):
+        """Case-sensitive literals need an exact substring."""
+        might_match = literal_prefilter("Kit", case_sensitive=True)
+
+        assert might_match("=Kit!A1")
+        assert not might_match("=KIT!A1")
+
+
+class TestSearchFormulas:
+    """Test formula search over batched sheet reads."""
+
+    def test_matches_formula_cells_only(self):
+        """Only formula cells are matched, with A1 positions from the range start."""
+        client = GoogleSheetsClient()
+        client.get_spreadsheet_info = Mock(
+            return_value={"sheets": [{"title": "Base", "row_count": 10, "col_count": 3}]}
+        )
+        service = Mock()
+        values_api = service.spreadsheets.return_value.values.return_value
+        values_api.batchGet.return_value.execute.return_value = {
+            "valueRanges": [
+                {
+                    "range": "Base!A1:C10",
+                    "values": [["Kit!X1", "=Kit!X1*2"], [], ["", 5, "=SUM(kit!x1)"]],
+                }
+            ]
+        }
+        client._local.service = service
+
+        matches = client.search_formulas("sheet-1", "Kit!X1")
+
+        assert [(m.cell, m.row, m.col, m.matched_text) for m in matches] == [
+            ("B1", 1, 1, "Kit!X1"),
+            ("C3", 3, 2, "kit!x1"),
+        ]
+
+    def test_failed_batch_skips_only_unreadable_sheets(self):
+        """A bad range falls back to per-sheet reads; empty grids are never requested."""
+        client = GoogleSheetsClient()
+        client.get_spreadsheet_info = Mock(
+            return_value={
+                "sheets": [
+                    {"title": "Base", "row_count": 2, "col_count": 1},
+                    {"title": "Gone", "row_count": 2, "col_count": 1},
+                    {"title": "Blank", "row_count": 5, "col_count": 0},
+                ]
+            }
+        )
+
+        def batch_get(spreadsheetId, ranges, valueRenderOption):
+            if any(r.startswith("'Gone'") for r in ranges):
+                return Mock(execute=Mock(side_effect=RuntimeError("Unable to parse range")))
+            return Mock(
+                execute=Mock(
+                    return_value={"valueRanges": [{"range": "Base!A1:A2", "values": [["=Kit!X1"]]}]}
+                )
+            )
+
+        service = Mock()
+        service.spreadsheets.return_value.values.return_value.batchGet.side_effect = batch_get
+        client._local.service = service
+
+        matches = client.search_formulas("sheet-1", "Kit!X1")
+
+        assert [(m.sheet_name, m.cell) for m in matches] == [("Base", "A1")]
+        requested = [
+            c.kwargs["ranges"]
+            for c in service.spreadsheets.return_value.values.return_value.batchGet.call_args_list
+        ]
+        assert requested == [["'Base'!A1:A2", "'Gone'!A1:A2"], ["'Base'!A1:A2"], ["'Gone'!A1:A2"]]
+
+
+class TestSpreadsheetInfoCache:
+    """Test caching of spreadsheet metadata."""
+
+    def _client(self):
+        client = GoogleSheetsClient()
+        service = Mock()
+        service.spreadsheets.return_value.get.return_value.execute.return_value = {
+            "spreadsheetId": "sheet-1",
+            "properties": {"title": "Game"},
+            "sheets": [
+                {
+                    "properties": {
+                        "sheetId": 0,
+                        "title": "Base",
+                        "gridProperties": {"rowCount": 10, "columnCount": 3},
+                    }
+                }
+            ],
+        }
+        values_api = service.spreadsheets.return_value.values.return_value
+        values_api.batchUpdate.return_value.execute.return_value = {}
+        client._local.service = service
+        return client, service.spreadsheets.return_value.get
+
+    def test_info_is_fetched_once(self):
+        """Repeated lookups reuse the cached info."""
+        client, get = self._client()
+
+        first = client.get_spreadsheet_info("sheet-1")
+        second = client.get_spreadsheet_info("sheet-1")
+
+        assert first == second
+        assert first["sheets"][0]["title"] == "Base"
+        get.assert_called_once()
+
+    def test_info_copies_do_not_share_cache(self):
+        """Mutating returned info doesn't change what later lookups see."""
+        client, get = self._client()
+
+        first = client.get_spreadsheet_info("sheet-1")
+        first["sheets"].clear()
+        first["title"] = "Changed"
+        second = client.get_spreadsheet_info("sheet-1")
+
+        assert second["title"] == "Game"
+        assert [sheet["title"] for sheet in second["sheets"]] == ["Base"]
+        get.assert_called_once()
+
+    def test_batch_update_invalidates_info(self):
+        """Writing to a spreadsheet refetches its info on the next lookup."""
+        client, get = self._client()
+        client.get_spreadsheet_info("sheet-1")
+
+        client.update_cell("sheet-1", "Base", "A1", value="x")
+        client.get_spreadsheet_info("sheet-1")
+
+        assert get.call_count == 2
+
+    def test_expired_info_is_dropped(self, monkeypatch):
+        """A stale entry is removed on lookup rather than left behind."""
+        from sheetsmith.sheets import client as client_module
+
+        client, get = self._client()
+        client.get_spreadsheet_info("sheet-1")
+
+        monkeypatch.setattr(client_module, "SPREADSHEET_INFO_TTL_SECONDS", 0)
+        get.return_value.execute.side_effect = RuntimeError("offline")
+        with pytest.raises(RuntimeError):
+            client.get_spreadsheet_info("sheet-1")
+
+        assert client._info_cache == {}
+
+    def test_info_cache_is_bounded(self, monkeypatch):
+        """The oldest spreadsheet's info is evicted once the cache is full."""
+        from sheetsmith.sheets import client as client_module
+
+        monkeypatch.setattr(client_module, "SPREADSHEET_INFO_MAX_ENTRIES", 2)
+        client, get = self._client()
+
+        for spreadsheet_id in ("sheet-1", "sheet-2", "sheet-3"):
+            client.get_spreadsheet_info(spreadsheet_id)
+
+        assert list(client._info_cache) == ["sheet-2", "sheet-3"]
@@ -1,7 +1,16 @@
 """Tests for sheets models."""
 
+import pytest
+from pydantic import ValidationError
 
-from sheetsmith.sheets.models import BatchUpdate, CellUpdate
+from sheetsmith.sheets.models import (
+    BatchUpdate,
+    CellData,
+    CellUpdate,
+    Patch,
+    PatchChange,
+    SheetRange,
+)
 
 
 class TestBatchUpdate:
@@ -39,6 +48,28 @@ class TestBatchUpdate:
         assert batch.updates[0].new_value == "Test"
         assert batch.updates[1].new_formula == "=SUM(A1:A10)"
 
+    def test_add_updates(self):
+        """Test adding many updates at once validates them like add_update."""
+        batch = BatchUpdate(spreadsheet_id="test-123")
+        batch.add_update(sheet_name="Sheet1", cell="A1", new_value="Test")
+
+        batch.add_updates(
+            {"sheet_name": "Sheet1", "cell": f"B{row}", "new_formula": f"=A{row}*2"}
+            for row in (1, 2)
+        )
+
+        assert [u.cell for u in batch.updates] == ["A1", "B1", "B2"]
+        assert all(isinstance(u, CellUpdate) for u in batch.updates)
+        assert batch.updates[2].new_formula == "=A2*2"
+
+    def test_add_updates_rejects_invalid_fields(self):
+        """Test bulk-added updates are still validated."""
+        batch = BatchUpdate(spreadsheet_id="test-123")
+
+        with pytest.raises(ValidationError):
+            batch.add_updates([{"sheet_name": "Sheet1"}])
+        assert batch.updates == []
+
     def test_get_statistics_empty_batch(self):
         """Test get_statistics with empty batch."""
         batch = BatchUpdate(spreadsheet_id="test-123")
@@ -152,6 +183,15 @@ class TestBatchUpdate:
         assert stats["sheet_count"] == 2
         assert stats["column_count"] == 3
 
+    def test_get_statistics_with_absolute_references(self):
+        """Test column extraction ignores $ markers in absolute references."""
+        batch = BatchUpdate(spreadsheet_id="test-123")
+
+        batch.add_update(sheet_name="Sheet1", cell="$B$2", new_value="x")
+        batch.add_update(sheet_name="Sheet1", cell="B3", new_value="y")
+
+        assert batch.get_statistics()["affected_columns"] == ["B"]
+
     def test_get_statistics_duplicate_cells_counted_separately(self):
         """Test that duplicate cell references are counted separately."""
         batch = BatchUpdate(spreadsheet_id="test-123")
@@ -192,3 +232,100 @@ class TestCellUpdate:
         )
 
         assert update.range_notation == "Data!B5"
+
+
+class TestSheetRange:
+    """Test the SheetRange model."""
+
+    def test_formulas_match_has_formula(self):
+        """Test formulas returns exactly the cells whose has_formula is true."""
+        cells = [
+            CellData(sheet_name="S", cell=f"A{i}", row=i, col=0, value=i, formula=formula)
+            for i, formula in enumerate([None, "", "=A1", "A1", "=SUM(B1:B2)"], start=1)
+        ]
+        sheet_range = SheetRange(
+            spreadsheet_id="test-123", sheet_name="S", range_notation="S!A1:A5", cells=cells
+        )
+
+        assert [c.cell for c in sheet_range.formulas] == ["A3", "A5"]
+        assert [c.cell for c in cells if c.has_formula] == ["A3", "A5"]
+
+    def test_formulas_reflects_in_place_cell_edits(self):
+        """Test formulas follows edits to cells made after a previous access."""
+        sheet_range = SheetRange(
+            spreadsheet_id="test-123",
+            sheet_name="S",
+            range_notation="S!A1:A2",
+            cells=[CellData(sheet_name="S", cell="A1", row=1, col=0, formula="=1")],
+        )
+
+        assert [c.cell for c in sheet_range.formulas] == ["A1"]
+
+        sheet_range.cells[0] = CellData(sheet_name="S", cell="A1", row=1, col=0, value=1)
+        assert sheet_range.formulas == []
+
+        sheet_range.cells.append(CellData(sheet_name="S", cell="A2", row=2, col=0, formula="=2"))
+        assert [c.cell for c in sheet_range.formulas] == ["A2"]
+
+
+class TestPatch:
+    """Test the Patch model."""
+
+    def test_to_diff_string(self):
+        """Test the diff lists each change as a block separated by blank lines."""
+        patch = Patch(
+            id="p1",
+            spreadsheet_id="test-123",
+            description="Bump rate",
+            created_at="2024-01-01T00:00:00",
+            changes=[
+                {"sheet": "Base", "cell": "A1", "old": "=B1*0.2", "new": "=B1*0.3"},
+                {"sheet": "Kit", "cell": "C2", "old": "=1", "new": "=2"},
+            ],
+        )
+
+        assert patch.to_diff_string() == (
+            "Patch: Bump rate\n"
+            "Spreadsheet: test-123\n"
+            "\n"
+            "--- Base!A1\n"
+            "-  =B1*0.2\n"
+            "+  =B1*0.3\n"
+            "\n"
+            "--- Kit!C2\n"
+            "-  =1\n"
+            "+  =2\n"
+        )
+
+    def test_to_diff_string_without_changes(self):
+        """Test a patch with no changes renders only its header."""
+        patch = Patch(
+            id="p1", spreadsheet_id="test-123", description="Empty", created_at="2024-01-01"
+        )
+
+        assert patch.to_diff_string() == "Patch: Empty\nSpreadsheet: test-123\n"
+
+    def test_changes_validated_from_dicts(self):
+        """Test change dicts are turned into PatchChange records."""
+        patch = Patch(
+            id="p1",
+            spreadsheet_id="test-123",
+            description="Bump rate",
+            created_at="2024-01-01",
+            changes=[{"sheet": "Base", "cell": "A1", "old": "=1", "new": "=2"}],
+        )
+
+        assert patch.changes == [PatchChange(sheet="Base", cell="A1", old="=1", new="=2")]
+
+    def test_changes_accept_constant_values(self):
+        """Test non-string constants in change dicts are kept as their text."""
+        patch = Patch(
+            id="p1",
+            spreadsheet_id="test-123",
+            description="Bump level",
+            created_at="2024-01-01",
+            changes=[{"sheet": "S", "cell": "A1", "old": 5, "new": 6.5}],
+        )
+
+        assert patch.changes == [PatchChange(sheet="S", cell="A1", old="5", new="6.5")]
+        assert "-  5\n+  6.5\n" in patch.to_diff_string()
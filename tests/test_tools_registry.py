@@ -47,7 +47,16 @@ class TestToolParameter:
             enum=["read", "write", "delete"],
         )
 
-        assert param.enum == ["read", "write", "delete"]
+        # Enum values are frozen into a tuple, keeping the parameter hashable
+        assert param.enum == ("read", "write", "delete")
+        assert hash(param) == hash(
+            ToolParameter(
+                name="action",
+                type="string",
+                description="Action to perform",
+                enum=("read", "write", "delete"),
+            )
+        )
 
 
 class TestTool:
@@ -62,7 +71,7 @@ class TestTool:
 
         assert tool.name == "test_tool"
         assert tool.description == "A test tool"
-        assert tool.parameters == []
+        assert tool.parameters == ()
         assert tool.handler is None
 
     def test_tool_with_parameters(self):
@@ -82,6 +91,14 @@ class TestTool:
         assert tool.parameters[0].name == "arg1"
         assert tool.parameters[1].name == "arg2"
 
+    def test_tool_parameters_stored_as_tuple(self):
+        """Test a parameter list is frozen into a tuple."""
+        param = ToolParameter(name="arg1", type="string", description="First argument")
+
+        tool = Tool(name="test_tool", description="A test tool", parameters=[param])
+
+        assert tool.parameters == (param,)
+
     def test_tool_with_handler(self):
         """Test creating a tool with a handler function."""
 
@@ -207,6 +224,24 @@ class TestToolRegistry:
         assert registry.get("tool1") == tool1
         assert registry.get("tool2") == tool2
 
+    @pytest.mark.asyncio
+    async def test_register_many(self):
+        """Test registering a group of tools in one call."""
+        registry = ToolRegistry()
+
+        async def handler():
+            return "async"
+
+        registry.register_many(
+            (
+                Tool(name="tool1", description="First tool"),
+                Tool(name="tool2", description="Second tool", handler=handler),
+            )
+        )
+
+        assert [t["name"] for t in registry.to_anthropic_tools()] == ["tool1", "tool2"]
+        assert await registry.execute("tool2") == "async"
+
     def test_get_tool_by_name(self):
         """Test retrieving a tool by name."""
         registry = ToolRegistry()
@@ -307,6 +342,20 @@ class TestToolRegistry:
         with pytest.raises(ValueError, match="has no handler"):
             await registry.execute("no_handler")
 
+    @pytest.mark.asyncio
+    async def test_reregistering_switches_sync_and_async_handlers(self):
+        """Test a re-registered tool is dispatched by its new handler's kind."""
+
+        async def async_handler():
+            return "async"
+
+        registry = ToolRegistry()
+        registry.register(Tool(name="tool", description="Async", handler=async_handler))
+        assert await registry.execute("tool") == "async"
+
+        registry.register(Tool(name="tool", description="Sync", handler=lambda: "sync"))
+        assert await registry.execute("tool") == "sync"
+
     def test_registry_overwrites_duplicate_names(self):
         """Test that registering a tool with same name overwrites."""
         registry = ToolRegistry()
@@ -318,3 +367,148 @@ class TestToolRegistry:
 
         assert len(registry.list_tools()) == 1
         assert registry.get("tool").description == "Second"
+
+    def test_anthropic_tools_cached_per_tool(self):
+        """Test schemas are reused between calls and only rebuilt for a re-registered tool."""
+        registry = ToolRegistry()
+        registry.register(Tool(name="tool1", description="First"))
+        registry.register(Tool(name="tool2", description="Second"))
+
+        first = registry.to_anthropic_tools()
+        second = registry.to_anthropic_tools()
+        assert second == first
+        assert all(a is b for a, b in zip(second, first))
+
+        registry.register(Tool(name="tool2", description="Replaced"))
+        schemas = registry.to_anthropic_tools()
+        assert schemas[0] is first[0]
+        assert [t["description"] for t in schemas] == ["First", "Replaced"]
+
+    def test_anthropic_tools_list_is_a_copy(self):
+        """Test mutating the returned list does not affect later calls."""
+        registry = ToolRegistry()
+        registry.register(Tool(name="tool1", description="First"))
+        registry.register(Tool(name="tool2", description="Second"))
+
+        tools = registry.to_anthropic_tools()
+        tools.append({"name": "extra"})
+        tools.pop(0)
+
+        assert [t["name"] for t in registry.to_anthropic_tools()] == ["tool1", "tool2"]
+
+
+class TestLazyToolClients:
+    """Test that tool classes defer building their Sheets client."""
+
+    def test_registering_tools_does_not_build_client(self):
+        """Test registering tools leaves the client unconstructed."""
+        from sheetsmith.tools import FormulaTools, GSheetsTools
+
+        registry = ToolRegistry()
+        formula_tools = FormulaTools()
+        gsheets_tools = GSheetsTools()
+        formula_tools.register(registry)
+        gsheets_tools.register(registry)
+
+        assert formula_tools._client is None
+        assert formula_tools._replacer is None
+        assert gsheets_tools._client is None
+        assert registry.get("formula.mass_replace") is not None
+
+    def test_injected_client_is_shared_with_replacer(self):
+        """Test the replacer is built lazily around the given client."""
+        from unittest.mock import Mock
+
+        from sheetsmith.tools import FormulaTools
+
+        client = Mock()
+        tools = FormulaTools(client)
+
+        assert tools.client is client
+        assert tools.replacer.sheets_client is client
+        assert tools.replacer is tools.replacer
+
+    def test_package_exports_load_on_demand(self):
+        """Test importing the registry from the package skips the Sheets tools."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from sheetsmith.tools import ToolRegistry\n"
+            "assert 'sheetsmith.tools.gsheets' not in sys.modules\n"
+            "from sheetsmith.tools import GSheetsTools\n"
+            "assert GSheetsTools.__module__ == 'sheetsmith.tools.gsheets'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestMassReplaceSafetyStatus:
+    """Test the safety status reported by formula.mass_replace."""
+
+    @pytest.mark.asyncio
+    async def test_failed_replacement_skips_validation(self):
+        """Test a replacement that failed before matching reports a clean status."""
+        from unittest.mock import Mock
+
+        from sheetsmith.engine import ReplacementResult
+        from sheetsmith.tools import FormulaTools
+
+        tools = FormulaTools(Mock())
+        tools._replacer = Mock()
+        tools._replacer.execute_replacement.return_value = ReplacementResult(
+            success=False, matches_found=0, cells_updated=0, affected_sheets=[], error="boom"
+        )
+        tools._validator = Mock()
+        registry = ToolRegistry()
+        tools.register(registry)
+
+        result = await registry.execute(
+            "formula.mass_replace",
+            spreadsheet_id="test-123",
+            search_pattern="A",
+            replace_with="B",
+        )
+
+        assert result["safety_status"] == {
+            "is_safe": True,
+            "violations": [],
+            "requires_preview": False,
+        }
+        assert result["message"] == "Error: boom"
+        tools._validator.validate_operation.assert_not_called()
+
+
+class TestBatchUpdateTool:
+    """Test the gsheets.batch_update tool."""
+
+    @pytest.mark.asyncio
+    async def test_updates_validated_into_one_batch(self):
+        """Test the update dicts are validated into a single BatchUpdate."""
+        from unittest.mock import Mock
+
+        from sheetsmith.sheets.models import UpdateResult
+        from sheetsmith.tools import GSheetsTools
+
+        client = Mock()
+        client.batch_update.return_value = UpdateResult(
+            success=True, spreadsheet_id="test-123", updated_cells=2
+        )
+        registry = ToolRegistry()
+        GSheetsTools(client).register(registry)
+
+        result = await registry.execute(
+            "gsheets.batch_update",
+            spreadsheet_id="test-123",
+            updates=[
+                {"sheet_name": "Base", "cell": "A1", "new_formula": "=1"},
+                {"sheet_name": "Kit", "cell": "B2", "new_value": "x"},
+            ],
+        )
+
+        (batch,) = client.batch_update.call_args.args
+        assert [(u.range_notation, u.new_value, u.new_formula) for u in batch.updates] == [
+            ("Base!A1", None, "=1"),
+            ("Kit!B2", "x", None),
+        ]
+        assert result["statistics"]["affected_sheets"] == ["Base", "Kit"]